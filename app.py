@@ -2,19 +2,27 @@
 Role Matrix - Resume Screening Application
 """
 import streamlit as st
-import pandas as pd
-import json
-import os
+import time
 from pathlib import Path
-import tempfile
-from datetime import datetime
 
-# Import utility modules
-from utils.file_loader import extract_text_from_file
-from utils.skill_extractor import extract_skills
-from utils.jd_parser import parse_job_description
-from utils.scoring import calculate_confidence_score
-from utils.role_matcher import get_role_suggestions_for_candidate
+# Import utility modules. pandas and utils.multi_jd (numpy) are imported where
+# they are used so the first page renders without loading them.
+from utils.candidate_profile import CandidateProfile, SkillVocabulary
+from utils.data_artifact import load_screening_data
+from utils.skill_extractor import CompiledLexicon
+from utils.pipeline import (
+    extract_resume, summarize_extraction, build_profile, metrics_file_type,
+    DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+)
+from utils.session_cache import ScreeningSession
+from utils.scoring import INTERVIEW_THRESHOLD, MAYBE_THRESHOLD
+from utils.parallel import screen_resumes_parallel, default_worker_count
+from utils.extraction_cache import ExtractionCache
+from utils.file_loader import EXTRACTOR_CHOICES, DEFAULT_EXTRACTOR
+from utils.extraction_sandbox import ExtractionSandbox, DEFAULT_TIMEOUT, DEFAULT_MAX_MEMORY_MB
+from utils.role_matcher import RoleIndex
+from utils.profile_store import open_profile_store
+from utils import jd_cache, metrics
 
 
 # Set page config
@@ -27,107 +35,590 @@ st.set_page_config(
 # Constants
 DATA_DIR = Path(__file__).parent / "data"
 OUTPUT_DIR = Path(__file__).parent / "outputs" / "profiles"
+CACHE_PATH = Path(__file__).parent / "outputs" / "cache" / "extraction.sqlite3"
+ARTIFACT_PATH = Path(__file__).parent / "outputs" / "cache" / "screening_data.bin"
+JD_CACHE_PATH = Path(__file__).parent / "outputs" / "cache" / "jd_cache.sqlite3"
 
-# Ensure output directory exists
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+# Profile storage: "sqlite" (batched, indexed) or "json" (one file per profile in OUTPUT_DIR)
+PROFILE_BACKEND = "sqlite"
+PROFILE_DB_PATH = Path(__file__).parent / "outputs" / "profiles.sqlite3"
 
+# Per-file parsing budgets; files exceeding them are reported as failed
+EXTRACTION_TIMEOUT = DEFAULT_TIMEOUT
+EXTRACTION_MAX_MEMORY_MB = DEFAULT_MAX_MEMORY_MB
 
-@st.cache_data
-def load_skills_lexicon():
-    """Load skills lexicon from JSON file."""
-    lexicon_path = DATA_DIR / "skills_lexicon.json"
+# Role fit for every candidate: weights of required and preferred role skills
+ROLE_FIT_REQUIRED_WEIGHT = 1.0
+ROLE_FIT_PREFERRED_WEIGHT = 0.5
+ROLE_FIT_TOP = 3
+
+# Results view: rows per page choices (the second is the default)
+RESULTS_PAGE_SIZES = [25, 50, 100, 250]
+
+# Uploads whose text is at least this similar to an earlier one in the batch are linked to it
+DEDUP_THRESHOLD = 0.8
+
+
+@st.cache_resource
+def load_screening_artifact():
+    """Load the lexicon, role library and their prebuilt indexes once per server process."""
     try:
-        with open(lexicon_path, 'r') as f:
-            data = json.load(f)
-            return data.get("skills", [])
+        return load_screening_data(
+            DATA_DIR / "skills_lexicon.json",
+            DATA_DIR / "role_library.json",
+            ARTIFACT_PATH
+        )
     except Exception as e:
-        st.error(f"Error loading skills lexicon: {e}")
-        return []
+        st.error(f"Error loading skills lexicon or role library: {e}")
+        return None
+
+
+def load_skills_lexicon():
+    """Skills lexicon list."""
+    data = load_screening_artifact()
+    return data.skills if data else []
+
+
+def load_compiled_lexicon():
+    """Single-pass skill matcher, prebuilt in the data artifact."""
+    data = load_screening_artifact()
+    return data.lexicon if data else CompiledLexicon([])
 
 
-@st.cache_data
 def load_role_library():
-    """Load role library from JSON file."""
-    library_path = DATA_DIR / "role_library.json"
-    try:
-        with open(library_path, 'r') as f:
-            data = json.load(f)
-            return data.get("roles", [])
-    except Exception as e:
-        st.error(f"Error loading role library: {e}")
-        return []
+    """Role definitions list."""
+    data = load_screening_artifact()
+    return data.roles if data else []
+
+
+@st.cache_resource
+def load_extraction_cache():
+    """Open the on-disk extraction cache shared by all sessions."""
+    return ExtractionCache(CACHE_PATH)
+
+
+@st.cache_resource
+def load_jd_cache():
+    """Persist the process-wide parsed-JD cache, shared by all sessions."""
+    return jd_cache.configure(db_path=JD_CACHE_PATH)
 
 
-def save_candidate_profile(candidate_data: dict, filename: str):
-    """Save candidate profile to JSON file."""
+@st.cache_resource
+def load_extraction_sandbox():
+    """
+    Extraction worker processes shared by all sessions.
+    
+    Uploads are parsed out of the server process, so a file that hangs or
+    exhausts memory is killed and reported instead of taking the server down.
+    """
+    return ExtractionSandbox(default_worker_count(), EXTRACTION_TIMEOUT, EXTRACTION_MAX_MEMORY_MB)
+
+
+def load_role_index():
+    """Skill-to-role index, prebuilt in the data artifact."""
+    data = load_screening_artifact()
+    return data.role_index if data else RoleIndex([])
+
+
+@st.cache_resource
+def load_role_fit_matrix():
+    """Roles x skills weight matrix for ranking role fits, built once per server process."""
+    # Imported here: the matrix is numpy-backed and only needed once results are shown
+    from utils.role_fit import RoleFitMatrix
+    return RoleFitMatrix(load_role_library(), ROLE_FIT_REQUIRED_WEIGHT, ROLE_FIT_PREFERRED_WEIGHT)
+
+
+@st.cache_resource
+def load_profile_store():
+    """Open the candidate profile store shared by all sessions."""
+    location = PROFILE_DB_PATH if PROFILE_BACKEND == "sqlite" else OUTPUT_DIR
+    return open_profile_store(PROFILE_BACKEND, location)
+
+
+def save_candidate_profile(candidate_data: dict):
+    """Save candidate profile to the profile store."""
     try:
-        # Create a safe filename
-        safe_filename = filename.replace(" ", "_").replace(".pdf", "").replace(".docx", "")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = OUTPUT_DIR / f"{safe_filename}_{timestamp}.json"
-        
-        with open(output_file, 'w') as f:
-            json.dump(candidate_data, f, indent=2)
-        
-        return str(output_file)
+        with metrics.span("save"):
+            return load_profile_store().save(candidate_data)
     except Exception as e:
         st.error(f"Error saving candidate profile: {e}")
         return None
 
 
-def process_resume(uploaded_file, skills_lexicon, jd_skills, roles_library):
-    """Process a single resume file."""
-    try:
-        # Save uploaded file temporarily
-        suffix = Path(uploaded_file.name).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
-        
-        # Extract text
-        file_ext = suffix.lstrip('.')
-        raw_text = extract_text_from_file(tmp_path, file_ext)
-        
-        # Clean up temp file
-        os.unlink(tmp_path)
-        
-        if not raw_text:
-            return None
-        
-        # Extract skills
-        resume_skills = extract_skills(raw_text, skills_lexicon)
+def get_screening_session():
+    """Per-browser-session memo of extraction results and the parsed JD."""
+    if "screening_session" not in st.session_state:
+        st.session_state["screening_session"] = ScreeningSession()
+    return st.session_state["screening_session"]
+
+
+def extract_uploaded_files(uploaded_files, file_keys, session, compiled_lexicon, extraction_cache,
+                           max_workers, chunk_size, max_pages, max_chars, progress_bar,
+                           extractor=DEFAULT_EXTRACTOR):
+    """
+    Extract text and skills for uploads the session has not seen yet.
+    
+    Returns the number of files that were extracted in this run.
+    """
+    import numpy as np
+    from utils.near_duplicates import text_signature
+    
+    pending = [index for index, key in enumerate(file_keys) if session.get_extraction(key) is None]
+    
+    if max_workers > 1 and pending:
+        files = [(uploaded_files[index].name, uploaded_files[index].getvalue()) for index in pending]
+        # Workers only extract here; scoring runs afterwards for every file
+        for done, (position, candidate_profile, error) in enumerate(screen_resumes_parallel(
+            files,
+            [],
+            DATA_DIR / "skills_lexicon.json",
+            DATA_DIR / "role_library.json",
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            cache_path=CACHE_PATH,
+            max_pages=max_pages,
+            max_chars=max_chars,
+            artifact_path=ARTIFACT_PATH,
+            text_signature=True,
+            sandbox_limits=(EXTRACTION_TIMEOUT, EXTRACTION_MAX_MEMORY_MB),
+            extractor=extractor
+        ), start=1):
+            if error:
+                st.error(f"Error processing {files[position][0]}: {error}")
+            elif candidate_profile:
+                session.put_extraction(file_keys[pending[position]], {
+                    "raw_text": candidate_profile["raw_text"],
+                    "raw_text_length": candidate_profile["raw_text_length"],
+                    "extracted_skills": candidate_profile["extracted_skills"],
+                    "text_signature": np.array(candidate_profile["text_signature"], dtype=np.uint32)
+                })
+            else:
+                session.put_extraction(file_keys[pending[position]], summarize_extraction("", []))
+            progress_bar.progress(done / len(files))
+    else:
+        for done, index in enumerate(pending, start=1):
+            uploaded_file = uploaded_files[index]
+            with st.spinner(f"Processing {uploaded_file.name}..."):
+                try:
+                    start = time.perf_counter()
+                    raw_text, resume_skills = extract_resume(
+                        uploaded_file.getbuffer(),
+                        compiled_lexicon,
+                        extraction_cache,
+                        max_pages,
+                        max_chars,
+                        load_extraction_sandbox(),
+                        extractor
+                    )
+                    metrics.record_file(
+                        uploaded_file.name,
+                        metrics_file_type(uploaded_file.getbuffer()),
+                        time.perf_counter() - start
+                    )
+                    extraction = summarize_extraction(raw_text, resume_skills)
+                    # Signature of the full text, for linking near-duplicate uploads
+                    extraction["text_signature"] = text_signature(raw_text)
+                    session.put_extraction(file_keys[index], extraction)
+                except Exception as e:
+                    metrics.count("errors", 1, metrics_file_type(uploaded_file.getbuffer()))
+                    st.error(f"Error processing {uploaded_file.name}: {e}")
+            progress_bar.progress(done / len(pending))
+    
+    progress_bar.progress(1.0)
+    return len(pending)
+
+
+def show_stage_report(changes, n_files, n_extracted, jd_reused):
+    """Show which pipeline stages were reused from the previous run."""
+    reasons = []
+    if changes["lexicon_changed"] and not changes["first_run"]:
+        reasons.append("lexicon changed")
+    if changes["files_added"] and not changes["first_run"]:
+        reasons.append(f"{changes['files_added']} new file(s)")
+    reason = f" ({', '.join(reasons)})" if reasons else ""
+    
+    st.write("**Pipeline Stages:**")
+    if n_extracted:
+        st.write(f"- 📄 Text & skill extraction: ran for {n_extracted} of {n_files} files{reason}, reused {n_files - n_extracted}")
+    else:
+        st.write(f"- 📄 Text & skill extraction: ♻️ reused for all {n_files} files")
+    if jd_reused:
+        st.write("- 📝 JD parsing: ♻️ reused (JD unchanged)")
+    else:
+        st.write("- 📝 JD parsing: ran" + (" (JD changed)" if changes["jd_changed"] and not changes["first_run"] else ""))
+    st.write("- 📊 Scoring & role matching: ran")
+
+
+def show_cache_stats(cache):
+    """Render extraction and JD cache counters."""
+    stats = cache.stats()
+    st.write("**Extraction Cache:**")
+    st.write(f"- Hits: {stats['hits']} / Misses: {stats['misses']} ({stats['hit_rate']:.0%} hit rate)")
+    st.write(f"- Entries: {stats['entries']} ({stats['size_bytes'] / 1_000_000:.1f} MB)")
+    
+    jd_stats = jd_cache.get_jd_cache().stats()
+    st.write("**JD Cache:**")
+    st.write(f"- Hits: {jd_stats['hits']} / Misses: {jd_stats['misses']} ({jd_stats['hit_rate']:.0%} hit rate)")
+    st.write(f"- Entries: {jd_stats['entries']}")
+
+
+def show_metrics():
+    """Render per-stage timings and per-file-type counters."""
+    if not metrics.is_enabled():
+        return
+    
+    import pandas as pd
+    
+    st.write("**Stage Timings:**")
+    summary = metrics.REGISTRY.summary()
+    if not summary:
+        st.caption("No files processed yet")
+        return
+    
+    st.dataframe(
+        pd.DataFrame(summary).rename(columns={"file_type": "type"}),
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    snapshot = metrics.REGISTRY.snapshot()
+    totals = {}
+    for counter in snapshot["counters"]:
+        totals.setdefault(counter["file_type"] or "all", {})[counter["name"]] = counter["value"]
+    for file_type, counts in sorted(totals.items()):
+        st.write(
+            f"- {file_type}: {int(counts.get('files', 0))} files, "
+            f"{counts.get('bytes', 0) / 1_000_000:.1f} MB, "
+            f"{int(counts.get('pages', 0))} pages, {int(counts.get('errors', 0))} errors"
+            + (f", {int(counts['extractor_fallbacks'])} fast-extractor fallbacks" if counts.get("extractor_fallbacks") else "")
+        )
+    
+    if snapshot["slow_files"]:
+        st.write("**Slowest Files:**")
+        for slow in snapshot["slow_files"][:5]:
+            st.write(f"- {slow['filename']} ({slow['file_type']}): {slow['seconds'] * 1000:.0f} ms")
+
+
+def show_sidebar_stats(cache):
+    """Render the extraction cache and timing panels in the sidebar."""
+    show_cache_stats(cache)
+    show_metrics()
+
+
+def run_screening(uploaded_files, jd_text, compiled_lexicon, role_index, extraction_cache,
+                  stats_placeholder, max_workers, chunk_size, max_pages, max_chars, dedup_threshold=None,
+                  extractor=DEFAULT_EXTRACTOR):
+    """
+    Screen uploaded resumes against a single job description.
+    
+    The results are kept in the session for show_results.
+    
+    With a dedup_threshold, uploads that nearly duplicate an earlier upload in
+    the same batch are linked to it instead of being scored and saved.
+    """
+    if not uploaded_files:
+        st.warning("⚠️ Please upload at least one resume file.")
+        return
+    
+    if not jd_text.strip():
+        st.warning("⚠️ Please provide a job description.")
+        return
+    
+    session = get_screening_session()
+    file_keys = [
+        session.file_key(uploaded_file.getbuffer(), compiled_lexicon, max_pages, max_chars, extractor)
+        for uploaded_file in uploaded_files
+    ]
+    changes = session.changes(jd_text, compiled_lexicon, file_keys)
+    
+    # Parse job description
+    with st.spinner("Parsing job description..."):
+        jd_data, jd_reused = session.parse_jd(jd_text, compiled_lexicon)
+        jd_skills = jd_data["jd_required_skills"]
+    
+    st.info(f"📊 Extracted {len(jd_skills)} skills from job description")
+    
+    if jd_skills:
+        with st.expander("View JD Skills"):
+            st.write(", ".join(jd_skills))
+    
+    # Process resumes; files extracted in an earlier run are only re-scored
+    st.markdown("---")
+    st.subheader("🔍 Processing Resumes...")
+    
+    progress_bar = st.progress(0)
+    n_extracted = extract_uploaded_files(
+        uploaded_files,
+        file_keys,
+        session,
+        compiled_lexicon,
+        extraction_cache,
+        max_workers,
+        chunk_size,
+        max_pages,
+        max_chars,
+        progress_bar,
+        extractor
+    )
+    
+    duplicates = None
+    if dedup_threshold is not None:
+        from utils.near_duplicates import NearDuplicateIndex
+        duplicates = NearDuplicateIndex(":memory:", dedup_threshold)
+    linked = []
+    # Upload names by position: the in-run index is keyed by upload position,
+    # since candidate IDs repeat for same-named uploads within a second
+    filenames = {}
+    
+    # Results are kept compact: skill IDs instead of repeated skill lists
+    vocabulary = SkillVocabulary(compiled_lexicon.skills)
+    results = []
+    for position, (uploaded_file, key) in enumerate(zip(uploaded_files, file_keys)):
+        extraction = session.get_extraction(key)
+        if not extraction or not extraction["raw_text_length"]:
+            continue
         
-        # Calculate confidence score
-        scoring_result = calculate_confidence_score(resume_skills, jd_skills)
+        signature = extraction.get("text_signature")
+        if duplicates is not None:
+            match = duplicates.find(signature)
+            if match:
+                linked.append((uploaded_file.name, filenames[match[0]], match[1]))
+                continue
         
-        # Get alternate role suggestions
-        alternate_roles = get_role_suggestions_for_candidate(
-            scoring_result["confidence"],
-            resume_skills,
-            roles_library
+        candidate_profile = build_profile(uploaded_file.name, extraction, jd_skills, role_index)
+        save_candidate_profile(candidate_profile)
+        if duplicates is not None:
+            duplicates.add(str(position), signature)
+            filenames[str(position)] = uploaded_file.name
+        results.append(CandidateProfile.from_dict(candidate_profile, vocabulary, jd_skills))
+    
+    session.finish_run(jd_text, compiled_lexicon, file_keys)
+    show_stage_report(changes, len(uploaded_files), n_extracted, jd_reused)
+    
+    load_profile_store().flush()
+    st.success(f"✅ Processed {len(results)} out of {len(uploaded_files)} resumes")
+    
+    if linked:
+        with st.expander(f"♻️ {len(linked)} near-duplicate uploads linked instead of re-scored"):
+            for filename, original, score in linked:
+                st.write(f"- {filename} → {original} ({score:.0%} similar)")
+    
+    with stats_placeholder.container():
+        show_sidebar_stats(extraction_cache)
+    
+    # Keep the results for the results view, which reruns on every filter change
+    if results:
+        # Every candidate's role fits, scored in one batch
+        role_fits = load_role_fit_matrix().role_fits(
+            [candidate.extracted_skills for candidate in results], ROLE_FIT_TOP
         )
         
-        # Create candidate profile
-        candidate_profile = {
-            "candidate_id": f"candidate_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uploaded_file.name}",
-            "filename": uploaded_file.name,
-            "timestamp": datetime.now().isoformat(),
-            "raw_text": raw_text[:1000] + "..." if len(raw_text) > 1000 else raw_text,  # Truncate for storage
-            "raw_text_length": len(raw_text),
-            "extracted_skills": resume_skills,
-            "total_skills": len(resume_skills),
-            "jd_match": scoring_result,
-            "alternate_roles": alternate_roles
+        from utils.results_view import build_results_frame
+        st.session_state["screening_results"] = {
+            "results": results,
+            "role_fits": role_fits,
+            "frame": build_results_frame(results, role_fits)
         }
+        st.session_state["results_page"] = 1
+    else:
+        st.session_state.pop("screening_results", None)
+
+
+def show_results():
+    """
+    Render the last screening run's results, one page at a time.
+    
+    Filtering, sorting and paging run on the stored results table, and only
+    the selected candidate's details are rendered, so a rerun costs the same
+    for 20 candidates as for 2,000.
+    """
+    state = st.session_state.get("screening_results")
+    if not state:
+        return
+    
+    from utils.results_view import RECOMMENDATIONS, SORT_COLUMNS, filter_results, page_count, results_page
+    
+    frame = state["frame"]
+    st.markdown("---")
+    st.subheader("📊 Screening Results")
+    
+    filter_col, range_col, sort_col, order_col = st.columns([3, 3, 2, 1])
+    with filter_col:
+        recommendations = st.multiselect("Recommendation", RECOMMENDATIONS, default=RECOMMENDATIONS)
+    with range_col:
+        min_confidence, max_confidence = st.slider("Confidence range (%)", 0, 100, (0, 100))
+    with sort_col:
+        sort_by = st.selectbox("Sort by", list(SORT_COLUMNS), format_func=SORT_COLUMNS.get)
+    with order_col:
+        descending = st.toggle("Descending", value=True)
+    
+    filtered = filter_results(frame, recommendations, min_confidence, max_confidence, sort_by, descending)
+    
+    size_col, page_col, count_col = st.columns([2, 2, 5])
+    with size_col:
+        page_size = st.selectbox("Rows per page", RESULTS_PAGE_SIZES, index=1)
+    n_pages = page_count(len(filtered), page_size)
+    if st.session_state.get("results_page", 1) > n_pages:
+        st.session_state["results_page"] = n_pages
+    with page_col:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, key="results_page")
+    with count_col:
+        st.caption(f"{len(filtered)} of {len(frame)} candidates · page {page} of {n_pages}")
+    
+    rows = results_page(filtered, page, page_size)
+    badges = {"Interview": "🟢 Interview", "Maybe": "🟡 Maybe", "Not now": "🔴 Not now"}
+    st.dataframe(
+        rows.assign(recommendation=rows["recommendation"].map(badges)),
+        column_config={
+            "candidate": "Candidate",
+            "confidence": st.column_config.ProgressColumn("Confidence", format="%d%%", min_value=0, max_value=100),
+            "recommendation": "Recommendation",
+            "matched_skills": "Matched Skills",
+            "missing_skills": "Missing Skills",
+            "total_skills": "Total Skills",
+            "best_fit_role": "Best-Fit Role",
+            "best_fit": st.column_config.NumberColumn("Fit", format="%d%%")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    # Details are rendered for the selected candidate only
+    st.subheader("📋 Candidate Details")
+    position = st.selectbox(
+        "Candidate",
+        [None] + rows.index.tolist(),
+        format_func=lambda i: "Select a candidate on this page" if i is None else frame.at[i, "candidate"]
+    )
+    if position is not None:
+        show_candidate_detail(state["results"][position], state["role_fits"][position])
+
+
+def show_candidate_detail(candidate, fits):
+    """Render one candidate's screening details, role suggestions and text preview."""
+    col_a, col_b = st.columns(2)
+    jd_match = candidate.jd_match()
+    
+    with col_a:
+        st.write("**Screening Results:**")
+        st.write(f"- Confidence: {jd_match['confidence']}%")
+        st.write(f"- Recommendation: {jd_match['recommendation']}")
+        st.write(f"- Matched Skills: {jd_match['matched_count']}/{jd_match['total_jd_skills']}")
         
-        # Save profile
-        save_candidate_profile(candidate_profile, uploaded_file.name)
+        st.write("\n**Matched JD Skills:**")
+        st.write(", ".join(jd_match['matched_skills']) if jd_match['matched_skills'] else "None")
         
-        return candidate_profile
+        st.write("\n**Missing JD Skills:**")
+        st.write(", ".join(jd_match['missing_skills']) if jd_match['missing_skills'] else "None")
+    
+    with col_b:
+        extracted_skills = candidate.extracted_skills
+        alternate_roles = candidate.alternate_roles()
+        st.write("**All Extracted Skills:**")
+        st.write(", ".join(extracted_skills) if extracted_skills else "None")
         
-    except Exception as e:
-        st.error(f"Error processing {uploaded_file.name}: {e}")
-        return None
+        if alternate_roles:
+            st.write("\n**🎯 Alternate Role Suggestions:**")
+            for role in alternate_roles:
+                st.write(f"- **{role['role_name']}** ({role['role_score']}% match)")
+                st.write(f"  Matched: {', '.join(role['matched_skills'][:5])}")
+        
+        if fits:
+            st.write("\n**🧭 Role Fit (required + preferred skills):**")
+            for fit in fits:
+                st.write(
+                    f"- **{fit['role_name']}** ({fit['fit_score']}% fit, "
+                    f"{fit['required_coverage']:.0%} required, {fit['preferred_coverage']:.0%} preferred)"
+                )
+    
+    st.write(f"**Text Preview:** {candidate.raw_text[:500]}...")
+
+
+def run_multi_jd_screening(uploaded_files, multi_jd_text, compiled_lexicon, extraction_cache,
+                           stats_placeholder, max_workers, chunk_size, max_pages, max_chars,
+                           extractor=DEFAULT_EXTRACTOR):
+    """Screen uploaded resumes against several job descriptions and show the confidence matrix."""
+    import pandas as pd
+    from utils.multi_jd import split_job_descriptions, score_multi_jd
+    
+    if not uploaded_files:
+        st.warning("⚠️ Please upload at least one resume file.")
+        return
+    
+    jd_texts = split_job_descriptions(multi_jd_text)
+    if not jd_texts:
+        st.warning("⚠️ Please provide at least one job description.")
+        return
+    
+    # Extract every resume once; all JDs share the extracted skills
+    session = get_screening_session()
+    file_keys = [
+        session.file_key(uploaded_file.getbuffer(), compiled_lexicon, max_pages, max_chars, extractor)
+        for uploaded_file in uploaded_files
+    ]
+    changes = session.changes(multi_jd_text, compiled_lexicon, file_keys)
+    
+    st.subheader(f"🔍 Extracting {len(uploaded_files)} Resumes...")
+    progress_bar = st.progress(0)
+    n_extracted = extract_uploaded_files(
+        uploaded_files,
+        file_keys,
+        session,
+        compiled_lexicon,
+        extraction_cache,
+        max_workers,
+        chunk_size,
+        max_pages,
+        max_chars,
+        progress_bar,
+        extractor
+    )
+    
+    candidates = []
+    for uploaded_file, key in zip(uploaded_files, file_keys):
+        extraction = session.get_extraction(key)
+        if extraction and extraction["raw_text_length"]:
+            candidates.append((uploaded_file.name, extraction["extracted_skills"]))
+    
+    session.finish_run(multi_jd_text, compiled_lexicon, file_keys)
+    show_stage_report(changes, len(uploaded_files), n_extracted, jd_reused=False)
+    
+    with stats_placeholder.container():
+        show_sidebar_stats(extraction_cache)
+    
+    if not candidates:
+        st.warning("⚠️ No text could be extracted from the uploaded resumes.")
+        return
+    
+    result = score_multi_jd(candidates, jd_texts, compiled_lexicon)
+    st.success(f"✅ Scored {len(result)} candidates against {len(jd_texts)} job descriptions")
+    
+    # Candidate x JD confidence matrix
+    st.markdown("---")
+    st.subheader("📊 Confidence Matrix")
+    matrix_df = pd.DataFrame(result.confidence, columns=result.titles)
+    matrix_df.insert(0, "Candidate", result.filenames)
+    
+    # Color code each cell by the recommendation it would get
+    def highlight_confidence(confidence):
+        if confidence >= INTERVIEW_THRESHOLD:
+            return 'background-color: #d4edda'
+        elif confidence >= MAYBE_THRESHOLD:
+            return 'background-color: #fff3cd'
+        else:
+            return 'background-color: #f8d7da'
+    
+    st.dataframe(matrix_df.style.map(highlight_confidence, subset=result.titles), use_container_width=True)
+    
+    # Best requisition per candidate
+    st.subheader("🎯 Best Requisition per Candidate")
+    assignments_df = pd.DataFrame(result.assignments())
+    assignments_df.columns = ["Candidate", "Best Requisition", "Confidence", "Recommendation"]
+    st.dataframe(assignments_df, use_container_width=True)
+    
+    with st.expander("View JD Skills"):
+        for title, jd_data in zip(result.titles, result.jds):
+            st.write(f"**{title}** ({jd_data['total_jd_skills']} skills): {', '.join(jd_data['jd_required_skills']) or 'None'}")
 
 
 def main():
@@ -140,7 +631,11 @@ def main():
     # Load data
     with st.spinner("Loading skills lexicon and role library..."):
         skills_lexicon = load_skills_lexicon()
+        compiled_lexicon = load_compiled_lexicon()
         roles_library = load_role_library()
+        role_index = load_role_index()
+        extraction_cache = load_extraction_cache()
+        load_jd_cache()
     
     if not skills_lexicon:
         st.error("Failed to load skills lexicon. Please check data/skills_lexicon.json")
@@ -162,141 +657,125 @@ def main():
         st.write("- ✅ Interview: ≥75%")
         st.write("- ⚠️ Maybe: 55-74%")
         st.write("- ❌ Not now: <55%")
+        st.markdown("---")
+        st.write("**Performance:**")
+        max_workers = st.number_input(
+            "Parallel workers",
+            min_value=1,
+            max_value=64,
+            value=1,
+            help=f"1 processes files serially; this machine suggests {default_worker_count()}"
+        )
+        chunk_size = st.number_input(
+            "Files per worker task",
+            min_value=1,
+            max_value=100,
+            value=1
+        )
+        max_pages = st.number_input(
+            "Max PDF pages per file",
+            min_value=1,
+            max_value=1000,
+            value=DEFAULT_MAX_PAGES,
+            help="Longer documents are truncated so one file cannot stall the batch"
+        )
+        max_chars = st.number_input(
+            "Max characters per file",
+            min_value=1000,
+            max_value=10_000_000,
+            value=DEFAULT_MAX_CHARS,
+            step=10_000
+        )
+        extractor = st.selectbox(
+            "Text extraction",
+            EXTRACTOR_CHOICES,
+            index=EXTRACTOR_CHOICES.index(DEFAULT_EXTRACTOR),
+            help="accurate: pdfplumber layout text; fast: PDFium text layer, many times quicker; "
+                 "auto: fast, retrying with accurate when a PDF yields little text"
+        )
+        collect_metrics = st.checkbox(
+            "Collect stage timings",
+            value=True,
+            help="Per-stage latency, bytes, pages and errors by file type"
+        )
+        metrics.enable(collect_metrics)
+        if collect_metrics and st.button("Reset timings"):
+            metrics.REGISTRY.reset()
+        dedup = st.checkbox(
+            "Link near-duplicate uploads",
+            value=True,
+            help="Resumes uploaded more than once, or lightly edited, are scored once"
+        )
+        dedup_threshold = st.slider(
+            "Near-duplicate similarity",
+            min_value=0.5,
+            max_value=1.0,
+            value=DEDUP_THRESHOLD,
+            step=0.01,
+            disabled=not dedup,
+            help="Estimated share of overlapping 3-word phrases; 0.8 catches edits to about 1-2% of the words"
+        )
+        st.markdown("---")
+        stats_placeholder = st.empty()
+        with stats_placeholder.container():
+            show_sidebar_stats(extraction_cache)
     
     # Main content area
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.subheader("📄 Upload Resumes")
-        uploaded_files = st.file_uploader(
-            "Upload PDF or DOCX files",
-            type=["pdf", "docx"],
-            accept_multiple_files=True,
-            help="Select multiple resume files to process"
-        )
+    st.subheader("📄 Upload Resumes")
+    uploaded_files = st.file_uploader(
+        "Upload PDF or DOCX files",
+        type=["pdf", "docx"],
+        accept_multiple_files=True,
+        help="Select multiple resume files to process"
+    )
+    
+    single_tab, multi_tab = st.tabs(["📝 Single JD", "🗂️ Multi-JD"])
     
-    with col2:
-        st.subheader("📝 Job Description")
+    with single_tab:
         jd_text = st.text_area(
             "Paste job description here",
             height=200,
             placeholder="Enter the job description text..."
         )
-    
-    # Process button
-    st.markdown("---")
-    
-    if st.button("🚀 Run Screening", type="primary", use_container_width=True):
-        if not uploaded_files:
-            st.warning("⚠️ Please upload at least one resume file.")
-            return
-        
-        if not jd_text.strip():
-            st.warning("⚠️ Please provide a job description.")
-            return
-        
-        # Parse job description
-        with st.spinner("Parsing job description..."):
-            jd_data = parse_job_description(jd_text, skills_lexicon)
-            jd_skills = jd_data["jd_required_skills"]
-        
-        st.info(f"📊 Extracted {len(jd_skills)} skills from job description")
         
-        if jd_skills:
-            with st.expander("View JD Skills"):
-                st.write(", ".join(jd_skills))
-        
-        # Process resumes
-        st.markdown("---")
-        st.subheader("🔍 Processing Resumes...")
-        
-        results = []
-        progress_bar = st.progress(0)
-        
-        for idx, uploaded_file in enumerate(uploaded_files):
-            with st.spinner(f"Processing {uploaded_file.name}..."):
-                candidate_profile = process_resume(
-                    uploaded_file,
-                    skills_lexicon,
-                    jd_skills,
-                    roles_library
-                )
-                
-                if candidate_profile:
-                    results.append(candidate_profile)
-                    
-                    # Show preview
-                    with st.expander(f"Preview: {uploaded_file.name}"):
-                        st.write(f"**Text Preview:** {candidate_profile['raw_text'][:500]}...")
-                        st.write(f"**Total Skills Found:** {len(candidate_profile['extracted_skills'])}")
-            
-            progress_bar.progress((idx + 1) / len(uploaded_files))
-        
-        st.success(f"✅ Processed {len(results)} out of {len(uploaded_files)} resumes")
+        if st.button("🚀 Run Screening", type="primary", use_container_width=True):
+            run_screening(
+                uploaded_files,
+                jd_text,
+                compiled_lexicon,
+                role_index,
+                extraction_cache,
+                stats_placeholder,
+                int(max_workers),
+                int(chunk_size),
+                int(max_pages),
+                int(max_chars),
+                dedup_threshold if dedup else None,
+                extractor
+            )
+        show_results()
+    
+    with multi_tab:
+        multi_jd_text = st.text_area(
+            "Paste job descriptions separated by a line containing only ---",
+            height=300,
+            placeholder="Senior Data Engineer\n...\n---\nML Engineer\n...",
+            help="Each JD is named by its first line"
+        )
         
-        # Display results
-        if results:
-            st.markdown("---")
-            st.subheader("📊 Screening Results")
-            
-            # Create results table
-            table_data = []
-            for candidate in results:
-                jd_match = candidate["jd_match"]
-                
-                row = {
-                    "Candidate": candidate["filename"],
-                    "Confidence": f"{jd_match['confidence']}%",
-                    "Recommendation": jd_match["recommendation"],
-                    "Matched Skills": ", ".join(jd_match["matched_skills"][:5]) + ("..." if len(jd_match["matched_skills"]) > 5 else ""),
-                    "Missing Skills": ", ".join(jd_match["missing_skills"][:3]) + ("..." if len(jd_match["missing_skills"]) > 3 else ""),
-                    "Total Skills": candidate["total_skills"]
-                }
-                table_data.append(row)
-            
-            df = pd.DataFrame(table_data)
-            
-            # Color code by recommendation
-            def highlight_recommendation(row):
-                if row["Recommendation"] == "Interview":
-                    return ['background-color: #d4edda'] * len(row)
-                elif row["Recommendation"] == "Maybe":
-                    return ['background-color: #fff3cd'] * len(row)
-                else:
-                    return ['background-color: #f8d7da'] * len(row)
-            
-            styled_df = df.style.apply(highlight_recommendation, axis=1)
-            st.dataframe(styled_df, use_container_width=True)
-            
-            # Show detailed results
-            st.markdown("---")
-            st.subheader("📋 Detailed Candidate Profiles")
-            
-            for candidate in results:
-                with st.expander(f"🔍 {candidate['filename']} - {candidate['jd_match']['recommendation']}"):
-                    col_a, col_b = st.columns(2)
-                    
-                    with col_a:
-                        st.write("**Screening Results:**")
-                        st.write(f"- Confidence: {candidate['jd_match']['confidence']}%")
-                        st.write(f"- Recommendation: {candidate['jd_match']['recommendation']}")
-                        st.write(f"- Matched Skills: {candidate['jd_match']['matched_count']}/{candidate['jd_match']['total_jd_skills']}")
-                        
-                        st.write("\n**Matched JD Skills:**")
-                        st.write(", ".join(candidate['jd_match']['matched_skills']) if candidate['jd_match']['matched_skills'] else "None")
-                        
-                        st.write("\n**Missing JD Skills:**")
-                        st.write(", ".join(candidate['jd_match']['missing_skills']) if candidate['jd_match']['missing_skills'] else "None")
-                    
-                    with col_b:
-                        st.write("**All Extracted Skills:**")
-                        st.write(", ".join(candidate['extracted_skills']) if candidate['extracted_skills'] else "None")
-                        
-                        if candidate['alternate_roles']:
-                            st.write("\n**🎯 Alternate Role Suggestions:**")
-                            for role in candidate['alternate_roles']:
-                                st.write(f"- **{role['role_name']}** ({role['role_score']}% match)")
-                                st.write(f"  Matched: {', '.join(role['matched_skills'][:5])}")
+        if st.button("🚀 Run Multi-JD Screening", type="primary", use_container_width=True):
+            run_multi_jd_screening(
+                uploaded_files,
+                multi_jd_text,
+                compiled_lexicon,
+                extraction_cache,
+                stats_placeholder,
+                int(max_workers),
+                int(chunk_size),
+                int(max_pages),
+                int(max_chars),
+                extractor
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+"""
+Benchmark vectorized batch scoring against per-candidate scoring.
+
+Usage:
+    python -m benchmarks.bench_batch_scoring
+"""
+import json
+import random
+import time
+from pathlib import Path
+
+from utils.batch_scoring import SkillMatrix
+from utils.scoring import calculate_confidence_score
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+POOL_SIZES = [1000, 10000, 100000]
+SKILLS_PER_CANDIDATE = 30
+JD_SKILLS = 12
+
+
+def main():
+    rng = random.Random(42)
+    with open(DATA_DIR / "skills_lexicon.json", 'r') as f:
+        skills = json.load(f)["skills"]
+    jd_skills = rng.sample(skills, JD_SKILLS)
+    
+    print(f"{'pool':>8} {'encode s':>9} {'per-candidate s':>16} {'batch s':>8} {'speedup':>8}")
+    for size in POOL_SIZES:
+        candidates = [rng.sample(skills, SKILLS_PER_CANDIDATE) for _ in range(size)]
+        
+        start = time.perf_counter()
+        matrix = SkillMatrix(skills)
+        matrix.extend(candidates)
+        encode_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for candidate in candidates:
+            calculate_confidence_score(candidate, jd_skills)
+        loop_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        scores = matrix.score(jd_skills)
+        scores.recommendations()
+        batch_time = time.perf_counter() - start
+        
+        print(f"{size:>8} {encode_time:>9.3f} {loop_time:>16.3f} {batch_time:>8.4f} {loop_time / batch_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
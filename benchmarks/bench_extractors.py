@@ -0,0 +1,175 @@
+"""
+Benchmark text extractors for speed and skill agreement.
+
+Every extractor parses the same corpus (synthetic, or a folder of real
+resumes with --resumes). Speed is the best of several runs; agreement
+compares the skills matched in each extractor's text with those matched in
+the accurate extractor's text, since skill matching is all the pipeline uses
+the text for. DOCX files are also read with each DOCX backend on its own,
+and with python-docx as the reference, to compare speed and check that
+every paragraph python-docx reports comes out of the streaming reader too.
+
+Usage:
+    python -m benchmarks.bench_extractors
+    python -m benchmarks.bench_extractors --resumes ./resumes --output extractors.json
+"""
+import argparse
+import io
+import json
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from benchmarks.corpus import generate_corpus, load_data
+from utils import metrics
+from utils.file_loader import iter_text_from_file, sniff_format, find_resumes, DOCX_BACKENDS, EXTRACTOR_CHOICES, DEFAULT_EXTRACTOR
+from utils.pipeline import DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+from utils.skill_extractor import CompiledLexicon
+
+
+def extract_all(corpus: List[Tuple[str, bytes]], extractor: str) -> List[str]:
+    """Text of every file with one extractor; files it cannot read give empty text."""
+    texts = []
+    for _, data in corpus:
+        try:
+            texts.append("\n".join(iter_text_from_file(data, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS, extractor)).strip())
+        except Exception:
+            texts.append("")
+    return texts
+
+
+def agreement(skills: List[List[str]], reference: List[List[str]]) -> dict:
+    """
+    Skill agreement of one extractor with the reference, over all files.
+    
+    Returns:
+        Dictionary with recall and precision (micro-averaged over skill
+        mentions) and identical (share of files with the same skill set)
+    """
+    found = expected = shared = identical = 0
+    for candidate, truth in zip(skills, reference):
+        candidate, truth = set(candidate), set(truth)
+        found += len(candidate)
+        expected += len(truth)
+        shared += len(candidate & truth)
+        identical += candidate == truth
+    return {
+        "recall": shared / expected if expected else 1.0,
+        "precision": shared / found if found else 1.0,
+        "identical": identical / len(reference) if reference else 1.0
+    }
+
+
+def run(corpus: List[Tuple[str, bytes]], lexicon: CompiledLexicon, extractors: List[str], repeats: int) -> List[dict]:
+    """Time each extractor on the corpus and compare its skills with the accurate extractor's."""
+    reference = [lexicon.find(text) for text in extract_all(corpus, DEFAULT_EXTRACTOR)]
+    total_bytes = sum(len(data) for _, data in corpus)
+    results = []
+    for extractor in extractors:
+        metrics.enable()
+        metrics.REGISTRY.reset()
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            texts = extract_all(corpus, extractor)
+            best = min(best, time.perf_counter() - start)
+        fallbacks = sum(
+            counter["value"] for counter in metrics.REGISTRY.snapshot()["counters"]
+            if counter["name"] == "extractor_fallbacks"
+        ) / repeats
+        metrics.enable(False)
+        
+        results.append({
+            "extractor": extractor,
+            "files": len(corpus),
+            "seconds": round(best, 4),
+            "per_file_ms": round(best / len(corpus) * 1000, 3) if corpus else 0.0,
+            "mb_per_second": round(total_bytes / 1_000_000 / best, 2) if best else 0.0,
+            "fallbacks": int(fallbacks),
+            **{key: round(value, 4) for key, value in agreement([lexicon.find(text) for text in texts], reference).items()}
+        })
+    return results
+
+
+def _is_subsequence(items: List[str], sequence: List[str]) -> bool:
+    remaining = iter(sequence)
+    return all(item in remaining for item in items)
+
+
+def python_docx_paragraphs(stream) -> List[str]:
+    """Body paragraph text from python-docx, the reference DOCX reader."""
+    from docx import Document
+    
+    return [paragraph.text for paragraph in Document(stream).paragraphs]
+
+
+def run_docx_backends(corpus: List[Tuple[str, bytes]], repeats: int) -> List[dict]:
+    """
+    Time each DOCX backend, and python-docx, on the corpus's DOCX files.
+    
+    Returns:
+        One record per backend with per-file time and parity: the share of
+        files whose python-docx paragraphs all appear, in order, in the
+        backend's paragraphs (which may add tables, headers and footers)
+    """
+    documents = [data for _, data in corpus if sniff_format(data) == "docx"]
+    if not documents:
+        return []
+    reference = [python_docx_paragraphs(io.BytesIO(data)) for data in documents]
+    results = []
+    for backend, read in {**DOCX_BACKENDS, "python-docx": python_docx_paragraphs}.items():
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            paragraphs = [list(read(io.BytesIO(data))) for data in documents]
+            best = min(best, time.perf_counter() - start)
+        results.append({
+            "backend": backend,
+            "files": len(documents),
+            "per_file_ms": round(best / len(documents) * 1000, 3),
+            "parity": round(sum(map(_is_subsequence, reference, paragraphs)) / len(documents), 4)
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text extractor speed and skill agreement benchmark")
+    parser.add_argument("--resumes", help="Directory of real PDF/DOCX resumes (default: synthetic corpus)")
+    parser.add_argument("--count", type=int, default=50, help="Synthetic resumes")
+    parser.add_argument("--pdf-ratio", type=float, default=1.0, help="Fraction of synthetic PDFs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--extractors", default=",".join(EXTRACTOR_CHOICES), help="Comma-separated extractors")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per extractor; the best is kept")
+    parser.add_argument("--output", help="Also write results as JSON to this file")
+    args = parser.parse_args()
+    
+    skills, roles = load_data()
+    lexicon = CompiledLexicon(skills)
+    if args.resumes:
+        resume_dir = Path(args.resumes)
+        corpus = [(str(path.relative_to(resume_dir)), path.read_bytes()) for path in find_resumes(resume_dir)]
+    else:
+        corpus = generate_corpus(args.count, skills, roles, args.seed, pdf_ratio=args.pdf_ratio)
+    extractors = [name.strip() for name in args.extractors.split(",") if name.strip()]
+    
+    results = run(corpus, lexicon, extractors, args.repeat)
+    print(f"{'extractor':<10} {'per file ms':>12} {'MB/s':>8} {'recall':>8} {'precision':>10} {'identical':>10} {'fallbacks':>10}")
+    for result in results:
+        print(
+            f"{result['extractor']:<10} {result['per_file_ms']:>12.2f} {result['mb_per_second']:>8.2f} "
+            f"{result['recall']:>8.1%} {result['precision']:>10.1%} {result['identical']:>10.1%} {result['fallbacks']:>10}"
+        )
+    
+    docx_results = run_docx_backends(corpus, args.repeat)
+    if docx_results:
+        print(f"\n{'DOCX backend':<12} {'per file ms':>12} {'parity':>8}")
+        for result in docx_results:
+            print(f"{result['backend']:<12} {result['per_file_ms']:>12.2f} {result['parity']:>8.1%}")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"reference": DEFAULT_EXTRACTOR, "results": results, "docx_backends": docx_results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark batched role fit against per-candidate role matching.
+
+Every candidate is ranked against every role, as in the role-fits mode.
+The per-candidate baseline is RoleIndex.find_alternate_roles with
+min_score=0, timed on a sample and reported per candidate.
+
+Usage:
+    python -m benchmarks.bench_role_fit
+"""
+import json
+import random
+import time
+from pathlib import Path
+
+from utils.role_fit import RoleFitMatrix
+from utils.role_matcher import RoleIndex
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+ROLE_COUNTS = [100, 1000, 3000]
+POOL_SIZE = 100000
+LOOP_SAMPLE = 1000
+SKILLS_PER_CANDIDATE = 30
+REQUIRED_PER_ROLE = 8
+PREFERRED_PER_ROLE = 6
+TOP_N = 3
+
+
+def make_roles(skills, count, rng):
+    """Synthetic role library drawing required and preferred skills from the lexicon."""
+    roles = []
+    for i in range(count):
+        sample = rng.sample(skills, REQUIRED_PER_ROLE + PREFERRED_PER_ROLE)
+        roles.append({
+            "role_id": f"role_{i:05d}",
+            "role_name": f"Role {i}",
+            "required_skills": sample[:REQUIRED_PER_ROLE],
+            "preferred_skills": sample[REQUIRED_PER_ROLE:]
+        })
+    return roles
+
+
+def main():
+    rng = random.Random(42)
+    with open(DATA_DIR / "skills_lexicon.json", 'r') as f:
+        skills = json.load(f)["skills"]
+    candidates = [rng.sample(skills, SKILLS_PER_CANDIDATE) for _ in range(POOL_SIZE)]
+    sample = candidates[:LOOP_SAMPLE]
+    
+    print(f"{'roles':>6} {'build s':>8} {'per-candidate us':>17} {'batch s':>8} {'batch us':>9} {'speedup':>8}")
+    for count in ROLE_COUNTS:
+        roles = make_roles(skills, count, rng)
+        
+        start = time.perf_counter()
+        matrix = RoleFitMatrix(roles)
+        build_time = time.perf_counter() - start
+        
+        index = RoleIndex(roles)
+        start = time.perf_counter()
+        for candidate in sample:
+            index.find_alternate_roles(candidate, min_score=0, top_n=TOP_N)
+        loop_us = (time.perf_counter() - start) / len(sample) * 1e6
+        
+        start = time.perf_counter()
+        matrix.top_fits(candidates, TOP_N)
+        batch_time = time.perf_counter() - start
+        batch_us = batch_time / len(candidates) * 1e6
+        
+        print(
+            f"{count:>6} {build_time:>8.3f} {loop_us:>17.1f} {batch_time:>8.2f} {batch_us:>9.1f} "
+            f"{loop_us / batch_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
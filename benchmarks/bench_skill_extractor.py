@@ -0,0 +1,91 @@
+"""
+Benchmark the compiled skill matcher against the legacy per-skill regex scan.
+
+Usage:
+    python -m benchmarks.bench_skill_extractor
+"""
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import List
+
+from utils.skill_extractor import CompiledLexicon
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+LEXICON_SIZES = [300, 3000, 30000]
+RESUME_WORDS = 800
+REPEATS = 5
+
+
+def legacy_extract_skills(text: str, skills_lexicon: List[str]) -> List[str]:
+    """Original implementation: one regex search per lexicon entry."""
+    text_lower = text.lower()
+    matched_skills = set()
+    for skill in skills_lexicon:
+        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
+        if re.search(pattern, text_lower):
+            matched_skills.add(skill)
+    return sorted(matched_skills)
+
+
+def build_lexicon(base_skills: List[str], size: int, rng: random.Random) -> List[str]:
+    """Pad the real lexicon with synthetic multi-word skills up to size."""
+    syllables = ["data", "cloud", "stack", "net", "flow", "graph", "ops", "sys", "byte", "core"]
+    skills = list(base_skills[:size])
+    seen = set(s.lower() for s in skills)
+    while len(skills) < size:
+        words = rng.randint(1, 3)
+        skill = " ".join(
+            "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+            for _ in range(words)
+        ).title()
+        if skill.lower() not in seen:
+            seen.add(skill.lower())
+            skills.append(skill)
+    return skills
+
+
+def build_resume(skills: List[str], rng: random.Random) -> str:
+    """Synthetic resume text mixing filler words with ~40 lexicon skills."""
+    filler = ["experience", "team", "project", "built", "led", "using", "with", "and", "years", "delivered"]
+    words = [rng.choice(filler) for _ in range(RESUME_WORDS)]
+    for skill in rng.sample(skills, 40):
+        words.insert(rng.randrange(len(words)), skill + ",")
+    return " ".join(words)
+
+
+def time_call(func, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rng = random.Random(42)
+    with open(DATA_DIR / "skills_lexicon.json", 'r') as f:
+        base_skills = json.load(f)["skills"]
+    
+    print(f"{'lexicon':>8} {'compile ms':>11} {'legacy ms':>10} {'compiled ms':>12} {'speedup':>8}")
+    for size in LEXICON_SIZES:
+        skills = build_lexicon(base_skills, size, rng)
+        text = build_resume(skills, rng)
+        
+        start = time.perf_counter()
+        compiled = CompiledLexicon(skills)
+        compile_time = time.perf_counter() - start
+        
+        legacy_time = time_call(legacy_extract_skills, text, skills)
+        compiled_time = time_call(compiled.find, text)
+        print(
+            f"{size:>8} {compile_time * 1000:>11.1f} {legacy_time * 1000:>10.2f} "
+            f"{compiled_time * 1000:>12.2f} {legacy_time / compiled_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
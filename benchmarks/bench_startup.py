@@ -0,0 +1,166 @@
+"""
+Benchmark cold start: module imports and loading the lexicon and role library.
+
+Every measurement runs in a fresh interpreter, so nothing is shared between
+runs except the operating system's file cache. Import times are wall times of
+the whole child process minus a bare interpreter start; data loading is timed
+inside the child once its modules are imported. Pass --root to measure another
+checkout (e.g. an older commit) with the same scenarios; scenarios it cannot
+run are skipped.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --root /path/to/older/checkout
+"""
+import argparse
+import ast
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.bench_skill_extractor import build_lexicon
+from benchmarks.corpus import load_data
+
+ROOT = Path(__file__).resolve().parent.parent
+LARGE_LEXICON = 30000
+REPEATS = 5
+
+BUILD_CODE = """
+import json, time
+from utils.skill_extractor import CompiledLexicon
+from utils.role_matcher import RoleIndex
+start = time.perf_counter()
+with open({lexicon!r}) as f:
+    lexicon = CompiledLexicon(json.load(f)["skills"])
+with open({roles!r}) as f:
+    roles = RoleIndex(json.load(f)["roles"])
+print(time.perf_counter() - start)
+"""
+
+# Includes hashing the JSON sources to check the artifact is current
+ARTIFACT_CODE = """
+import time
+from utils.data_artifact import load_screening_data
+start = time.perf_counter()
+load_screening_data({lexicon!r}, {roles!r}, {artifact!r})
+print(time.perf_counter() - start)
+"""
+
+
+def app_imports(root: Path) -> str:
+    """
+    Top-level import statements of app.py in a checkout.
+    
+    streamlit is left out: the server has already imported it by the time it
+    runs app.py, so it is not part of the page's start-up cost.
+    """
+    tree = ast.parse((root / "app.py").read_text())
+    statements = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names = [node.module or ""]
+        else:
+            continue
+        if not any(name.split(".")[0] == "streamlit" for name in names):
+            statements.append(ast.unparse(node))
+    return "\n".join(statements)
+
+
+def _run(code: str, root: Path) -> Optional[subprocess.CompletedProcess]:
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+    return result if result.returncode == 0 else None
+
+
+def time_process(code: str, root: Path, repeats: int) -> Optional[float]:
+    """Best wall time of a fresh interpreter running code, or None if it fails."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if _run(code, root) is None:
+            return None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_in_process(code: str, root: Path, repeats: int) -> Optional[float]:
+    """Best of the seconds printed by a fresh interpreter running code, or None if it fails."""
+    best = float("inf")
+    for _ in range(repeats):
+        result = _run(code, root)
+        if result is None:
+            return None
+        best = min(best, float(result.stdout.strip().splitlines()[-1]))
+    return best
+
+
+def write_large_sources(out_dir: Path, skills: List[str], roles: List[dict]):
+    """Write a synthetic 30k-skill lexicon next to the real role library."""
+    with open(out_dir / "skills_lexicon.json", 'w') as f:
+        json.dump({"skills": build_lexicon(skills, LARGE_LEXICON, random.Random(0))}, f)
+    with open(out_dir / "role_library.json", 'w') as f:
+        json.dump({"roles": roles}, f)
+
+
+def run(root: Path, repeats: int) -> List[dict]:
+    """Time every scenario against the checkout at root."""
+    results = []
+    interpreter = time_process("pass", root, repeats)
+    results.append({"name": "interpreter start", "ms": interpreter * 1000})
+    for name, code in [
+        ("import utils.pipeline", "import utils.pipeline"),
+        ("import utils.cli", "import utils.cli"),
+        ("app.py imports (excl. streamlit)", app_imports(root))
+    ]:
+        seconds = time_process(code, root, repeats)
+        results.append({"name": name, "ms": max(0.0, seconds - interpreter) * 1000 if seconds is not None else None})
+    
+    skills, roles = load_data()
+    with tempfile.TemporaryDirectory() as tmp:
+        large_dir = Path(tmp)
+        write_large_sources(large_dir, skills, roles)
+        for label, data_dir in [(f"{len(skills)} skills", ROOT / "data"), (f"{LARGE_LEXICON} skills", large_dir)]:
+            lexicon = str(data_dir / "skills_lexicon.json")
+            roles_path = str(data_dir / "role_library.json")
+            artifact = str(large_dir / f"artifact_{len(results)}.bin")
+            
+            seconds = time_in_process(BUILD_CODE.format(lexicon=lexicon, roles=roles_path), root, repeats)
+            results.append({"name": f"compile from JSON ({label})", "ms": seconds * 1000 if seconds is not None else None})
+            
+            built = _run(
+                f"from utils.data_artifact import build_screening_data, write_artifact\n"
+                f"write_artifact(build_screening_data({lexicon!r}, {roles_path!r}), {artifact!r})",
+                root
+            )
+            code = ARTIFACT_CODE.format(lexicon=lexicon, roles=roles_path, artifact=artifact)
+            seconds = time_in_process(code, root, repeats) if built else None
+            results.append({"name": f"load artifact ({label})", "ms": seconds * 1000 if seconds is not None else None})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--root", default=str(ROOT), help="Checkout to measure (default: this one)")
+    parser.add_argument("--repeat", type=int, default=REPEATS, help="Fresh processes per scenario; the best is kept")
+    parser.add_argument("--output", help="Also write results as JSON to this file")
+    args = parser.parse_args()
+    
+    results = run(Path(args.root).resolve(), args.repeat)
+    print(f"{'scenario':<36} {'ms':>9}")
+    for result in results:
+        ms = f"{result['ms']:.1f}" if result["ms"] is not None else "skipped"
+        print(f"{result['name']:<36} {ms:>9}")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"root": args.root, "python": sys.version.split()[0], "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Synthetic resume corpus generator for benchmarks.
+
+Resumes are built from skills_lexicon.json and role_library.json with a
+controlled length and skill density, and written as minimal but valid PDF
+and DOCX files. Output is byte-for-byte reproducible for a given seed.
+
+Usage:
+    python -m benchmarks.corpus --out ./synthetic_resumes --count 1000
+"""
+import argparse
+import io
+import json
+import random
+import zipfile
+from pathlib import Path
+from typing import List, Tuple
+from xml.sax.saxutils import escape
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+FILLER_WORDS = [
+    "experience", "team", "project", "built", "led", "using", "with", "and",
+    "years", "delivered", "designed", "improved", "customers", "platform",
+    "services", "reduced", "latency", "owned", "migrated", "production",
+    "mentored", "engineers", "launched", "features", "across", "the", "for"
+]
+SECTION_TITLES = ["Summary", "Experience", "Projects", "Education", "Skills"]
+WORDS_PER_LINE = 12
+LINES_PER_PAGE = 45
+
+# Fixed timestamp so generated DOCX archives are reproducible
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def load_data() -> Tuple[List[str], List[dict]]:
+    """Load the skills lexicon and role library shipped with the app."""
+    with open(DATA_DIR / "skills_lexicon.json", 'r') as f:
+        skills = json.load(f)["skills"]
+    with open(DATA_DIR / "role_library.json", 'r') as f:
+        roles = json.load(f)["roles"]
+    return skills, roles
+
+
+def resume_lines(
+    rng: random.Random,
+    skills: List[str],
+    roles: List[dict],
+    words: int = 600,
+    skill_density: float = 0.05
+) -> List[str]:
+    """
+    Text lines of one synthetic resume.
+    
+    About half of the skills come from a randomly chosen role, so role
+    suggestions have something to find; the rest are drawn from the lexicon.
+    
+    Args:
+        rng: Random generator
+        skills: Skills lexicon
+        roles: Role definitions
+        words: Approximate number of filler words
+        skill_density: Skill mentions per filler word
+        
+    Returns:
+        List of text lines including section headings
+    """
+    n_skills = max(1, int(words * skill_density))
+    picked = []
+    if roles:
+        role = rng.choice(roles)
+        role_skills = role.get("required_skills", []) + role.get("preferred_skills", [])
+        picked = rng.sample(role_skills, min(len(role_skills), n_skills // 2))
+    picked += rng.sample(skills, min(len(skills), n_skills - len(picked)))
+    
+    tokens = [rng.choice(FILLER_WORDS) for _ in range(words)]
+    for skill in picked:
+        tokens.insert(rng.randrange(len(tokens) + 1), skill + ",")
+    
+    lines = []
+    section_every = max(1, len(tokens) // (WORDS_PER_LINE * len(SECTION_TITLES)) + 1)
+    for i in range(0, len(tokens), WORDS_PER_LINE):
+        line_number = i // WORDS_PER_LINE
+        if line_number % section_every == 0:
+            lines.append(SECTION_TITLES[(line_number // section_every) % len(SECTION_TITLES)])
+        lines.append(" ".join(tokens[i:i + WORDS_PER_LINE]))
+    return lines
+
+
+def make_pdf(pages: List[List[str]]) -> bytes:
+    """
+    Write a minimal PDF with one Helvetica text line per entry.
+    
+    Args:
+        pages: Lines of text for each page
+        
+    Returns:
+        PDF file content
+    """
+    n = len(pages)
+    font_ref = 3 + 2 * n
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(n))}] /Count {n} >>"
+    ]
+    for i, lines in enumerate(pages):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_ref} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        shown = " ".join(
+            "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ") Tj T*"
+            for line in lines
+        )
+        stream = f"BT /F1 10 Tf 14 TL 40 760 Td {shown} ET".encode("latin-1", errors="replace")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        body = obj if isinstance(obj, bytes) else obj.encode("latin-1")
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def make_docx(paragraphs: List[str]) -> bytes:
+    """
+    Write a minimal DOCX with one paragraph per entry.
+    
+    Args:
+        paragraphs: Paragraph texts
+        
+    Returns:
+        DOCX file content
+    """
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(paragraph)}</w:t></w:r></w:p>'
+        for paragraph in paragraphs
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{body}</w:body></w:document>'
+    )
+    
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in [
+            ("[Content_Types].xml", _DOCX_CONTENT_TYPES),
+            ("_rels/.rels", _DOCX_RELS),
+            ("word/document.xml", document)
+        ]:
+            archive.writestr(zipfile.ZipInfo(name, _ZIP_DATE), data, compress_type=zipfile.ZIP_DEFLATED)
+    return buffer.getvalue()
+
+
+def generate_corpus(
+    count: int,
+    skills: List[str],
+    roles: List[dict],
+    seed: int = 0,
+    words: int = 600,
+    skill_density: float = 0.05,
+    pdf_ratio: float = 0.5
+) -> List[Tuple[str, bytes]]:
+    """
+    Generate synthetic resumes.
+    
+    Args:
+        count: Number of resumes
+        skills: Skills lexicon
+        roles: Role definitions
+        seed: Random seed; equal seeds give identical files
+        words: Approximate filler words per resume (controls length)
+        skill_density: Skill mentions per filler word
+        pdf_ratio: Fraction of resumes written as PDF (the rest are DOCX)
+        
+    Returns:
+        List of (filename, file bytes) pairs
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        lines = resume_lines(rng, skills, roles, words, skill_density)
+        if rng.random() < pdf_ratio:
+            pages = [lines[j:j + LINES_PER_PAGE] for j in range(0, len(lines), LINES_PER_PAGE)]
+            corpus.append((f"resume_{i:05d}.pdf", make_pdf(pages)))
+        else:
+            corpus.append((f"resume_{i:05d}.docx", make_docx(lines)))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--count", type=int, default=100, help="Number of resumes")
+    parser.add_argument("--words", type=int, default=600, help="Approximate words per resume")
+    parser.add_argument("--skill-density", type=float, default=0.05, help="Skill mentions per word")
+    parser.add_argument("--pdf-ratio", type=float, default=0.5, help="Fraction of PDF resumes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    skills, roles = load_data()
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    corpus = generate_corpus(args.count, skills, roles, args.seed, args.words, args.skill_density, args.pdf_ratio)
+    for filename, file_bytes in corpus:
+        (out_dir / filename).write_bytes(file_bytes)
+    print(f"Wrote {len(corpus)} resumes to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Reproducible benchmark suite for the screening pipeline.
+
+Times each stage and the end-to-end pipeline on synthetic corpora of
+increasing size, and skill matching at increasing lexicon sizes. Results
+are written as JSON; pass --baseline to flag regressions against an
+earlier run.
+
+Usage:
+    python -m benchmarks.suite --output benchmarks/results/latest.json
+    python -m benchmarks.suite --sizes 10,100,1000,10000 --workers 4
+    python -m benchmarks.suite --baseline benchmarks/results/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from benchmarks.bench_skill_extractor import build_lexicon
+from benchmarks.corpus import generate_corpus, load_data, resume_lines
+from utils.batch_scoring import SkillMatrix
+from utils.extraction_sandbox import ExtractionSandbox
+from utils.file_loader import iter_text_from_file
+from utils.parallel import screen_resumes_parallel
+from utils.pipeline import (
+    extract_text_and_skills, extract_text_and_skills_sandboxed, screen_resume, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+)
+from utils.role_matcher import RoleIndex
+from utils.scoring import calculate_confidence_score
+from utils.skill_extractor import CompiledLexicon
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_LEXICON_SIZES = [300, 3000, 30000]
+DEFAULT_THRESHOLD = 0.10
+JD_SKILLS = 12
+LEXICON_SAMPLE = 100
+
+
+def time_best(func: Callable[[], object], repeats: int) -> float:
+    """Best wall time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def record(name: str, seconds: float, items: int, **params) -> dict:
+    """One benchmark result row."""
+    return {
+        "name": name,
+        "params": params,
+        "items": items,
+        "seconds": round(seconds, 6),
+        "per_item_ms": round(seconds / items * 1000, 4) if items else 0.0,
+        "items_per_second": round(items / seconds, 2) if seconds else 0.0
+    }
+
+
+def result_key(result: dict) -> str:
+    """Stable identifier of a result across runs, e.g. "parse[n=100]"."""
+    params = ",".join(f"{key}={value}" for key, value in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]"
+
+
+def bench_corpus(
+    size: int,
+    skills: List[str],
+    roles: List[dict],
+    args: argparse.Namespace
+) -> List[dict]:
+    """Time every pipeline stage and the full pipeline on one corpus size."""
+    corpus = generate_corpus(size, skills, roles, args.seed, args.words, args.skill_density, args.pdf_ratio)
+    lexicon = CompiledLexicon(skills)
+    role_index = RoleIndex(roles)
+    jd_skills = random.Random(args.seed).sample(skills, JD_SKILLS)
+    repeats = args.repeat if size <= 1000 else 1
+    n = len(corpus)
+    results = []
+    
+    def parse(files):
+        return ["\n".join(iter_text_from_file(data, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS)).strip() for _, data in files]
+    
+    texts = parse(corpus)
+    results.append(record("parse", time_best(lambda: parse(corpus), repeats), n, n=size))
+    # PDF parsing costs far more than DOCX, so report each format on its own too
+    for file_format in ("pdf", "docx"):
+        files = [item for item in corpus if item[0].endswith("." + file_format)]
+        if files:
+            results.append(record("parse", time_best(lambda: parse(files), repeats), len(files), n=size, format=file_format))
+    
+    results.append(record("skills", time_best(lambda: [lexicon.find(text) for text in texts], repeats), n, n=size))
+    
+    results.append(record("extract", time_best(
+        lambda: [extract_text_and_skills(data, lexicon) for _, data in corpus], repeats
+    ), n, n=size))
+    
+    # Same work through a warm sandbox worker: the cost of shipping files and text over a pipe
+    sandbox = ExtractionSandbox(1)
+    sandbox.extract_text(corpus[0][1])
+    results.append(record("extract_sandboxed", time_best(
+        lambda: [extract_text_and_skills_sandboxed(data, lexicon, sandbox) for _, data in corpus], repeats
+    ), n, n=size))
+    sandbox.close()
+    
+    candidate_skills = [lexicon.find(text) for text in texts]
+    results.append(record("scoring", time_best(
+        lambda: [calculate_confidence_score(resume_skills, jd_skills) for resume_skills in candidate_skills], repeats
+    ), n, n=size))
+    
+    def batch_scoring():
+        matrix = SkillMatrix()
+        matrix.extend(candidate_skills)
+        return matrix.score(jd_skills).results()
+    
+    results.append(record("batch_scoring", time_best(batch_scoring, repeats), n, n=size))
+    
+    results.append(record("roles", time_best(
+        lambda: [role_index.find_alternate_roles(resume_skills) for resume_skills in candidate_skills], repeats
+    ), n, n=size))
+    
+    results.append(record("end_to_end", time_best(
+        lambda: [screen_resume(data, filename, lexicon, jd_skills, role_index) for filename, data in corpus], repeats
+    ), n, n=size))
+    
+    if args.workers > 1:
+        # Pool start-up is included; it is part of what a batch run pays
+        def parallel():
+            return list(screen_resumes_parallel(
+                corpus,
+                jd_skills,
+                DATA_DIR / "skills_lexicon.json",
+                DATA_DIR / "role_library.json",
+                max_workers=args.workers,
+                chunk_size=args.chunk_size
+            ))
+        
+        results.append(record("end_to_end_parallel", time_best(parallel, 1), n, n=size, workers=args.workers))
+    
+    return results
+
+
+def bench_lexicon(size: int, skills: List[str], roles: List[dict], args: argparse.Namespace) -> List[dict]:
+    """Time lexicon compilation and matching at one lexicon size."""
+    rng = random.Random(args.seed)
+    lexicon_skills = build_lexicon(skills, size, rng)
+    texts = [
+        "\n".join(resume_lines(rng, lexicon_skills, roles, args.words, args.skill_density))
+        for _ in range(LEXICON_SAMPLE)
+    ]
+    
+    compile_time = time_best(lambda: CompiledLexicon(lexicon_skills), args.repeat)
+    lexicon = CompiledLexicon(lexicon_skills)
+    find_time = time_best(lambda: [lexicon.find(text) for text in texts], args.repeat)
+    return [
+        record("lexicon_compile", compile_time, 1, lexicon=size),
+        record("lexicon_find", find_time, len(texts), lexicon=size)
+    ]
+
+
+def environment() -> dict:
+    """Details needed to judge whether two runs are comparable."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).resolve().parent, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> List[dict]:
+    """
+    Compare per-item times with a baseline run.
+    
+    Args:
+        results: Result rows of this run
+        baseline: Result rows of the baseline run
+        threshold: Relative slowdown flagged as a regression (0.10 = 10%)
+        
+    Returns:
+        One row per benchmark present in both runs with key, baseline_ms,
+        current_ms, change and regression
+    """
+    baseline_by_key = {result_key(result): result for result in baseline}
+    rows = []
+    for result in results:
+        key = result_key(result)
+        previous = baseline_by_key.get(key)
+        if not previous or not previous["per_item_ms"]:
+            continue
+        change = result["per_item_ms"] / previous["per_item_ms"] - 1
+        rows.append({
+            "key": key,
+            "baseline_ms": previous["per_item_ms"],
+            "current_ms": result["per_item_ms"],
+            "change": round(change, 4),
+            "regression": change > threshold
+        })
+    return rows
+
+
+def print_results(results: List[dict]):
+    print(f"{'benchmark':<40} {'items':>7} {'total s':>9} {'per item ms':>12} {'items/s':>10}")
+    for result in results:
+        print(
+            f"{result_key(result):<40} {result['items']:>7} {result['seconds']:>9.3f} "
+            f"{result['per_item_ms']:>12.4f} {result['items_per_second']:>10.1f}"
+        )
+
+
+def print_comparison(rows: List[dict]):
+    print(f"\n{'benchmark':<40} {'baseline ms':>12} {'current ms':>11} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['key']:<40} {row['baseline_ms']:>12.4f} {row['current_ms']:>11.4f} {row['change']:>+8.1%}{flag}")
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="Screening pipeline benchmarks")
+    parser.add_argument("--sizes", type=_int_list, default=DEFAULT_SIZES, help="Corpus sizes, e.g. 10,100,1000,10000")
+    parser.add_argument("--lexicon-sizes", type=_int_list, default=DEFAULT_LEXICON_SIZES, help="Lexicon sizes")
+    parser.add_argument("--words", type=int, default=600, help="Approximate words per synthetic resume")
+    parser.add_argument("--skill-density", type=float, default=0.05, help="Skill mentions per word")
+    parser.add_argument("--pdf-ratio", type=float, default=0.5, help="Fraction of PDF resumes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the best is kept")
+    parser.add_argument("--workers", type=int, default=1, help="Also time the process pool with this many workers")
+    parser.add_argument("--chunk-size", type=int, default=4)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "latest.json"), help="JSON results file")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Regression threshold (0.10 = 10%%)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    skills, roles = load_data()
+    
+    results = []
+    for size in args.sizes:
+        print(f"Corpus of {size} resumes...", file=sys.stderr)
+        results.extend(bench_corpus(size, skills, roles, args))
+    for size in args.lexicon_sizes:
+        print(f"Lexicon of {size} skills...", file=sys.stderr)
+        results.extend(bench_lexicon(size, skills, roles, args))
+    
+    print_results(results)
+    
+    report = {
+        "environment": environment(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "results": results
+    }
+    
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline["results"], args.threshold)
+        report["comparison"] = {"baseline": args.baseline, "threshold": args.threshold, "rows": rows}
+        print_comparison(rows)
+        regressions = [row for row in rows if row["regression"]]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}", file=sys.stderr)
+            exit_code = 1
+    
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {output}", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
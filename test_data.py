@@ -56,6 +56,26 @@ def test_skill_extraction():
         print(f"❌ Error: {e}")
         return False
 
+def test_symbol_skills():
+    """Test compiled matching of symbol-edged skills."""
+    print("\nTesting compiled lexicon matching...")
+    try:
+        from utils.skill_extractor import CompiledLexicon, extract_skills
+        
+        lexicon = CompiledLexicon.from_file('data/skills_lexicon.json')
+        
+        test_text = "Backend work in C++, C# and ASP.NET. Also Node.js and CI/CD. Not Java-script or Gopher."
+        extracted = extract_skills(test_text, lexicon)
+        expected = {"C++", "C#", "ASP.NET", "Node.js", "CI/CD"}
+        assert expected.issubset(extracted), f"missing {expected - set(extracted)}"
+        assert "Go" not in extracted
+        assert extracted == extract_skills(test_text, lexicon.skills)
+        print(f"✅ Symbol-edged skills found: {', '.join(extracted)}")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_scoring():
     """Test confidence scoring."""
     print("\nTesting confidence scoring...")
@@ -75,6 +95,286 @@ def test_scoring():
         print(f"❌ Error: {e}")
         return False
 
+def test_batch_scoring():
+    """Test vectorized scoring matches per-candidate scoring."""
+    print("\nTesting batch scoring...")
+    try:
+        from utils.batch_scoring import score_candidates
+        from utils.scoring import calculate_confidence_score
+        
+        candidates = [
+            ["Python", "JavaScript", "React", "SQL", "Git"],
+            ["python", "Docker", "AWS", "Kafka"],
+            [],
+        ]
+        jd_skills = ["Python", "JavaScript", "React", "Docker", "AWS", "Kafka"]
+        
+        results = score_candidates(candidates, jd_skills)
+        expected = [calculate_confidence_score(c, jd_skills) for c in candidates]
+        assert results == expected, "batch results differ from calculate_confidence_score"
+        print(f"✅ Batch confidences: {[r['confidence'] for r in results]}")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_extraction_cache():
+    """Test the extraction cache stays within its size bound and shares counters."""
+    print("\nTesting extraction cache...")
+    try:
+        import sqlite3
+        import tempfile
+        from pathlib import Path
+        from utils.extraction_cache import ExtractionCache
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / "extraction.sqlite3")
+            cache = ExtractionCache(db_path, max_bytes=1000)
+            for i in range(30):
+                cache.put_text(f"key{i}", "x" * 100)
+            cache.put_text("key29", "y" * 50)
+            assert cache.get_text("key0") is None and cache.get_text("key29") == "y" * 50
+            
+            other = ExtractionCache(db_path, max_bytes=1000)
+            cache.close()
+            stats = other.stats()
+            with sqlite3.connect(db_path) as conn:
+                size = conn.execute("SELECT SUM(size) FROM extractions").fetchone()[0]
+        assert stats["size_bytes"] == size <= 1000, f"running total {stats['size_bytes']}, stored {size}"
+        assert stats["hits"] == 1 and stats["misses"] == 1, stats
+        print(f"✅ {stats['entries']} entries kept in {stats['size_bytes']} bytes")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_jd_cache():
+    """Test parsed JDs are reused across whitespace/case variants and restarts."""
+    print("\nTesting JD cache...")
+    try:
+        import tempfile
+        from utils.jd_cache import JDCache
+        from utils.jd_parser import parse_job_description
+        from utils.skill_extractor import CompiledLexicon
+        
+        lexicon = CompiledLexicon.from_file('data/skills_lexicon.json')
+        jd_text = "Senior Engineer\n\nWe need Python, Docker and AWS.\nKubernetes is a plus."
+        variant = "  senior engineer we NEED python,   docker and aws.\r\n\tkubernetes is a plus.  "
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "jd_cache.sqlite3"
+            cache = JDCache(max_entries=2, db_path=db_path)
+            first = cache.parse(jd_text, lexicon)
+            assert first == parse_job_description(jd_text, lexicon), "cached parse differs from parse_job_description"
+            second = cache.parse(variant, lexicon)
+            assert second["jd_required_skills"] == first["jd_required_skills"], "variant parsed differently"
+            assert second["jd_text"] == variant, "cache returned another caller's JD text"
+            
+            cache.parse("Go and Rust", lexicon)
+            cache.parse("Java", lexicon)
+            stats = cache.stats()
+            assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (1, 3, 1, 2), stats
+            
+            # A new process on the same database starts warm
+            restarted = JDCache(max_entries=2, db_path=db_path)
+            assert restarted.parse("java", lexicon)["jd_required_skills"] == ["Java"]
+            assert restarted.stats()["disk_hits"] == 1, restarted.stats()
+            
+            expiring = JDCache(ttl=0)
+            expiring.parse(jd_text, lexicon)
+            expiring.parse(jd_text, lexicon)
+            assert expiring.stats()["misses"] == 2, "expired entry was reused"
+        
+        print(f"✅ {first['total_jd_skills']} JD skills reused across variants ({stats['hit_rate']:.0%} hit rate)")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_multi_jd():
+    """Test scoring against several JDs matches one-at-a-time scoring and picks the best."""
+    print("\nTesting multi-JD scoring...")
+    try:
+        from utils.jd_parser import parse_job_description
+        from utils.multi_jd import score_multi_jd, split_job_descriptions
+        from utils.scoring import calculate_confidence_score
+        
+        with open('data/skills_lexicon.json', 'r') as f:
+            skills_lexicon = json.load(f)['skills']
+        
+        pasted = (
+            "Backend Engineer\nPython, SQL and Docker\n---\n"
+            "Data Scientist\nPython and Machine Learning\n  ---  \n"
+            "Backend Engineer\nGo and Kubernetes\n"
+        )
+        jd_texts = split_job_descriptions(pasted)
+        assert len(jd_texts) == 3
+        candidates = [
+            ("ana.pdf", ["Python", "SQL", "Docker"]),
+            ("ben.pdf", ["Python", "Machine Learning"]),
+            ("cy.pdf", ["Excel"]),
+        ]
+        result = score_multi_jd(candidates, jd_texts, skills_lexicon)
+        assert result.titles == ["Backend Engineer", "Data Scientist", "Backend Engineer (2)"]
+        
+        for row, (_, skills) in enumerate(candidates):
+            for jd, jd_text in enumerate(jd_texts):
+                expected = calculate_confidence_score(
+                    skills, parse_job_description(jd_text, skills_lexicon)["jd_required_skills"]
+                )
+                assert result.match(row, jd) == expected
+                assert result.confidence[row, jd] == expected["confidence"]
+        
+        assignments = result.assignments()
+        assert [a["best_jd"] for a in assignments[:2]] == ["Backend Engineer", "Data Scientist"]
+        # No JD fits: the tie goes to the first JD listed
+        assert assignments[2]["best_jd"] == "Backend Engineer" and assignments[2]["recommendation"] == "Not now"
+        print(f"✅ {len(candidates)} candidates x {len(jd_texts)} JDs agree with single-JD scoring")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_screening_session():
+    """Test a screening session reports what changed between runs and reuses its JD parse."""
+    print("\nTesting screening session...")
+    try:
+        from utils.session_cache import ScreeningSession
+        from utils.skill_extractor import CompiledLexicon
+        
+        with open('data/skills_lexicon.json', 'r') as f:
+            skills_lexicon = json.load(f)['skills']
+        lexicon = CompiledLexicon(skills_lexicon)
+        smaller = CompiledLexicon(skills_lexicon[:-1])
+        
+        session = ScreeningSession()
+        a, b, c = (ScreeningSession.file_key(data, lexicon, 20, None) for data in (b"a", b"b", b"c"))
+        first = session.changes("Python", lexicon, [a, b, a])
+        assert first["first_run"] and first["files_added"] == 2
+        for key in (a, b):
+            session.put_extraction(key, {"raw_text_length": 1})
+        session.finish_run("Python", lexicon, [a, b])
+        
+        assert session.changes("Python", lexicon, [a, b]) == {
+            "first_run": False, "jd_changed": False, "lexicon_changed": False, "files_added": 0, "files_removed": 0
+        }
+        swapped = session.changes("Python and SQL", lexicon, [a, c])
+        assert swapped["jd_changed"] and swapped["files_added"] == 1 and swapped["files_removed"] == 1
+        # Same files under a new lexicon: not re-uploads, but the lexicon changed
+        relexed = [ScreeningSession.file_key(data, smaller, 20, None) for data in (b"a", b"b")]
+        changed = session.changes("Python", smaller, relexed)
+        assert changed["lexicon_changed"] and changed["files_added"] == changed["files_removed"] == 0
+        assert ScreeningSession.file_key(b"a", lexicon, 10, None) != a, "budgets not part of the key"
+        
+        session.finish_run("Python", lexicon, [a])
+        assert session.get_extraction(a) and session.get_extraction(b) is None, "removed file still remembered"
+        _, reused = session.parse_jd("Python", lexicon)
+        _, reused_again = session.parse_jd("Python", lexicon)
+        assert not reused and reused_again
+        print("✅ Added, removed, JD and lexicon changes detected")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_metrics():
+    """Test stage metrics merge across registries and export as Prometheus text and JSON."""
+    print("\nTesting metrics export...")
+    try:
+        from utils import metrics
+        
+        worker = metrics.MetricsRegistry()
+        worker.observe("parse", 0.003, "pdf")
+        worker.observe("parse", 0.2, "pdf")
+        worker.count("files", 2, "pdf")
+        worker.count("bytes", 1.5)
+        worker.record_file("slow.pdf", "pdf", 0.2)
+        delta = worker.snapshot(reset=True)
+        assert worker.snapshot()["stages"] == [], "snapshot(reset=True) kept data"
+        
+        registry = metrics.MetricsRegistry()
+        registry.observe("parse", 40.0, "pdf")
+        registry.merge(json.loads(json.dumps(delta)))
+        [summary] = registry.summary()
+        assert summary["count"] == 3 and summary["max_ms"] == 40000.0 and summary["p50_ms"] == 250.0, summary
+        
+        text = registry.to_prometheus()
+        lines = text.splitlines()
+        assert text.endswith("\n") and "# TYPE rolematrix_stage_seconds histogram" in lines
+        assert 'rolematrix_stage_seconds_bucket{stage="parse",file_type="pdf",le="0.005"} 1' in lines
+        assert 'rolematrix_stage_seconds_bucket{stage="parse",file_type="pdf",le="+Inf"} 3' in lines
+        assert 'rolematrix_stage_seconds_count{stage="parse",file_type="pdf"} 3' in lines
+        assert 'rolematrix_files_total{file_type="pdf"} 2' in lines and "rolematrix_bytes_total{} 1.5" in lines
+        
+        exported = json.loads(registry.to_json())
+        assert exported["bucket_bounds"] == list(metrics.BUCKETS)
+        assert exported["slow_files"][0]["filename"] == "slow.pdf"
+        
+        # Disabled collection records nothing in the process-wide registry
+        was_enabled = metrics.is_enabled()
+        metrics.enable(False)
+        try:
+            before = metrics.REGISTRY.snapshot()
+            with metrics.span("parse", "pdf"):
+                metrics.count("files")
+            assert metrics.REGISTRY.snapshot() == before
+        finally:
+            metrics.enable(was_enabled)
+        print(f"✅ {len(lines)} Prometheus lines exported from merged registries")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_data_artifact():
+    """Test the screening data artifact is reused while fresh and rebuilt when its sources change."""
+    print("\nTesting screening data artifact...")
+    try:
+        import shutil
+        import tempfile
+        from utils.data_artifact import load_screening_data, read_artifact, source_hash
+        from utils.skill_extractor import extract_skills
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            lexicon_path = str(Path(tmp) / "skills_lexicon.json")
+            roles_path = str(Path(tmp) / "role_library.json")
+            artifact_path = Path(tmp) / "screening.artifact"
+            shutil.copy('data/skills_lexicon.json', lexicon_path)
+            shutil.copy('data/role_library.json', roles_path)
+            
+            built = load_screening_data(lexicon_path, roles_path, str(artifact_path))
+            assert artifact_path.exists(), "artifact not written"
+            written = artifact_path.stat().st_mtime_ns
+            reused = load_screening_data(lexicon_path, roles_path, str(artifact_path))
+            assert artifact_path.stat().st_mtime_ns == written, "fresh artifact was rewritten"
+            assert reused.source_hash == built.source_hash and reused.skills == built.skills
+            
+            # Editing either source invalidates the stored hash
+            with open(lexicon_path, 'r') as f:
+                lexicon = json.load(f)
+            lexicon["skills"].append("Artifactology")
+            with open(lexicon_path, 'w') as f:
+                json.dump(lexicon, f)
+            new_hash = source_hash(lexicon_path, roles_path)
+            assert read_artifact(str(artifact_path), new_hash) is None, "stale artifact accepted"
+            rebuilt = load_screening_data(lexicon_path, roles_path, str(artifact_path))
+            assert "Artifactology" in rebuilt.skills and rebuilt.source_hash == new_hash
+            assert "Artifactology" in extract_skills("Expert in Artifactology.", rebuilt.lexicon)
+            
+            with open(roles_path, 'a') as f:
+                f.write("\n")
+            assert read_artifact(str(artifact_path), source_hash(lexicon_path, roles_path)) is None
+            
+            # A corrupt artifact is rebuilt rather than raising
+            artifact_path.write_bytes(b"not an artifact")
+            recovered = load_screening_data(lexicon_path, roles_path, str(artifact_path))
+            assert read_artifact(str(artifact_path), recovered.source_hash) is not None
+        print(f"✅ Artifact reused while fresh, rebuilt for {len(rebuilt.skills)} skills after an edit")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_role_matching():
     """Test alternate role matching."""
     print("\nTesting alternate role matching...")
@@ -87,6 +387,11 @@ def test_role_matching():
         resume_skills = ["Python", "SQL", "Machine Learning", "Pandas", "NumPy", "TensorFlow"]
         
         matches = find_alternate_roles(resume_skills, roles, min_score=0.5, top_n=3)
+        
+        # 7/0.07 is just under 100 in floats; the 100-skill role still scores exactly 0.07
+        wide_role = {"role_id": "wide", "role_name": "Wide", "required_skills": [f"skill {i}" for i in range(100)]}
+        edge = find_alternate_roles([f"skill {i}" for i in range(7)], [wide_role], min_score=0.07)
+        assert [match["role_id"] for match in edge] == ["wide"], "role pruned below its exact score"
         print(f"✅ Found {len(matches)} matching roles")
         for match in matches:
             print(f"  - {match['role_name']}: {match['role_score']}% match")
@@ -95,6 +400,473 @@ def test_role_matching():
         print(f"❌ Error: {e}")
         return False
 
+def test_role_fit():
+    """Test batched role fit ranks every role by required and preferred skills."""
+    print("\nTesting role fit...")
+    try:
+        from utils.role_fit import RoleFitMatrix
+        
+        with open('data/role_library.json', 'r') as f:
+            roles = json.load(f)['roles']
+        
+        role = roles[0]
+        required_only = role['required_skills'][:2]
+        with_preferred = required_only + [s.upper() for s in role['preferred_skills'][:2]]
+        candidates = [required_only, with_preferred, [], ["Python", "SQL", "Machine Learning", "Pandas"]]
+        
+        matrix = RoleFitMatrix(roles, required_weight=1.0, preferred_weight=0.5)
+        fits = matrix.fit_scores(candidates)
+        assert fits.shape == (len(candidates), len(roles)), f"shape {fits.shape}"
+        
+        # Brute force: weighted share of each role's skills the candidate has
+        for candidate, row in zip(candidates, fits):
+            have = {s.lower() for s in candidate}
+            for r, fit in zip(roles, row):
+                required = {s.lower() for s in r['required_skills']}
+                preferred = {s.lower() for s in r['preferred_skills']} - required
+                expected = (len(required & have) + 0.5 * len(preferred & have)) / (len(required) + 0.5 * len(preferred))
+                assert abs(fit - expected) < 1e-9, f"{r['role_id']}: {fit} != {expected}"
+        assert fits[1][0] > fits[0][0], "preferred skills did not raise the fit"
+        
+        ranked = matrix.role_fits(candidates, top_n=3)
+        assert ranked[2] == [], "a candidate without skills got role fits"
+        top = ranked[1][0]
+        assert top['role_id'] == role['role_id'], f"best fit {top['role_id']}"
+        assert len(top['preferred_matched']) == 2 and top['preferred_matched'][0].isupper(), top
+        scores = [fit['fit_score'] for fit in ranked[3]]
+        assert scores == sorted(scores, reverse=True), f"fits out of order: {scores}"
+        print(f"✅ Best fit {top['role_name']} ({top['fit_score']}%), ranked {len(roles)} roles per candidate")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_candidate_search():
+    """Test boolean skill queries and JD ranking over the candidate index."""
+    print("\nTesting candidate search...")
+    try:
+        from utils.candidate_index import CandidateIndex
+        from utils.scoring import calculate_confidence_score
+        
+        candidates = {
+            "ana": ["Kubernetes", "Go", "AWS"],
+            "ben": ["Kubernetes", "Go", "GCP", "Machine Learning"],
+            "cy": ["Python", "AWS"],
+            "di": ["Go"],
+        }
+        index = CandidateIndex()
+        for candidate_id, skills in candidates.items():
+            index.add_profile({"candidate_id": candidate_id, "filename": f"{candidate_id}.pdf", "extracted_skills": skills})
+        
+        assert index.search("kubernetes AND go AND (AWS OR GCP)") == ["ana", "ben"]
+        # AND binds tighter than OR
+        assert index.search("Python OR Kubernetes AND GCP") == ["ben", "cy"]
+        assert index.search("Go AND NOT (AWS OR GCP)") == ["di"]
+        assert index.search("NOT Go") == ["cy"]
+        assert index.search("machine learning") == ["ben"]
+        assert index.search("Rust") == [] and index.search("Go", limit=2) == ["ana", "ben"]
+        for malformed in ("", "Go AND", "(Go OR AWS", "Go AWS)", "OR Go"):
+            try:
+                index.search(malformed)
+                raise AssertionError(f"malformed query {malformed!r} accepted")
+            except ValueError:
+                pass
+        
+        jd_skills = ["Go", "AWS", "Python"]
+        top = index.top_matches(jd_skills, k=3)
+        expected = sorted(
+            candidates, key=lambda c: -calculate_confidence_score(candidates[c], jd_skills)["confidence"]
+        )[:3]
+        assert [match["candidate_id"] for match in top] == expected
+        assert all(
+            match["jd_match"] == calculate_confidence_score(candidates[match["candidate_id"]], jd_skills)
+            for match in top
+        )
+        print(f"✅ Boolean queries and ranking agree; top match {top[0]['candidate_id']}")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_candidate_profile():
+    """Test compact profiles round-trip to the profile dictionary."""
+    print("\nTesting compact candidate profiles...")
+    try:
+        from utils.candidate_profile import CandidateProfile, SkillVocabulary, dump_profiles, load_profiles
+        from utils.pipeline import build_profile, summarize_extraction
+        
+        with open('data/role_library.json', 'r') as f:
+            roles = json.load(f)['roles']
+        
+        jd_skills = ["Python", "python", "Docker", "AWS", "Kafka"]
+        candidates = [
+            ("a.pdf", ["Python", "SQL", "Machine Learning", "Pandas"], jd_skills),
+            ("b.docx", ["Docker", "AWS", "Kafka", "Python"], jd_skills),
+            ("c.docx", [], [])
+        ]
+        profiles = [
+            build_profile(filename, summarize_extraction("text", skills), jd, roles)
+            for filename, skills, jd in candidates
+        ]
+        
+        vocabulary = SkillVocabulary(["Python", "Docker"])
+        compact = [
+            CandidateProfile.from_dict(profile, vocabulary, jd)
+            for profile, (_, _, jd) in zip(profiles, candidates)
+        ]
+        assert [c.to_dict() for c in compact] == profiles, "to_dict differs from the original profile"
+        assert compact[0].jd_skills is compact[1].jd_skills, "JD skills are not shared"
+        assert [c.to_dict() for c in load_profiles(dump_profiles(compact))] == profiles, "binary round-trip differs"
+        
+        # Without the JD list the profile is still reproduced exactly
+        rebuilt = [CandidateProfile.from_dict(p, SkillVocabulary()) for p in profiles]
+        assert [c.to_dict() for c in load_profiles(dump_profiles(rebuilt))] == profiles
+        print(f"✅ Round-tripped {len(profiles)} profiles ({len(dump_profiles(compact))} bytes)")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_results_view():
+    """Test the results table filters, sorts and pages server-side."""
+    print("\nTesting results view...")
+    try:
+        from utils.candidate_profile import CandidateProfile, SkillVocabulary
+        from utils.pipeline import build_profile, summarize_extraction
+        from utils.role_fit import rank_role_fits
+        from utils.results_view import build_results_frame, filter_results, page_count, results_page
+        
+        with open('data/role_library.json', 'r') as f:
+            roles = json.load(f)['roles']
+        
+        jd_skills = ["Python", "Docker", "AWS", "Kafka"]
+        skill_sets = [["Python"], ["Python", "Docker", "AWS"], [], ["Python", "Docker", "AWS", "Kafka"], ["Docker"]]
+        vocabulary = SkillVocabulary()
+        results = [
+            CandidateProfile.from_dict(
+                build_profile(f"r{i}.pdf", summarize_extraction("text", skills), jd_skills, roles), vocabulary, jd_skills
+            )
+            for i, skills in enumerate(skill_sets)
+        ]
+        frame = build_results_frame(results, rank_role_fits(skill_sets, roles))
+        assert frame["confidence"].tolist() == [c.confidence for c in results], "confidence column differs"
+        
+        # Descending confidence, screening order among ties
+        ordered = filter_results(frame)
+        assert ordered.index.tolist() == [3, 1, 0, 4, 2], ordered.index.tolist()
+        maybe_or_worse = filter_results(frame, ["Maybe", "Not now"], min_confidence=20, sort_by="candidate", descending=False)
+        assert maybe_or_worse["candidate"].tolist() == ["r0.pdf", "r4.pdf"], maybe_or_worse["candidate"].tolist()
+        by_recommendation = filter_results(frame, sort_by="recommendation", descending=False)
+        assert by_recommendation["recommendation"].iloc[0] == "Interview", "recommendations not in rank order"
+        
+        assert page_count(len(ordered), 2) == 3 and page_count(0, 2) == 1
+        assert results_page(ordered, 3, 2).index.tolist() == [2], "last page differs"
+        assert results_page(ordered, 9, 2).index.tolist() == [2], "page past the end was not clamped"
+        print(f"✅ {len(frame)} candidates filtered, sorted and paged")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_profile_store():
+    """Test the SQLite profile store batches writes, filters queries and migrates JSON profiles."""
+    print("\nTesting profile store...")
+    try:
+        import sqlite3
+        import tempfile
+        from pathlib import Path
+        from utils.profile_store import DirectoryProfileStore, SQLiteProfileStore, migrate_profiles
+        
+        profiles = [
+            {
+                "candidate_id": f"candidate_{i}",
+                "filename": f"{name}.pdf",
+                "timestamp": f"2024-01-0{i + 1}T09:00:00",
+                "extracted_skills": ["Python"],
+                "jd_match": {"recommendation": recommendation, "confidence": confidence}
+            }
+            for i, (name, recommendation, confidence) in enumerate([
+                ("zoe", "Interview", 80), ("adam", "Not now", 20), ("mia", "Maybe", 60), ("bob", "Interview", 90)
+            ])
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / "profiles.sqlite3")
+            store = SQLiteProfileStore(db_path, batch_size=3)
+            for profile in profiles[:2]:
+                store.save(profile)
+            with sqlite3.connect(db_path) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0] == 0, "written before the batch filled"
+            for profile in profiles[2:]:
+                store.save(profile)
+            with sqlite3.connect(db_path) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0] == 3
+            
+            interview = store.query(recommendation="Interview")
+            assert [p["candidate_id"] for p in interview] == ["candidate_3", "candidate_0"]
+            ranged = store.query(min_confidence=50, max_confidence=85, newest_first=False)
+            assert [p["candidate_id"] for p in ranged] == ["candidate_0", "candidate_2"]
+            window = store.query(since="2024-01-02", until="2024-01-04", limit=1)
+            assert [p["candidate_id"] for p in window] == ["candidate_2"]
+            assert store.query(filename="adam.pdf")[0]["candidate_id"] == "candidate_1"
+            store.close()
+            
+            # JSON profiles migrate in the order they were saved, not by file name
+            directory = DirectoryProfileStore(str(Path(tmp) / "profiles"))
+            for profile in profiles:
+                directory.save(profile)
+            with SQLiteProfileStore(str(Path(tmp) / "migrated.sqlite3")) as migrated:
+                assert migrate_profiles(directory, migrated) == 4
+                order = [candidate_id for candidate_id, _, _ in migrated.iter_skills()]
+        assert order == [p["candidate_id"] for p in profiles], order
+        print(f"✅ Batched writes, {len(interview)} filtered matches, {len(order)} profiles migrated in order")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_near_duplicates():
+    """Test near-duplicate resumes are linked and distinct ones are not."""
+    print("\nTesting near-duplicate detection...")
+    try:
+        from utils.near_duplicates import NearDuplicateIndex, content_key
+        
+        words = [f"word{i}" for i in range(400)]
+        original = " ".join(words)
+        edited = " ".join(words[:200] + ["changed"] + words[201:])
+        other = " ".join(reversed(words))
+        
+        index = NearDuplicateIndex(":memory:", 0.8)
+        index.add("a", index.signature(original), content_key(original.encode()))
+        assert index.find_exact(content_key(original.encode())) == "a", "exact copy not found"
+        match = index.find(index.signature(edited))
+        assert match and match[0] == "a" and match[1] >= 0.8, f"edited copy not linked: {match}"
+        assert index.find(index.signature(other)) is None, "distinct text linked"
+        assert index.signature("") is None
+        print(f"✅ Edited copy linked at {match[1]:.2f} similarity")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_extraction_sandbox():
+    """Test sandboxed extraction matches in-process and enforces its budgets."""
+    print("\nTesting sandboxed extraction...")
+    try:
+        from benchmarks.corpus import make_docx, make_pdf
+        from utils.extraction_sandbox import ExtractionSandbox, ExtractionError
+        from utils.file_loader import extract_text_from_file
+        
+        docx_bytes = make_docx(["Senior Engineer", "Python, SQL and Docker"])
+        sandbox = ExtractionSandbox(1, timeout=0.2)
+        try:
+            assert sandbox.extract_text(docx_bytes) == extract_text_from_file(docx_bytes), "text differs from in-process"
+            
+            slow_pdf = make_pdf([[f"line {i} of page {page}" for i in range(60)] for page in range(300)])
+            try:
+                sandbox.extract_text(slow_pdf)
+                raise AssertionError("slow PDF was not stopped")
+            except ExtractionError as e:
+                reason = str(e)
+            
+            # The worker is replaced and later files still go through
+            assert sandbox.extract_text(docx_bytes) == extract_text_from_file(docx_bytes)
+            assert sandbox.stats()["timeouts"] == 1
+        finally:
+            sandbox.close()
+        
+        # A small file that inflates far past the cap fails inside the worker
+        bomb = make_docx(["x" * (100 * 1024 * 1024)])
+        sandbox = ExtractionSandbox(1, timeout=None, max_memory_mb=64)
+        try:
+            try:
+                sandbox.extract_text(bomb)
+                raise AssertionError("memory cap was not enforced")
+            except ExtractionError as e:
+                assert "out of memory" in str(e), str(e)
+            assert sandbox.extract_text(docx_bytes) == extract_text_from_file(docx_bytes)
+            assert sandbox.stats()["memory"] == 1
+        finally:
+            sandbox.close()
+        print(f"✅ Slow file failed with: {reason}")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_extractors():
+    """Test every text extractor finds the same skills as the accurate one."""
+    print("\nTesting text extractors...")
+    try:
+        from benchmarks.corpus import make_docx, make_pdf
+        from utils.file_loader import extract_text_from_file, iter_text_from_file, EXTRACTOR_CHOICES
+        from utils.skill_extractor import extract_skills
+        
+        with open('data/skills_lexicon.json', 'r') as f:
+            skills_lexicon = json.load(f)['skills']
+        
+        lines = ["Jane Doe", "Skills: Python, SQL, Docker and Kubernetes", "Built Machine Learning pipelines on AWS"]
+        for file_bytes in (make_pdf([lines[:2], lines[2:]]), make_docx(lines)):
+            expected = extract_skills(extract_text_from_file(file_bytes), skills_lexicon)
+            for extractor in EXTRACTOR_CHOICES:
+                found = extract_skills(extract_text_from_file(file_bytes, extractor=extractor), skills_lexicon)
+                assert found == expected, f"{extractor} found {found}, expected {expected}"
+        
+        try:
+            iter_text_from_file(make_docx(lines), extractor="missing")
+            raise AssertionError("unknown extractor accepted")
+        except ValueError:
+            pass
+        print(f"✅ {len(EXTRACTOR_CHOICES)} extractors agree on {len(expected)} skills")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_ooxml_reader():
+    """Test the streaming DOCX reader keeps python-docx's paragraphs and adds tables and headers."""
+    print("\nTesting streaming DOCX reader...")
+    try:
+        import io
+        from docx import Document
+        from docx.enum.text import WD_BREAK
+        from utils.file_loader import DOCX_BACKENDS, extract_text_from_docx
+        
+        document = Document()
+        document.sections[0].header.paragraphs[0].text = "Jane Doe - Data Engineer"
+        paragraph = document.add_paragraph("Skills:\tPython")
+        paragraph.add_run().add_break()
+        paragraph.add_run("SQL")
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        document.add_paragraph("Built pipelines with Docker")
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Kubernetes"
+        table.cell(0, 1).text = "AWS"
+        buffer = io.BytesIO()
+        document.save(buffer)
+        
+        expected = [paragraph.text for paragraph in Document(io.BytesIO(buffer.getvalue())).paragraphs]
+        paragraphs = list(DOCX_BACKENDS["ooxml"](io.BytesIO(buffer.getvalue())))
+        remaining = iter(paragraphs)
+        assert all(text in remaining for text in expected), f"{expected} not in order in {paragraphs}"
+        for text in ("Jane Doe - Data Engineer", "Kubernetes", "AWS"):
+            assert text in paragraphs, f"{text!r} missing from {paragraphs}"
+        assert extract_text_from_docx(buffer.getvalue(), max_chars=8) == "Jane Doe"
+        print(f"✅ {len(expected)} python-docx paragraphs kept, {len(paragraphs)} read in total")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_screening_service():
+    """Test the screening service queues, rejects when full, keeps tenants apart and saves profiles."""
+    print("\nTesting screening service...")
+    try:
+        import asyncio
+        import tempfile
+        from pathlib import Path
+        from benchmarks.corpus import make_docx
+        from utils.profile_store import SQLiteProfileStore
+        from utils.service import ScreeningService, QueueFull
+        
+        files = [(f"r{i}.docx", make_docx([f"Candidate {i}", "Python, SQL and Docker"])) for i in range(3)]
+        
+        async def scenario(store_path):
+            service = ScreeningService(
+                'data/skills_lexicon.json', 'data/role_library.json', workers=1, queue_size=3, tenant_queue_size=3,
+                store_path=store_path
+            )
+            try:
+                batch = await service.submit("a", "Looking for Python and SQL", files)
+                try:
+                    await service.submit("b", "Looking for Python", files)
+                    raise AssertionError("full queue accepted a batch")
+                except QueueFull as e:
+                    assert e.retry_after >= 1
+                assert service.get_batch("b", batch.batch_id) is None, "batch visible to another tenant"
+                results = [result async for result in service.iter_results(batch)]
+                return batch, results
+            finally:
+                await service.close()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store_path = str(Path(tmp) / "profiles.sqlite3")
+            batch, results = asyncio.run(scenario(store_path))
+            with SQLiteProfileStore(store_path) as store:
+                stored = sorted(profile["filename"] for profile in store.iter_profiles())
+        assert stored == [filename for filename, _ in files], f"stored profiles: {stored}"
+        assert sorted(result["index"] for result in results) == [0, 1, 2]
+        assert all(result["profile"]["jd_match"]["confidence"] > 0 for result in results), results
+        assert batch.status()["state"] == "done" and batch.status()["screened"] == 3
+        print(f"✅ {len(results)} files screened, oversized batch rejected")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_batch_job():
+    """Test a sharded job resumes after a crash and merges each file once."""
+    print("\nTesting resumable batch jobs...")
+    try:
+        import os
+        import tempfile
+        from pathlib import Path
+        from benchmarks.corpus import make_docx
+        from utils import batch_jobs
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            resume_dir = Path(tmp) / "resumes"
+            resume_dir.mkdir()
+            for i in range(5):
+                (resume_dir / f"r{i}.docx").write_bytes(make_docx([f"Candidate {i}", "Python, SQL and Docker"]))
+            (resume_dir / "r5.docx").write_bytes((resume_dir / "r0.docx").read_bytes())
+            
+            job_dir = str(Path(tmp) / "job")
+            data_paths = {"lexicon_path": 'data/skills_lexicon.json', "roles_path": 'data/role_library.json'}
+            batch_jobs.create_job(job_dir, "Looking for Python and SQL", str(resume_dir), shard_size=2)
+            assert batch_jobs.run_worker(job_dir, **data_paths) == {"shards": 3, "files": 6}
+            summary = batch_jobs.merge_results(job_dir)
+            first = (Path(job_dir) / "results.jsonl").read_text().splitlines()
+            batch_jobs.merge_results(job_dir)
+            assert (Path(job_dir) / "results.jsonl").read_text().splitlines() == first, "merging again changed the output"
+            
+            # Crash in shard 1: not marked done, last result torn mid-line
+            checkpoint = Path(job_dir) / "shards" / "00001.jsonl"
+            (Path(job_dir) / "shards" / "00001.done").unlink()
+            content = checkpoint.read_bytes()
+            checkpoint.write_bytes(content[:content.rindex(b"\n", 0, -1) + 20])
+            assert batch_jobs.run_worker(job_dir, **data_paths) == {"shards": 1, "files": 1}
+            batch_jobs.merge_results(job_dir)
+            second = (Path(job_dir) / "results.jsonl").read_text().splitlines()
+            
+            # Two workers taking over the same stale lock: the later one wins
+            lock = Path(job_dir) / "shards" / "00000.lock"
+            lock.write_text("elsewhere:1:old")
+            os.utime(lock, (0, 0))
+            assert batch_jobs._try_claim(lock, "a", lease=60)
+            assert not batch_jobs._try_claim(lock, "b", lease=60)
+            assert batch_jobs._try_claim(lock, "b", lease=-1)
+            assert not batch_jobs._owns(lock, "a") and batch_jobs._owns(lock, "b")
+            
+            # A resume deleted after the job was created fails alone; the job still finishes
+            missing_job = str(Path(tmp) / "missing")
+            batch_jobs.create_job(missing_job, "Looking for Python and SQL", str(resume_dir), shard_size=2)
+            (resume_dir / "r2.docx").unlink()
+            assert batch_jobs.run_worker(missing_job, **data_paths) == {"shards": 3, "files": 6}
+            assert not list((Path(missing_job) / "shards").glob("*.lock")), "shard lock left behind"
+            missing = batch_jobs.merge_results(missing_job)
+            assert missing["failed"] == 1 and missing["errors"][0][0] == "r2.docx", missing
+        
+        filenames = [json.loads(line)["filename"] for line in second]
+        assert filenames == [json.loads(line)["filename"] for line in first] == [f"r{i}.docx" for i in range(6)]
+        assert json.loads(second[5])["duplicate_of"] == json.loads(second[0])["candidate_id"]
+        assert summary["screened"] == 5 and summary["duplicates"] == 1
+        print(f"✅ Resumed after a crash re-screening 1 file; {len(second)} records merged")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -105,8 +877,27 @@ def main():
         test_skills_lexicon,
         test_role_library,
         test_skill_extraction,
+        test_symbol_skills,
         test_scoring,
-        test_role_matching
+        test_batch_scoring,
+        test_extraction_cache,
+        test_jd_cache,
+        test_multi_jd,
+        test_screening_session,
+        test_metrics,
+        test_data_artifact,
+        test_role_matching,
+        test_role_fit,
+        test_candidate_search,
+        test_candidate_profile,
+        test_profile_store,
+        test_results_view,
+        test_near_duplicates,
+        test_extraction_sandbox,
+        test_extractors,
+        test_ooxml_reader,
+        test_screening_service,
+        test_batch_job
     ]
     
     results = []
@@ -0,0 +1,493 @@
+"""
+Resumable batch screening jobs sharded across processes and hosts.
+
+A job directory holds everything about one long run:
+
+    manifest.json         JD text, options and the sorted file list, fixed at creation
+    shards/00042.lock     claim on shard 42 (owner token; its mtime is the lease heartbeat)
+    shards/00042.jsonl    checkpoint: one result line per finished file
+    shards/00042.done     the shard is finished
+    results.jsonl         merged output, written once every shard is done
+
+Workers, whether processes on one machine or on several machines sharing
+the directory, claim shards by creating lock files exclusively. A lock
+whose owner has not refreshed it within the lease is taken over, so a dead
+worker's shard is finished by someone else. Each file's result is appended
+to its shard's checkpoint as soon as it is screened, and a worker picking
+up a shard skips the files already there, so rerunning a job after a crash
+resumes where it stopped.
+
+The merged output lists files in manifest order, each exactly once, with
+byte-identical resumes linked to their first copy, however many workers
+took part and however often the job was restarted.
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .data_artifact import load_screening_data
+from .extraction_cache import ExtractionCache
+from .extraction_sandbox import ExtractionSandbox
+from .file_loader import DEFAULT_EXTRACTOR, find_resumes
+from .jd_cache import parse_job_description_cached
+from .pipeline import screen_resume, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+
+JOB_VERSION = 1
+DEFAULT_SHARD_SIZE = 500
+# A claimed shard whose lock is not refreshed for this long is taken over.
+# Locks are refreshed after every file, so this only has to exceed the
+# time one file can take.
+DEFAULT_LEASE = 600.0
+
+
+def _write_atomic(path: Path, text: str):
+    """Replace a file's content in one step, so readers never see half of it."""
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def data_hash(skills: List[str], roles: List[dict]) -> str:
+    """Hash of the lexicon and role library a job must be screened with."""
+    return hashlib.sha256(json.dumps([skills, roles], sort_keys=True).encode()).hexdigest()
+
+
+def create_job(
+    job_dir: str,
+    jd_text: str,
+    resume_dir: str,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    extractor: str = DEFAULT_EXTRACTOR,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    screening_data_hash: Optional[str] = None
+) -> dict:
+    """
+    Create a job, or return the existing one in job_dir if it is the same job.
+    
+    The resume directory is listed once, here; later workers screen exactly
+    that list, so files added afterwards are not picked up.
+    
+    Args:
+        job_dir: Directory for the manifest, checkpoints and results
+        jd_text: Job description text
+        resume_dir: Directory of PDF/DOCX resumes (searched recursively)
+        shard_size: Files per shard
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        max_pages: Maximum number of PDF pages to read per file
+        max_chars: Maximum number of characters to extract per file
+        screening_data_hash: data_hash of the lexicon and roles; workers
+            with different data refuse to run
+            
+    Returns:
+        Job manifest dictionary
+        
+    Raises:
+        ValueError: If job_dir already holds a job for another JD or file list
+    """
+    job_path = Path(job_dir)
+    (job_path / "shards").mkdir(parents=True, exist_ok=True)
+    resume_path = Path(resume_dir)
+    manifest = {
+        "version": JOB_VERSION,
+        "jd_text": jd_text,
+        "resumes": str(resume_path.resolve()),
+        "files": [str(path.relative_to(resume_path)) for path in find_resumes(resume_path)],
+        "shard_size": max(1, shard_size),
+        "extractor": extractor,
+        "max_pages": max_pages,
+        "max_chars": max_chars,
+        "data_hash": screening_data_hash,
+        "created": time.time()
+    }
+    
+    # Link a complete temporary file into place: creation fails if another
+    # worker got there first, and nobody ever reads a partial manifest
+    tmp = job_path / f".manifest.{uuid.uuid4().hex}.tmp"
+    tmp.write_text(json.dumps(manifest))
+    try:
+        os.link(tmp, job_path / "manifest.json")
+        return manifest
+    except FileExistsError:
+        existing = load_job(job_dir)
+        for key in ("jd_text", "files", "shard_size", "extractor", "max_pages", "max_chars", "data_hash"):
+            if existing[key] != manifest[key]:
+                raise ValueError(f"{job_dir} already holds a different job ({key} differs)")
+        return existing
+    finally:
+        tmp.unlink()
+
+
+def load_job(job_dir: str) -> dict:
+    """
+    Read a job's manifest.
+    
+    Raises:
+        FileNotFoundError: If job_dir holds no job
+        ValueError: If the manifest was written by an incompatible version
+    """
+    with open(Path(job_dir) / "manifest.json") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != JOB_VERSION:
+        raise ValueError(f"Unsupported job version {manifest.get('version')!r}")
+    return manifest
+
+
+def shard_count(manifest: dict) -> int:
+    return -(-len(manifest["files"]) // manifest["shard_size"])
+
+
+def _shard_files(manifest: dict, shard: int) -> List[Tuple[int, str]]:
+    """(index in the job, relative path) of every file in a shard."""
+    start = shard * manifest["shard_size"]
+    return list(enumerate(manifest["files"][start:start + manifest["shard_size"]], start))
+
+
+def _shard_path(job_dir: str, shard: int, suffix: str) -> Path:
+    return Path(job_dir) / "shards" / f"{shard:05d}{suffix}"
+
+
+def _owner_is_dead(lock_path: Path) -> bool:
+    """Whether a lock was taken by a process on this machine that no longer runs."""
+    try:
+        host, pid, _ = lock_path.read_text().split(":", 2)
+        if host != socket.gethostname():
+            return False
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except (OSError, ValueError):
+        pass
+    return False
+
+
+def _try_claim(lock_path: Path, token: str, lease: float) -> bool:
+    """
+    Create a shard lock, taking over one whose owner stopped refreshing it.
+    
+    Locks of crashed workers on this machine are taken over at once; those
+    of other machines once their lease has run out. The lock is read back
+    after writing it, and the claim only stands if it still holds the token.
+    """
+    try:
+        fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - lock_path.stat().st_mtime <= lease and not _owner_is_dead(lock_path):
+                return False
+            # Two workers that both saw the lock stale can race here: the second
+            # rename may move away the lock the first just created. The later
+            # claimant wins, and the earlier one finds its token gone below (or
+            # at its next _owns check, dropping the shard); any file both
+            # checkpoint is kept once by _read_checkpoint
+            stale = lock_path.with_name(f"{lock_path.name}.stale.{uuid.uuid4().hex}")
+            os.rename(lock_path, stale)
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+    return _owns(lock_path, token)
+
+
+def _owns(lock_path: Path, token: str) -> bool:
+    """Whether the lock still names this worker (it may have been taken over)."""
+    try:
+        return lock_path.read_text() == token
+    except FileNotFoundError:
+        return False
+
+
+def _read_checkpoint(path: Path, repair: bool = False) -> Dict[int, dict]:
+    """
+    Finished files of a shard by index, ignoring a torn last line.
+    
+    A worker killed mid-write leaves a partial line; with repair (only for
+    the shard's owner) it is cut off so the next result starts on a line of
+    its own. Of repeated indices (a shard taken over from a worker that was
+    still running) the first is kept.
+    """
+    records: Dict[int, dict] = {}
+    if not path.exists():
+        return records
+    valid_bytes = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            records.setdefault(record["index"], record)
+            valid_bytes += len(line)
+    if repair and valid_bytes < path.stat().st_size:
+        os.truncate(path, valid_bytes)
+    return records
+
+
+def _iter_records(job_dir: str, manifest: dict, shard: int) -> Iterator[Tuple[int, str, Optional[dict]]]:
+    """(index, filename, result record or None if missing) for each file of a shard, in order."""
+    records = _read_checkpoint(_shard_path(job_dir, shard, ".jsonl"))
+    for index, filename in _shard_files(manifest, shard):
+        yield index, filename, records.get(index)
+
+
+def run_worker(
+    job_dir: str,
+    lexicon_path: str,
+    roles_path: str,
+    resume_dir: Optional[str] = None,
+    artifact_path: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    sandbox_limits: Optional[Tuple[Optional[float], Optional[int]]] = None,
+    lease: float = DEFAULT_LEASE
+) -> dict:
+    """
+    Claim and screen shards of a job until none is left to claim.
+    
+    Shards locked by live workers elsewhere are left to them; a worker
+    returns once every shard is done or held by someone else.
+    
+    Args:
+        job_dir: Job directory created by create_job
+        lexicon_path: Path to skills_lexicon.json
+        roles_path: Path to role_library.json
+        resume_dir: Where this machine sees the job's resume directory
+            (default: the path recorded in the manifest)
+        artifact_path: Optional precompiled data artifact
+        cache_path: Optional ExtractionCache database
+        sandbox_limits: Optional (timeout seconds, memory MB) per file
+        lease: Seconds after which another worker's silent lock is taken over
+        
+    Returns:
+        Dictionary with shards (finished by this worker) and files (screened by it)
+        
+    Raises:
+        ValueError: If the lexicon or role library differ from the job's
+    """
+    manifest = load_job(job_dir)
+    data = load_screening_data(lexicon_path, roles_path, artifact_path)
+    if manifest["data_hash"] and data_hash(data.skills, data.roles) != manifest["data_hash"]:
+        raise ValueError("Skills lexicon or role library differ from the ones this job was created with")
+    jd_skills = parse_job_description_cached(manifest["jd_text"], data.lexicon)["jd_required_skills"]
+    resume_path = Path(resume_dir or manifest["resumes"])
+    token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+    stats = {"shards": 0, "files": 0}
+    
+    cache = ExtractionCache(cache_path) if cache_path else None
+    sandbox = ExtractionSandbox(1, *sandbox_limits) if sandbox_limits else None
+    try:
+        for shard in range(shard_count(manifest)):
+            lock_path = _shard_path(job_dir, shard, ".lock")
+            if _shard_path(job_dir, shard, ".done").exists() or not _try_claim(lock_path, token, lease):
+                continue
+            # Another worker may have finished it between the check and the claim
+            if _shard_path(job_dir, shard, ".done").exists():
+                lock_path.unlink()
+                continue
+            
+            try:
+                checkpoint = _shard_path(job_dir, shard, ".jsonl")
+                finished = _read_checkpoint(checkpoint, repair=True)
+                with open(checkpoint, 'a') as out:
+                    for index, filename in _shard_files(manifest, shard):
+                        if index in finished:
+                            continue
+                        if not _owns(lock_path, token):
+                            # Taken over after our lease lapsed; the new owner finishes it
+                            break
+                        # Unreadable files (e.g. deleted since the job was created) fail on their own
+                        record = {"index": index, "filename": filename, "sha256": None}
+                        try:
+                            file_bytes = (resume_path / filename).read_bytes()
+                            record["sha256"] = hashlib.sha256(file_bytes).hexdigest()
+                            record["profile"] = screen_resume(
+                                file_bytes,
+                                filename,
+                                data.lexicon,
+                                jd_skills,
+                                data.role_index,
+                                cache,
+                                manifest["max_pages"],
+                                manifest["max_chars"],
+                                sandbox=sandbox,
+                                extractor=manifest["extractor"]
+                            )
+                        except Exception as e:
+                            record["error"] = str(e)
+                        out.write(json.dumps(record) + "\n")
+                        out.flush()
+                        os.utime(lock_path)
+                        stats["files"] += 1
+                    else:
+                        os.fsync(out.fileno())
+                        _write_atomic(_shard_path(job_dir, shard, ".done"), token)
+                        stats["shards"] += 1
+                        print(f"Finished shard {shard + 1}/{shard_count(manifest)}", file=sys.stderr, flush=True)
+            finally:
+                # Released even if the worker fails, so the shard does not look taken
+                if _owns(lock_path, token):
+                    lock_path.unlink()
+    finally:
+        if sandbox:
+            sandbox.close()
+        if cache:
+            cache.close()
+    return stats
+
+
+def _worker_process(kwargs: dict, results):
+    try:
+        results.put(run_worker(**kwargs))
+    except Exception as e:
+        results.put({"error": str(e)})
+
+
+def run_job(job_dir: str, workers: int = 1, **kwargs) -> dict:
+    """
+    Run worker processes on a job until no shard is left to claim.
+    
+    Args:
+        job_dir: Job directory created by create_job
+        workers: Worker processes on this machine (1 runs in this process)
+        **kwargs: Passed to run_worker
+        
+    Returns:
+        Dictionary with shards and files screened by this machine's workers
+        
+    Raises:
+        RuntimeError: If a worker process failed
+    """
+    if workers <= 1:
+        return run_worker(job_dir, **kwargs)
+    
+    # Spawn rather than fork, as for the screening pool
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker_process, args=({"job_dir": job_dir, **kwargs}, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    stats = {"shards": 0, "files": 0}
+    errors = []
+    for _ in processes:
+        worker_stats = results.get()
+        if "error" in worker_stats:
+            errors.append(worker_stats["error"])
+            continue
+        stats["shards"] += worker_stats["shards"]
+        stats["files"] += worker_stats["files"]
+    for process in processes:
+        process.join()
+    if errors:
+        raise RuntimeError(f"{len(errors)} of {workers} job workers failed: {errors[0]}")
+    return stats
+
+
+def job_status(job_dir: str, lease: float = DEFAULT_LEASE) -> dict:
+    """
+    Progress of a job.
+    
+    Returns:
+        Dictionary with files, shards, shards_done, shards_running (locked
+        within the lease), files_done and files_failed
+    """
+    manifest = load_job(job_dir)
+    status = {
+        "files": len(manifest["files"]),
+        "shards": shard_count(manifest),
+        "shards_done": 0,
+        "shards_running": 0,
+        "files_done": 0,
+        "files_failed": 0
+    }
+    for shard in range(status["shards"]):
+        if _shard_path(job_dir, shard, ".done").exists():
+            status["shards_done"] += 1
+        else:
+            try:
+                if time.time() - _shard_path(job_dir, shard, ".lock").stat().st_mtime <= lease:
+                    status["shards_running"] += 1
+            except FileNotFoundError:
+                pass
+        for _, _, record in _iter_records(job_dir, manifest, shard):
+            if record is not None:
+                status["files_done"] += 1
+                status["files_failed"] += "error" in record
+    return status
+
+
+def merge_results(job_dir: str, output_path: Optional[str] = None) -> dict:
+    """
+    Write every shard's results as one JSONL file in manifest order.
+    
+    Profiles are written as the CLI's screen command writes them. A file
+    with the same bytes as an earlier one in the job is written as a
+    duplicate link to the earlier profile instead, as exact duplicates are
+    linked by screen --dedup-index. Failed and empty files are counted, not
+    written. Merging again gives the same output.
+    
+    Args:
+        job_dir: Job directory whose shards are all done
+        output_path: Output file (default: results.jsonl in job_dir)
+        
+    Returns:
+        Dictionary with files, screened, duplicates, empty, failed and
+        errors (filename, message) pairs
+        
+    Raises:
+        RuntimeError: If some shards are not finished yet
+    """
+    from .near_duplicates import duplicate_link
+    
+    manifest = load_job(job_dir)
+    shards = shard_count(manifest)
+    unfinished = [shard for shard in range(shards) if not _shard_path(job_dir, shard, ".done").exists()]
+    if unfinished:
+        raise RuntimeError(f"{len(unfinished)} of {shards} shards are not finished")
+    
+    output = Path(output_path) if output_path else Path(job_dir) / "results.jsonl"
+    summary = {"files": len(manifest["files"]), "screened": 0, "duplicates": 0, "empty": 0, "failed": 0, "errors": []}
+    first_copy: Dict[str, str] = {}
+    tmp = output.with_name(f".{output.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp, 'w') as out:
+        for shard in range(shards):
+            for _, filename, record in _iter_records(job_dir, manifest, shard):
+                if record is None:
+                    raise RuntimeError(f"Shard {shard} is marked done but has no result for {filename}")
+                if "error" in record:
+                    summary["failed"] += 1
+                    summary["errors"].append((filename, record["error"]))
+                elif record["profile"] is None:
+                    summary["empty"] += 1
+                elif record["sha256"] in first_copy:
+                    summary["duplicates"] += 1
+                    # Stamped with the time the duplicate was screened, as stored
+                    # in its checkpoint, so merging again writes the same bytes
+                    link = duplicate_link(
+                        filename, first_copy[record["sha256"]], 1.0, exact=True, timestamp=record["profile"]["timestamp"]
+                    )
+                    out.write(json.dumps(link) + "\n")
+                else:
+                    summary["screened"] += 1
+                    first_copy[record["sha256"]] = record["profile"]["candidate_id"]
+                    out.write(json.dumps(record["profile"]) + "\n")
+    os.replace(tmp, output)
+    return summary
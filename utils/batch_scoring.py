@@ -0,0 +1,344 @@
+"""
+Vectorized scoring of many candidates against a job description.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .scoring import INTERVIEW_THRESHOLD, MAYBE_THRESHOLD
+
+RECOMMENDATIONS = ["Interview", "Maybe", "Not now"]
+
+
+class SkillMatrix:
+    """
+    Candidate x skill membership matrix, bit-packed by skill column.
+    
+    Each skill column is a packed bitset over candidates, so scoring a job
+    description only unpacks the JD's columns and the cost does not depend
+    on the lexicon size. Skills are matched case-insensitively; unknown
+    skills are added as new columns. Candidates whose skill spelling differs
+    from the column's display name keep their own spelling, so results are
+    identical to calculate_confidence_score.
+    """
+    
+    def __init__(self, vocabulary: Iterable[str] = ()):
+        self._index: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._overrides: Dict[Tuple[int, int], str] = {}
+        self._bits = np.zeros((64, 128), dtype=np.uint8)
+        self.n_candidates = 0
+        
+        for skill in vocabulary:
+            self._column(skill)
+    
+    def __len__(self) -> int:
+        return self.n_candidates
+    
+    @property
+    def vocabulary(self) -> List[str]:
+        """Display names of the skill columns, in column order."""
+        return list(self._names)
+    
+    def _column(self, skill: str) -> int:
+        """Get the column for a skill, adding it if unseen."""
+        key = skill.lower()
+        col = self._index.get(key)
+        if col is None:
+            col = len(self._names)
+            self._index[key] = col
+            self._names.append(skill)
+        return col
+    
+    def _reserve(self, n_columns: int, n_candidates: int):
+        """Grow the bit array so it holds the given columns and candidates."""
+        rows, byte_cols = self._bits.shape
+        need_bytes = (n_candidates + 7) // 8
+        if n_columns <= rows and need_bytes <= byte_cols:
+            return
+        # Double whichever dimension overflowed to amortize copies
+        if n_columns > rows:
+            rows_grown = max(n_columns, rows * 2)
+        else:
+            rows_grown = rows
+        if need_bytes > byte_cols:
+            byte_cols_grown = max(need_bytes, byte_cols * 2)
+        else:
+            byte_cols_grown = byte_cols
+        grown = np.zeros((rows_grown, byte_cols_grown), dtype=np.uint8)
+        grown[:rows, :byte_cols] = self._bits
+        self._bits = grown
+    
+    def add(self, resume_skills: List[str]) -> int:
+        """
+        Add one candidate.
+        
+        Args:
+            resume_skills: List of skills extracted from the resume
+            
+        Returns:
+            Row index of the candidate
+        """
+        return self.extend([resume_skills]).start
+    
+    def extend(self, skill_lists: Iterable[List[str]]) -> range:
+        """
+        Add many candidates at once.
+        
+        Args:
+            skill_lists: Iterable of per-candidate skill lists
+            
+        Returns:
+            Range of row indexes assigned to the new candidates
+        """
+        first = self.n_candidates
+        rows = []
+        cols = []
+        
+        row = first
+        for resume_skills in skill_lists:
+            for skill in resume_skills:
+                col = self._column(skill)
+                rows.append(row)
+                cols.append(col)
+                # Last spelling wins, as in get_matched_skills
+                if skill != self._names[col]:
+                    self._overrides[(row, col)] = skill
+                else:
+                    self._overrides.pop((row, col), None)
+            row += 1
+        
+        self._reserve(len(self._names), row)
+        if rows:
+            rows = np.asarray(rows, dtype=np.int64)
+            cols = np.asarray(cols, dtype=np.int64)
+            masks = (0x80 >> (rows & 7)).astype(np.uint8)
+            np.bitwise_or.at(self._bits, (cols, rows >> 3), masks)
+        
+        self.n_candidates = row
+        return range(first, row)
+    
+    def skill_name(self, row: int, col: int) -> str:
+        """Spelling of a skill column as given for a particular candidate."""
+        return self._overrides.get((row, col), self._names[col])
+    
+    def column_index(self, skill: str) -> Optional[int]:
+        """Column of a skill (case-insensitive), or None if never seen."""
+        return self._index.get(skill.lower())
+    
+    def packed_column(self, col: int) -> np.ndarray:
+        """
+        Packed candidate bitset of one skill column.
+        
+        Args:
+            col: Skill column index
+            
+        Returns:
+            uint8 array of ceil(n_candidates / 8) bytes, most significant bit first
+        """
+        return self._bits[col, :(self.n_candidates + 7) // 8]
+    
+    def column_hits(self, columns: List[int]) -> np.ndarray:
+        """
+        Unpack membership for the given skill columns.
+        
+        Args:
+            columns: Skill column indexes
+            
+        Returns:
+            Boolean array of shape (len(columns), n_candidates)
+        """
+        n = self.n_candidates
+        if not columns or not n:
+            return np.zeros((len(columns), n), dtype=bool)
+        packed = self._bits[columns, :(n + 7) // 8]
+        return np.unpackbits(packed, axis=1, count=n).view(bool)
+    
+    def confidence_matrix(self, jd_skill_lists: List[List[str]]) -> np.ndarray:
+        """
+        Confidence of every candidate against several job descriptions.
+        
+        The union of all JD skill columns is unpacked once and matched
+        counts for every JD come from a single matrix product.
+        
+        Args:
+            jd_skill_lists: Required skills of each job description
+            
+        Returns:
+            int64 array of shape (n_candidates, n_jds), equal to the
+            per-JD confidence of calculate_confidence_score
+        """
+        n = self.n_candidates
+        columns = []
+        column_pos = {}
+        indicator_entries = []
+        for j, jd_skills in enumerate(jd_skill_lists):
+            for key in dict.fromkeys(skill.lower() for skill in jd_skills):
+                col = self._index.get(key)
+                if col is None:
+                    continue
+                if col not in column_pos:
+                    column_pos[col] = len(columns)
+                    columns.append(col)
+                indicator_entries.append((column_pos[col], j))
+        
+        indicator = np.zeros((len(columns), len(jd_skill_lists)), dtype=np.int32)
+        for pos, j in indicator_entries:
+            indicator[pos, j] = 1
+        
+        hits = self.column_hits(columns).astype(np.int32)
+        matched = hits.T @ indicator if columns else np.zeros((n, len(jd_skill_lists)), dtype=np.int32)
+        
+        totals = np.array([len(jd_skills) for jd_skills in jd_skill_lists], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = matched / totals
+        # Same float operations as calculate_confidence_score; no JD skills -> 0
+        return np.where(totals > 0, np.rint(coverage * 100), 0).astype(np.int64)
+    
+    def score(self, jd_skills: List[str]) -> "BatchScores":
+        """
+        Score every candidate against a job description.
+        
+        Args:
+            jd_skills: List of required skills from job description
+            
+        Returns:
+            BatchScores with vectorized results for all candidates
+        """
+        return BatchScores(self, jd_skills)
+
+
+class BatchScores:
+    """
+    Confidence scores for every candidate in a SkillMatrix against one JD.
+    
+    Numeric results are NumPy arrays indexed by candidate row. Matched and
+    missing skill lists are derived per candidate on demand.
+    """
+    
+    def __init__(self, matrix: SkillMatrix, jd_skills: List[str]):
+        self.jd_skills = list(jd_skills)
+        self._matrix = matrix
+        self._jd_lower = [skill.lower() for skill in self.jd_skills]
+        
+        # Unique JD skills known to the matrix; the rest can never match
+        self._known = [key for key in dict.fromkeys(self._jd_lower) if key in matrix._index]
+        self._columns = [matrix._index[key] for key in self._known]
+        self._hits = matrix.column_hits(self._columns)
+        
+        n = matrix.n_candidates
+        total = len(self.jd_skills)
+        self.matched_count = self._hits.sum(axis=0, dtype=np.int64) if self._columns else np.zeros(n, dtype=np.int64)
+        if total:
+            self.coverage = self.matched_count / total
+            # Same float operations as calculate_confidence_score, and rint
+            # rounds half to even like round()
+            self.confidence = np.rint(self.coverage * 100).astype(np.int64)
+        else:
+            self.coverage = np.zeros(n)
+            self.confidence = np.zeros(n, dtype=np.int64)
+        
+        self.recommendation_code = np.where(
+            self.confidence >= INTERVIEW_THRESHOLD, 0,
+            np.where(self.confidence >= MAYBE_THRESHOLD, 1, 2)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.confidence)
+    
+    def recommendations(self) -> List[str]:
+        """Recommendation label for every candidate."""
+        return [RECOMMENDATIONS[code] for code in self.recommendation_code.tolist()]
+    
+    def matched_skills(self, row: int) -> List[str]:
+        """
+        Matched JD skills for one candidate (in the candidate's spelling).
+        
+        Args:
+            row: Candidate row index
+            
+        Returns:
+            Sorted list of matched skills
+        """
+        hits = self._hits[:, row]
+        return sorted(
+            self._matrix.skill_name(row, col)
+            for col, hit in zip(self._columns, hits) if hit
+        )
+    
+    def missing_skills(self, row: int) -> List[str]:
+        """
+        JD skills missing for one candidate (in the JD's spelling).
+        
+        Args:
+            row: Candidate row index
+            
+        Returns:
+            Sorted list of missing skills
+        """
+        hits = self._hits[:, row]
+        present = {key for key, hit in zip(self._known, hits) if hit}
+        return sorted(
+            skill for skill, key in zip(self.jd_skills, self._jd_lower)
+            if key not in present
+        )
+    
+    def result(self, row: int) -> dict:
+        """
+        Full scoring result for one candidate.
+        
+        Args:
+            row: Candidate row index
+            
+        Returns:
+            Dictionary identical to calculate_confidence_score's output
+        """
+        if not self.jd_skills:
+            return {
+                "confidence": 0,
+                "recommendation": "Not now",
+                "matched_skills": [],
+                "missing_skills": [],
+                "coverage": 0.0
+            }
+        
+        matched_count = int(self.matched_count[row])
+        return {
+            "confidence": int(self.confidence[row]),
+            "recommendation": RECOMMENDATIONS[self.recommendation_code[row]],
+            "matched_skills": self.matched_skills(row),
+            "missing_skills": self.missing_skills(row),
+            "coverage": round(float(self.coverage[row]), 2),
+            "matched_count": matched_count,
+            "total_jd_skills": len(self.jd_skills)
+        }
+    
+    def results(self, rows: Optional[Iterable[int]] = None) -> List[dict]:
+        """
+        Full scoring results for several candidates.
+        
+        Args:
+            rows: Candidate row indexes (default: all)
+            
+        Returns:
+            List of result dictionaries in row order
+        """
+        if rows is None:
+            rows = range(len(self))
+        return [self.result(row) for row in rows]
+
+
+def score_candidates(candidate_skills: List[List[str]], jd_skills: List[str]) -> List[dict]:
+    """
+    Score many candidates against a job description in one batch.
+    
+    Args:
+        candidate_skills: Per-candidate lists of extracted skills
+        jd_skills: List of required skills from job description
+        
+    Returns:
+        List of results identical to calculate_confidence_score per candidate
+    """
+    matrix = SkillMatrix()
+    matrix.extend(candidate_skills)
+    return matrix.score(jd_skills).results()
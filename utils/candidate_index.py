@@ -0,0 +1,198 @@
+"""
+Skill-based search index over stored candidate profiles.
+"""
+import re
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from .batch_scoring import SkillMatrix
+from .profile_store import ProfileStore
+
+_QUERY_SPLIT = re.compile(r"(\(|\)|\bAND\b|\bOR\b|\bNOT\b)")
+_OPERATORS = {"(", ")", "AND", "OR", "NOT"}
+
+
+class CandidateIndex:
+    """
+    Inverted skill -> candidate index built from stored profiles.
+    
+    Backed by a SkillMatrix, so each skill's posting list is a packed
+    bitset over candidates: boolean queries are bitwise operations on those
+    bitsets and JD matching uses the vectorized confidence formula. Attach
+    it to a ProfileStore to index new profiles as they are saved.
+    """
+    
+    def __init__(self):
+        self._matrix = SkillMatrix()
+        self._candidate_ids: List[str] = []
+        self._filenames: List[str] = []
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_store(cls, store: ProfileStore, follow: bool = True) -> "CandidateIndex":
+        """
+        Build an index from every profile in a store.
+        
+        Args:
+            store: Profile store to read
+            follow: Also index profiles saved to the store later (default: True)
+            
+        Returns:
+            CandidateIndex instance
+        """
+        index = cls()
+        candidate_ids = []
+        filenames = []
+        skill_lists = []
+        for candidate_id, filename, skills in store.iter_skills():
+            candidate_ids.append(candidate_id)
+            filenames.append(filename)
+            skill_lists.append(skills)
+        index._add(candidate_ids, filenames, skill_lists)
+        
+        if follow:
+            store.subscribe(index.add_profile)
+        return index
+    
+    def __len__(self) -> int:
+        return self._matrix.n_candidates
+    
+    def _add(self, candidate_ids: List[str], filenames: List[str], skill_lists: List[List[str]]):
+        with self._lock:
+            self._matrix.extend(skill_lists)
+            self._candidate_ids.extend(candidate_ids)
+            self._filenames.extend(filenames)
+    
+    def add_profile(self, profile: dict):
+        """
+        Index one candidate profile.
+        
+        Args:
+            profile: Candidate profile with candidate_id, filename and extracted_skills
+        """
+        self._add(
+            [profile.get("candidate_id", "")],
+            [profile.get("filename", "")],
+            [profile.get("extracted_skills", [])]
+        )
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Find candidates matching a boolean skill query.
+        
+        Skills are matched case-insensitively and combined with AND, OR,
+        NOT and parentheses, e.g. "Kubernetes AND Go AND (AWS OR GCP)".
+        
+        Args:
+            query: Boolean skill query
+            limit: Maximum number of candidate IDs to return
+            
+        Returns:
+            Matching candidate IDs in the order they were indexed
+            
+        Raises:
+            ValueError: If the query is malformed
+        """
+        tokens = [t.strip() for t in _QUERY_SPLIT.split(query) if t.strip()]
+        with self._lock:
+            parser = _QueryParser(tokens, self._matrix)
+            packed = parser.parse()
+            n = self._matrix.n_candidates
+            rows = np.flatnonzero(np.unpackbits(packed, count=n)) if n else np.zeros(0, dtype=np.int64)
+            if limit is not None:
+                rows = rows[:limit]
+            return [self._candidate_ids[row] for row in rows.tolist()]
+    
+    def top_matches(self, jd_skills: List[str], k: int = 50) -> List[dict]:
+        """
+        Rank stored candidates against a job description.
+        
+        Uses the same confidence formula as calculate_confidence_score;
+        ties keep indexing order.
+        
+        Args:
+            jd_skills: List of required skills from job description
+            k: Number of candidates to return (default: 50)
+            
+        Returns:
+            List of dicts with candidate_id, filename and the scoring result
+        """
+        with self._lock:
+            n = self._matrix.n_candidates
+            if not n or k <= 0:
+                return []
+            
+            scores = self._matrix.score(jd_skills)
+            # Unique sort key: confidence first, then earlier rows
+            key = scores.confidence * n + (n - 1 - np.arange(n))
+            k = min(k, n)
+            top = np.argpartition(-key, k - 1)[:k]
+            top = top[np.argsort(-key[top])]
+            
+            return [
+                {
+                    "candidate_id": self._candidate_ids[row],
+                    "filename": self._filenames[row],
+                    "jd_match": scores.result(row)
+                }
+                for row in top.tolist()
+            ]
+
+
+class _QueryParser:
+    """Recursive-descent parser evaluating a boolean query to a packed bitset."""
+    
+    def __init__(self, tokens: List[str], matrix: SkillMatrix):
+        self._tokens = tokens
+        self._pos = 0
+        self._matrix = matrix
+        self._n_bytes = (matrix.n_candidates + 7) // 8
+    
+    def parse(self) -> np.ndarray:
+        if not self._tokens:
+            raise ValueError("Empty query")
+        result = self._expr()
+        if self._pos != len(self._tokens):
+            raise ValueError(f"Unexpected '{self._tokens[self._pos]}' in query")
+        return result
+    
+    def _peek(self) -> Optional[str]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+    
+    def _expr(self) -> np.ndarray:
+        result = self._term()
+        while self._peek() == "OR":
+            self._pos += 1
+            result = result | self._term()
+        return result
+    
+    def _term(self) -> np.ndarray:
+        result = self._factor()
+        while self._peek() == "AND":
+            self._pos += 1
+            result = result & self._factor()
+        return result
+    
+    def _factor(self) -> np.ndarray:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Query ended unexpectedly")
+        self._pos += 1
+        
+        if token == "NOT":
+            return ~self._factor()
+        if token == "(":
+            result = self._expr()
+            if self._peek() != ")":
+                raise ValueError("Missing ')' in query")
+            self._pos += 1
+            return result
+        if token in _OPERATORS:
+            raise ValueError(f"Unexpected '{token}' in query")
+        
+        col = self._matrix.column_index(token)
+        if col is None:
+            return np.zeros(self._n_bytes, dtype=np.uint8)
+        return self._matrix.packed_column(col).copy()
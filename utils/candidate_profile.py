@@ -0,0 +1,435 @@
+"""
+Compact in-memory candidate profiles.
+
+A CandidateProfile carries the same information as the dictionary built by
+pipeline.build_profile at a fraction of the memory: skills are integer IDs
+in a shared SkillVocabulary, every candidate screened against a job
+description shares one tuple of its skills, and matched/missing lists are
+derived on demand. to_dict() gives back the dictionary shape used by the UI,
+the profile stores and exports.
+"""
+import json
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .scoring import calculate_confidence_score, INTERVIEW_THRESHOLD, MAYBE_THRESHOLD
+from .skill_extractor import get_matched_skills, get_missing_skills
+
+PROFILES_VERSION = 1
+_MAGIC = b"RMCP"
+_PROFILE_KEYS = (
+    "candidate_id", "filename", "timestamp", "raw_text", "raw_text_length",
+    "extracted_skills", "total_skills", "jd_match", "alternate_roles"
+)
+
+
+class SkillVocabulary:
+    """
+    Interns skill names as integer IDs shared by many profiles.
+    
+    Names are kept exactly as spelled, so a profile decodes to the same
+    strings it was built from. Seed it with the lexicon so the common skills
+    get stable, low IDs.
+    """
+    
+    def __init__(self, skills: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._skill_lists: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        for skill in skills:
+            self.intern(skill)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def intern(self, skill: str) -> int:
+        """ID of a skill name, adding it if unseen."""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            skill_id = self._ids[skill] = len(self._names)
+            self._names.append(skill)
+        return skill_id
+    
+    def encode(self, skills: Iterable[str]) -> array:
+        """Skill names as an array of IDs, in the same order."""
+        return array('I', [self.intern(skill) for skill in skills])
+    
+    def decode(self, skill_ids: Iterable[int]) -> List[str]:
+        """Skill names of an array of IDs, in the same order."""
+        names = self._names
+        return [names[skill_id] for skill_id in skill_ids]
+    
+    def shared_skills(self, skills: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Canonical tuple for a list of job description skills.
+        
+        Equal lists map to the same tuple object, so candidates screened
+        against one job description share a single copy.
+        """
+        key = tuple(skills)
+        return self._skill_lists.setdefault(key, key)
+
+
+class CandidateProfile:
+    """
+    Screening result for one candidate, stored compactly.
+    
+    confidence is kept for sorting and filtering; everything else about the
+    JD match and the alternate roles is recomputed from skill IDs when asked
+    for. Profiles whose JD match or roles cannot be reproduced that way (for
+    example ones written by an older version) keep those parts verbatim, so
+    to_dict() always returns exactly what from_dict() was given.
+    """
+    
+    __slots__ = (
+        "candidate_id", "filename", "timestamp", "raw_text", "raw_text_length", "confidence",
+        "_vocabulary", "_skill_ids", "_jd_skills", "_roles", "_extra"
+    )
+    
+    def __init__(
+        self,
+        vocabulary: SkillVocabulary,
+        candidate_id: str,
+        filename: str,
+        timestamp: str,
+        raw_text: str,
+        raw_text_length: int,
+        skill_ids: array,
+        jd_skills: Tuple[str, ...],
+        confidence: int,
+        roles: Tuple[Tuple[str, str, array, int], ...] = (),
+        extra: Optional[dict] = None
+    ):
+        self._vocabulary = vocabulary
+        self.candidate_id = candidate_id
+        self.filename = filename
+        self.timestamp = timestamp
+        self.raw_text = raw_text
+        self.raw_text_length = raw_text_length
+        self._skill_ids = skill_ids
+        self._jd_skills = jd_skills
+        self.confidence = confidence
+        self._roles = roles
+        self._extra = extra
+    
+    @classmethod
+    def from_dict(
+        cls,
+        profile: dict,
+        vocabulary: SkillVocabulary,
+        jd_skills: Optional[List[str]] = None
+    ) -> "CandidateProfile":
+        """
+        Compact a profile dictionary.
+        
+        Args:
+            profile: Candidate profile dictionary (see pipeline.build_profile)
+            vocabulary: Vocabulary the skill IDs refer to
+            jd_skills: Job description skills the profile was scored against;
+                rebuilt from its matched and missing skills if not given
+                
+        Returns:
+            CandidateProfile whose to_dict() equals profile
+        """
+        jd_match = profile["jd_match"]
+        if jd_skills is None:
+            jd_skills = jd_match["matched_skills"] + jd_match["missing_skills"]
+        
+        compact = cls(
+            vocabulary,
+            profile["candidate_id"],
+            profile["filename"],
+            profile["timestamp"],
+            profile["raw_text"],
+            profile["raw_text_length"],
+            vocabulary.encode(profile["extracted_skills"]),
+            vocabulary.shared_skills(jd_skills),
+            jd_match["confidence"],
+            tuple(
+                (
+                    sys.intern(role["role_id"]),
+                    sys.intern(role["role_name"]),
+                    vocabulary.encode(role["matched_skills"]),
+                    role["total_required"]
+                )
+                for role in profile["alternate_roles"]
+            )
+        )
+        
+        # Keep verbatim whatever does not come back identical
+        extra = {key: value for key, value in profile.items() if key not in _PROFILE_KEYS}
+        if compact.jd_match() != jd_match:
+            extra["jd_match"] = jd_match
+        if compact.alternate_roles() != profile["alternate_roles"]:
+            extra["alternate_roles"] = profile["alternate_roles"]
+        if profile["total_skills"] != compact.total_skills:
+            extra["total_skills"] = profile["total_skills"]
+        compact._extra = extra or None
+        return compact
+    
+    @property
+    def extracted_skills(self) -> List[str]:
+        """Skills found in the resume."""
+        return self._vocabulary.decode(self._skill_ids)
+    
+    @property
+    def total_skills(self) -> int:
+        if self._extra and "total_skills" in self._extra:
+            return self._extra["total_skills"]
+        return len(self._skill_ids)
+    
+    @property
+    def jd_skills(self) -> Tuple[str, ...]:
+        """Job description skills the candidate was scored against."""
+        return self._jd_skills
+    
+    @property
+    def recommendation(self) -> str:
+        if self._extra and "jd_match" in self._extra:
+            return self._extra["jd_match"]["recommendation"]
+        if self.confidence >= INTERVIEW_THRESHOLD:
+            return "Interview"
+        if self.confidence >= MAYBE_THRESHOLD:
+            return "Maybe"
+        return "Not now"
+    
+    def matched_skills(self) -> List[str]:
+        """Matched JD skills, in the candidate's spelling."""
+        if self._extra and "jd_match" in self._extra:
+            return self._extra["jd_match"]["matched_skills"]
+        return get_matched_skills(self.extracted_skills, self._jd_skills)
+    
+    def missing_skills(self) -> List[str]:
+        """JD skills missing from the resume, in the JD's spelling."""
+        if self._extra and "jd_match" in self._extra:
+            return self._extra["jd_match"]["missing_skills"]
+        return get_missing_skills(self.extracted_skills, self._jd_skills)
+    
+    def jd_match(self) -> dict:
+        """Scoring result, as returned by calculate_confidence_score."""
+        if self._extra and "jd_match" in self._extra:
+            return self._extra["jd_match"]
+        return calculate_confidence_score(self.extracted_skills, list(self._jd_skills))
+    
+    def alternate_roles(self) -> List[dict]:
+        """Alternate role suggestions, as returned by find_alternate_roles."""
+        if self._extra and "alternate_roles" in self._extra:
+            return self._extra["alternate_roles"]
+        roles = []
+        for role_id, role_name, skill_ids, total_required in self._roles:
+            role_score = len(skill_ids) / total_required
+            roles.append({
+                "role_id": role_id,
+                "role_name": role_name,
+                "role_score": round(role_score * 100),
+                "matched_skills": self._vocabulary.decode(skill_ids),
+                "matched_count": len(skill_ids),
+                "total_required": total_required,
+                "coverage": round(role_score, 2)
+            })
+        return roles
+    
+    def to_dict(self) -> dict:
+        """
+        Expand to the candidate profile dictionary.
+        
+        Returns:
+            Dictionary in the shape built by pipeline.build_profile
+        """
+        profile = {
+            "candidate_id": self.candidate_id,
+            "filename": self.filename,
+            "timestamp": self.timestamp,
+            "raw_text": self.raw_text,
+            "raw_text_length": self.raw_text_length,
+            "extracted_skills": self.extracted_skills,
+            "total_skills": self.total_skills,
+            "jd_match": self.jd_match(),
+            "alternate_roles": self.alternate_roles()
+        }
+        if self._extra:
+            profile.update(
+                (key, value) for key, value in self._extra.items() if key not in profile
+            )
+        return profile
+
+
+class _Writer:
+    """Append-only buffer of little-endian fields."""
+    
+    def __init__(self):
+        self.buffer = bytearray()
+    
+    def uint(self, value: int):
+        self.buffer += struct.pack("<I", value)
+    
+    def text(self, value: str):
+        data = value.encode("utf-8")
+        self.uint(len(data))
+        self.buffer += data
+    
+    def ids(self, values: Iterable[int], code: str):
+        values = array(code, values)
+        if sys.byteorder == "big":
+            values.byteswap()
+        self.uint(len(values))
+        self.buffer += values.tobytes()
+
+
+class _Reader:
+    """Sequential reader for buffers written by _Writer."""
+    
+    def __init__(self, data: bytes, offset: int = 0):
+        self.data = memoryview(data)
+        self.offset = offset
+    
+    def uint(self) -> int:
+        value, = struct.unpack_from("<I", self.data, self.offset)
+        self.offset += 4
+        return value
+    
+    def text(self) -> str:
+        size = self.uint()
+        value = str(self.data[self.offset:self.offset + size], "utf-8")
+        self.offset += size
+        return value
+    
+    def ids(self, code: str) -> array:
+        count = self.uint()
+        values = array(code)
+        size = count * values.itemsize
+        values.frombytes(self.data[self.offset:self.offset + size])
+        if sys.byteorder == "big":
+            values.byteswap()
+        self.offset += size
+        return array('I', values) if code != 'I' else values
+
+
+def dump_profiles(profiles: List[CandidateProfile]) -> bytes:
+    """
+    Serialize profiles into a self-contained binary blob.
+    
+    The blob holds one skill table and one copy of each job description's
+    skills; records refer to them by index. Skill IDs take two bytes each
+    while the table has fewer than 65536 entries.
+    
+    Args:
+        profiles: Profiles to write (may use different vocabularies)
+        
+    Returns:
+        Bytes accepted by load_profiles
+    """
+    vocabulary = SkillVocabulary()
+    jd_index: Dict[Tuple[str, ...], int] = {}
+    records = _Writer()
+    
+    def local_ids(profile: CandidateProfile, skill_ids: array) -> List[int]:
+        return [vocabulary.intern(skill) for skill in profile._vocabulary.decode(skill_ids)]
+    
+    encoded = []
+    for profile in profiles:
+        jd_position = jd_index.setdefault(profile._jd_skills, len(jd_index))
+        roles = [
+            (role_id, role_name, local_ids(profile, skill_ids), total_required)
+            for role_id, role_name, skill_ids, total_required in profile._roles
+        ]
+        encoded.append((profile, jd_position, local_ids(profile, profile._skill_ids), roles))
+    jd_lists = [[vocabulary.intern(skill) for skill in jd_skills] for jd_skills in jd_index]
+    code = 'H' if len(vocabulary) < 1 << 16 else 'I'
+    
+    for profile, jd_position, skill_ids, roles in encoded:
+        records.text(profile.candidate_id)
+        records.text(profile.filename)
+        records.text(profile.timestamp)
+        records.text(profile.raw_text)
+        records.uint(profile.raw_text_length)
+        records.uint(profile.confidence)
+        records.uint(jd_position)
+        records.ids(skill_ids, code)
+        records.uint(len(roles))
+        for role_id, role_name, role_skill_ids, total_required in roles:
+            records.text(role_id)
+            records.text(role_name)
+            records.ids(role_skill_ids, code)
+            records.uint(total_required)
+        records.text(json.dumps(profile._extra) if profile._extra else "")
+    
+    header = _Writer()
+    header.buffer += _MAGIC + bytes([PROFILES_VERSION]) + code.encode("ascii")
+    header.uint(len(vocabulary))
+    for skill in vocabulary._names:
+        header.text(skill)
+    header.uint(len(jd_lists))
+    for jd_ids in jd_lists:
+        header.ids(jd_ids, code)
+    header.uint(len(profiles))
+    return bytes(header.buffer + records.buffer)
+
+
+def load_profiles(data: bytes, vocabulary: Optional[SkillVocabulary] = None) -> List[CandidateProfile]:
+    """
+    Deserialize profiles written by dump_profiles.
+    
+    Args:
+        data: Serialized profiles
+        vocabulary: Vocabulary to intern skills into (default: a new one)
+        
+    Returns:
+        List of CandidateProfile in the order they were written
+        
+    Raises:
+        ValueError: If data is not a supported profile blob
+    """
+    if data[:len(_MAGIC)] != _MAGIC or len(data) < len(_MAGIC) + 2:
+        raise ValueError("not a candidate profile blob")
+    if data[len(_MAGIC)] != PROFILES_VERSION:
+        raise ValueError(f"unsupported candidate profile blob version {data[len(_MAGIC)]}")
+    code = chr(data[len(_MAGIC) + 1])
+    
+    vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+    reader = _Reader(data, len(_MAGIC) + 2)
+    names = [reader.text() for _ in range(reader.uint())]
+    # Map blob-local IDs to IDs in the target vocabulary
+    id_map = vocabulary.encode(names)
+    
+    def remap(local: array) -> array:
+        return array('I', [id_map[skill_id] for skill_id in local])
+    
+    jd_lists = [
+        vocabulary.shared_skills(names[skill_id] for skill_id in reader.ids(code))
+        for _ in range(reader.uint())
+    ]
+    
+    profiles = []
+    for _ in range(reader.uint()):
+        candidate_id = reader.text()
+        filename = reader.text()
+        timestamp = reader.text()
+        raw_text = reader.text()
+        raw_text_length = reader.uint()
+        confidence = reader.uint()
+        jd_skills = jd_lists[reader.uint()]
+        skill_ids = remap(reader.ids(code))
+        roles = []
+        for _ in range(reader.uint()):
+            role_id = sys.intern(reader.text())
+            role_name = sys.intern(reader.text())
+            role_skill_ids = remap(reader.ids(code))
+            roles.append((role_id, role_name, role_skill_ids, reader.uint()))
+        extra = reader.text()
+        profiles.append(CandidateProfile(
+            vocabulary,
+            candidate_id,
+            filename,
+            timestamp,
+            raw_text,
+            raw_text_length,
+            skill_ids,
+            jd_skills,
+            confidence,
+            tuple(roles),
+            json.loads(extra) if extra else None
+        ))
+    return profiles
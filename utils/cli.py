@@ -0,0 +1,540 @@
+"""
+Command-line entry point for headless batch screening.
+
+Usage:
+    python -m utils.cli screen --jd jd.txt --resumes ./resumes [--output results.jsonl] [--metrics-out metrics.prom]
+    python -m utils.cli role-fits [--store outputs/profiles.sqlite3] [--top 3]
+    python -m utils.cli build-artifact
+    python -m utils.cli serve [--port 8765] [--workers 2]
+    python -m utils.cli job --job-dir jobs/backfill --jd jd.txt --resumes ./resumes [--workers 8]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from . import jd_cache, metrics
+from .data_artifact import build_screening_data, load_screening_data, write_artifact
+from .extraction_cache import ExtractionCache
+from .extraction_sandbox import ExtractionSandbox, DEFAULT_TIMEOUT, DEFAULT_MAX_MEMORY_MB
+from .file_loader import EXTRACTOR_CHOICES, DEFAULT_EXTRACTOR, find_resumes
+from .parallel import screen_resumes_parallel, default_worker_count
+from .pipeline import screen_resume, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+from .role_matcher import RoleIndex
+from .profile_store import DirectoryProfileStore, SQLiteProfileStore, migrate_profiles
+from .skill_extractor import CompiledLexicon
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+OUTPUTS_DIR = Path(__file__).resolve().parent.parent / "outputs"
+ARTIFACT_PATH = OUTPUTS_DIR / "cache" / "screening_data.bin"
+
+
+def _read_resumes(paths: List[Path], resume_dir: Path) -> Iterator[Tuple[str, bytes]]:
+    """Lazily read resume files as (relative filename, bytes) pairs."""
+    for path in paths:
+        yield str(path.relative_to(resume_dir)), path.read_bytes()
+
+
+def run_screen(args: argparse.Namespace, out: TextIO) -> dict:
+    """
+    Screen every resume in a directory against a job description.
+    
+    Writes one JSON line per candidate to out as results arrive.
+    
+    Args:
+        args: Parsed command-line arguments
+        out: Text stream receiving JSONL records
+        
+    Returns:
+        Throughput summary dictionary
+    """
+    resume_dir = Path(args.resumes)
+    jd_text = Path(args.jd).read_text()
+    artifact_path = args.artifact or None
+    data = load_screening_data(args.lexicon, args.roles, artifact_path)
+    jd_skills = jd_cache.parse_job_description_cached(jd_text, data.lexicon)["jd_required_skills"]
+    paths = find_resumes(resume_dir)
+    
+    print(f"Screening {len(paths)} resumes against {len(jd_skills)} JD skills", file=sys.stderr)
+    
+    store = SQLiteProfileStore(args.store) if args.store else None
+    summary = {"files": len(paths), "screened": 0, "duplicates": 0, "empty": 0, "failed": 0, "bytes": 0}
+    start = time.perf_counter()
+    
+    if args.workers > 1:
+        results = screen_resumes_parallel(
+            _read_resumes(paths, resume_dir),
+            jd_skills,
+            args.lexicon,
+            args.roles,
+            max_workers=args.workers,
+            chunk_size=args.chunk_size,
+            cache_path=args.cache,
+            max_pages=args.max_pages,
+            max_chars=args.max_chars,
+            artifact_path=artifact_path,
+            duplicates_path=args.dedup_index,
+            dedup_threshold=args.dedup_threshold,
+            sandbox_limits=_sandbox_limits(args),
+            extractor=args.extractor
+        )
+    else:
+        results = _screen_serial(paths, resume_dir, data.lexicon, data.role_index, jd_skills, args)
+    
+    for index, profile, error in results:
+        summary["bytes"] += paths[index].stat().st_size
+        if error:
+            summary["failed"] += 1
+            print(f"Error processing {paths[index]}: {error}", file=sys.stderr)
+        elif profile is None:
+            summary["empty"] += 1
+        elif "duplicate_of" in profile:
+            # Linked to the profile already stored; nothing new to save
+            summary["duplicates"] += 1
+            out.write(json.dumps(profile) + "\n")
+        else:
+            summary["screened"] += 1
+            out.write(json.dumps(profile) + "\n")
+            if store:
+                with metrics.span("save"):
+                    store.save(profile)
+    
+    if store:
+        store.close()
+    
+    elapsed = time.perf_counter() - start
+    summary["seconds"] = round(elapsed, 3)
+    summary["files_per_second"] = round(len(paths) / elapsed, 2) if elapsed else 0.0
+    summary["mb_per_second"] = round(summary["bytes"] / 1_000_000 / elapsed, 2) if elapsed else 0.0
+    return summary
+
+
+def _sandbox_limits(args: argparse.Namespace) -> Optional[Tuple[Optional[float], Optional[int]]]:
+    """(timeout, memory MB) extraction budgets, or None to parse in-process; 0 means no limit."""
+    if args.no_sandbox:
+        return None
+    return args.extract_timeout or None, args.extract_memory or None
+
+
+def _screen_serial(
+    paths: List[Path],
+    resume_dir: Path,
+    lexicon: CompiledLexicon,
+    role_index: RoleIndex,
+    jd_skills: List[str],
+    args: argparse.Namespace
+) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Screen resumes in-process, yielding the same tuples as the parallel path."""
+    cache = ExtractionCache(args.cache) if args.cache else None
+    duplicates = None
+    if args.dedup_index:
+        from .near_duplicates import NearDuplicateIndex, DEFAULT_THRESHOLD
+        threshold = args.dedup_threshold if args.dedup_threshold is not None else DEFAULT_THRESHOLD
+        duplicates = NearDuplicateIndex(args.dedup_index, threshold)
+    limits = _sandbox_limits(args)
+    sandbox = ExtractionSandbox(1, *limits) if limits else None
+    
+    try:
+        for index, (filename, file_bytes) in enumerate(_read_resumes(paths, resume_dir)):
+            try:
+                profile = screen_resume(
+                    file_bytes,
+                    filename,
+                    lexicon,
+                    jd_skills,
+                    role_index,
+                    cache,
+                    args.max_pages,
+                    args.max_chars,
+                    duplicates,
+                    sandbox=sandbox,
+                    extractor=args.extractor
+                )
+                yield index, profile, None
+            except Exception as e:
+                yield index, None, str(e)
+    finally:
+        if sandbox:
+            sandbox.close()
+        if cache:
+            cache.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m utils.cli", description="Role Matrix batch screening")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    screen = subparsers.add_parser("screen", help="Screen a folder of resumes against a job description")
+    screen.add_argument("--jd", required=True, help="Path to a job description text file")
+    screen.add_argument("--resumes", required=True, help="Directory of PDF/DOCX resumes (searched recursively)")
+    screen.add_argument("--output", "-o", help="JSONL output file (default: stdout)")
+    screen.add_argument("--workers", type=int, default=default_worker_count(), help="Worker processes (1 = serial)")
+    screen.add_argument("--chunk-size", type=int, default=4, help="Files sent to a worker per task")
+    screen.add_argument("--cache", help="Path to an extraction cache database")
+    screen.add_argument("--jd-cache", help="Path to a parsed-JD cache database (reused across runs)")
+    screen.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Maximum PDF pages per file")
+    screen.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help="Maximum characters per file")
+    screen.add_argument(
+        "--extractor",
+        choices=EXTRACTOR_CHOICES,
+        default=DEFAULT_EXTRACTOR,
+        help="Text extractor: accurate (pdfplumber), fast (pdfium), pdfminer, or auto (fast with accurate fallback)"
+    )
+    screen.add_argument(
+        "--extract-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Seconds allowed to parse one file before it is failed (0 for no limit)"
+    )
+    screen.add_argument(
+        "--extract-memory",
+        type=int,
+        default=DEFAULT_MAX_MEMORY_MB,
+        help="Memory in MB allowed while parsing one file, not enforced on Windows (0 for no limit)"
+    )
+    screen.add_argument(
+        "--no-sandbox",
+        action="store_true",
+        help="Parse files in the screening process itself, without time or memory limits"
+    )
+    screen.add_argument("--store", help="Also save profiles to this SQLite profile store")
+    screen.add_argument(
+        "--dedup-index",
+        help="Near-duplicate index database; resumes matching an indexed one are linked, not re-screened"
+    )
+    screen.add_argument(
+        "--dedup-threshold",
+        type=float,
+        help="Text similarity (0-1) counted as a duplicate (default: 0.8)"
+    )
+    screen.add_argument("--metrics-out", help="Write per-stage timings and counters to this file")
+    screen.add_argument(
+        "--metrics-format",
+        choices=["prometheus", "json"],
+        default="prometheus",
+        help="Format of --metrics-out (default: prometheus text format)"
+    )
+    screen.add_argument("--lexicon", default=str(DATA_DIR / "skills_lexicon.json"), help="Skills lexicon JSON")
+    screen.add_argument("--roles", default=str(DATA_DIR / "role_library.json"), help="Role library JSON")
+    screen.add_argument(
+        "--artifact",
+        default=str(ARTIFACT_PATH),
+        help="Precompiled lexicon/role artifact, rebuilt when stale (empty string to disable)"
+    )
+    
+    profiles = subparsers.add_parser("profiles", help="Query a SQLite profile store (JSONL to stdout)")
+    profiles.add_argument("--store", default=str(OUTPUTS_DIR / "profiles.sqlite3"), help="SQLite profile store")
+    profiles.add_argument("--filename", help="Exact resume filename")
+    profiles.add_argument("--recommendation", choices=["Interview", "Maybe", "Not now"])
+    profiles.add_argument("--min-confidence", type=int)
+    profiles.add_argument("--max-confidence", type=int)
+    profiles.add_argument("--since", help="Earliest ISO timestamp")
+    profiles.add_argument("--until", help="Latest ISO timestamp (exclusive)")
+    profiles.add_argument("--limit", type=int)
+    
+    search = subparsers.add_parser("search", help="Search stored candidates by skills or rank them against a JD")
+    search.add_argument("--store", default=str(OUTPUTS_DIR / "profiles.sqlite3"), help="SQLite profile store")
+    target = search.add_mutually_exclusive_group(required=True)
+    target.add_argument("--query", help='Boolean skill query, e.g. "Kubernetes AND Go AND (AWS OR GCP)"')
+    target.add_argument("--jd", help="Job description text file to rank stored candidates against")
+    search.add_argument("--top", type=int, default=50, help="Number of results")
+    search.add_argument("--jd-cache", help="Path to a parsed-JD cache database (reused across runs)")
+    search.add_argument("--lexicon", default=str(DATA_DIR / "skills_lexicon.json"), help="Skills lexicon JSON")
+    
+    role_fits = subparsers.add_parser("role-fits", help="Rank every role for every stored candidate (JSONL to stdout)")
+    role_fits.add_argument("--store", default=str(OUTPUTS_DIR / "profiles.sqlite3"), help="SQLite profile store")
+    role_fits.add_argument("--roles", default=str(DATA_DIR / "role_library.json"), help="Role library JSON")
+    role_fits.add_argument("--top", type=int, default=3, help="Roles per candidate")
+    role_fits.add_argument("--required-weight", type=float, default=1.0, help="Weight of each required skill")
+    role_fits.add_argument("--preferred-weight", type=float, default=0.5, help="Weight of each preferred skill")
+    role_fits.add_argument("--min-fit", type=float, default=0.0, help="Leave out roles fitting less than this (0-1)")
+    
+    migrate = subparsers.add_parser("migrate-profiles", help="Copy a JSON profile directory into a SQLite store")
+    migrate.add_argument("--source", default=str(OUTPUTS_DIR / "profiles"), help="Directory of profile JSON files")
+    migrate.add_argument("--store", default=str(OUTPUTS_DIR / "profiles.sqlite3"), help="SQLite profile store")
+    
+    artifact = subparsers.add_parser("build-artifact", help="Precompile the lexicon and role library")
+    artifact.add_argument("--lexicon", default=str(DATA_DIR / "skills_lexicon.json"), help="Skills lexicon JSON")
+    artifact.add_argument("--roles", default=str(DATA_DIR / "role_library.json"), help="Role library JSON")
+    artifact.add_argument("--output", "-o", default=str(ARTIFACT_PATH), help="Artifact file to write")
+    
+    job = subparsers.add_parser("job", help="Run or resume a sharded, checkpointed screening job")
+    job.add_argument("--job-dir", required=True, help="Job directory (manifest, checkpoints, results)")
+    job.add_argument("--jd", help="Job description text file (needed to create the job)")
+    job.add_argument(
+        "--resumes",
+        help="Resume directory (needed to create the job; elsewhere, where this machine mounts it)"
+    )
+    job.add_argument("--shard-size", type=int, default=500, help="Files per shard")
+    job.add_argument("--workers", type=int, default=default_worker_count(), help="Worker processes on this machine")
+    job.add_argument("--output", "-o", help="Merged JSONL results (default: results.jsonl in the job directory)")
+    job.add_argument("--lease", type=float, default=600.0, help="Seconds before a silent worker's shard is taken over")
+    job.add_argument("--cache", help="Path to an extraction cache database")
+    job.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Maximum PDF pages per file")
+    job.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help="Maximum characters per file")
+    job.add_argument("--extractor", choices=EXTRACTOR_CHOICES, default=DEFAULT_EXTRACTOR, help="Text extractor")
+    job.add_argument(
+        "--extract-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Seconds allowed to parse one file before it is failed (0 for no limit)"
+    )
+    job.add_argument(
+        "--extract-memory",
+        type=int,
+        default=DEFAULT_MAX_MEMORY_MB,
+        help="Memory in MB allowed while parsing one file, not enforced on Windows (0 for no limit)"
+    )
+    job.add_argument("--no-sandbox", action="store_true", help="Parse files in the worker processes themselves")
+    job.add_argument("--lexicon", default=str(DATA_DIR / "skills_lexicon.json"), help="Skills lexicon JSON")
+    job.add_argument("--roles", default=str(DATA_DIR / "role_library.json"), help="Role library JSON")
+    job.add_argument(
+        "--artifact",
+        default=str(ARTIFACT_PATH),
+        help="Precompiled lexicon/role artifact, rebuilt when stale (empty string to disable)"
+    )
+    
+    job_status = subparsers.add_parser("job-status", help="Show the progress of a screening job")
+    job_status.add_argument("--job-dir", required=True, help="Job directory")
+    
+    serve = subparsers.add_parser("serve", help="Run the local HTTP screening service")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port")
+    serve.add_argument("--workers", type=int, default=default_worker_count(), help="Worker processes")
+    serve.add_argument("--queue-size", type=int, default=256, help="Files that may wait across all tenants")
+    serve.add_argument("--tenant-concurrency", type=int, default=2, help="Files one tenant may screen at once")
+    serve.add_argument(
+        "--tenant-queue-size",
+        type=int,
+        help="Files one tenant may have waiting (default: half the queue)"
+    )
+    serve.add_argument("--max-request-mb", type=int, default=64, help="Largest accepted batch upload in MB")
+    serve.add_argument("--cache", help="Path to an extraction cache database")
+    serve.add_argument("--jd-cache", help="Path to a parsed-JD cache database (reused across restarts)")
+    serve.add_argument("--store", help="Also save profiles to this SQLite profile store")
+    serve.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Maximum PDF pages per file")
+    serve.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help="Maximum characters per file")
+    serve.add_argument(
+        "--extract-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Seconds allowed to parse one file before it is failed (0 for no limit)"
+    )
+    serve.add_argument(
+        "--extract-memory",
+        type=int,
+        default=DEFAULT_MAX_MEMORY_MB,
+        help="Memory in MB allowed while parsing one file, not enforced on Windows (0 for no limit)"
+    )
+    serve.add_argument("--no-sandbox", action="store_true", help="Parse files in the worker processes themselves")
+    serve.add_argument("--lexicon", default=str(DATA_DIR / "skills_lexicon.json"), help="Skills lexicon JSON")
+    serve.add_argument("--roles", default=str(DATA_DIR / "role_library.json"), help="Role library JSON")
+    serve.add_argument(
+        "--artifact",
+        default=str(ARTIFACT_PATH),
+        help="Precompiled lexicon/role artifact, rebuilt when stale (empty string to disable)"
+    )
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line interface."""
+    args = build_parser().parse_args(argv)
+    if getattr(args, "jd_cache", None):
+        jd_cache.configure(db_path=args.jd_cache)
+    
+    if args.command == "screen":
+        metrics.enable(bool(args.metrics_out))
+        if args.output:
+            with open(args.output, 'w') as out:
+                summary = run_screen(args, out)
+        else:
+            summary = run_screen(args, sys.stdout)
+        
+        print(
+            f"Screened {summary['screened']}/{summary['files']} files "
+            f"({summary['duplicates']} duplicates, {summary['empty']} empty, {summary['failed']} failed) "
+            f"in {summary['seconds']}s: "
+            f"{summary['files_per_second']} files/s, {summary['mb_per_second']} MB/s",
+            file=sys.stderr
+        )
+        
+        if args.metrics_out:
+            with open(args.metrics_out, 'w') as f:
+                if args.metrics_format == "json":
+                    f.write(metrics.REGISTRY.to_json())
+                else:
+                    f.write(metrics.REGISTRY.to_prometheus())
+            print(f"Wrote {args.metrics_format} metrics to {args.metrics_out}", file=sys.stderr)
+    
+    elif args.command == "profiles":
+        with SQLiteProfileStore(args.store) as store:
+            for profile in store.query(
+                filename=args.filename,
+                recommendation=args.recommendation,
+                min_confidence=args.min_confidence,
+                max_confidence=args.max_confidence,
+                since=args.since,
+                until=args.until,
+                limit=args.limit
+            ):
+                print(json.dumps(profile))
+    
+    elif args.command == "search":
+        # Imported here: the index pulls in numpy, which no other command needs
+        from .candidate_index import CandidateIndex
+        
+        with SQLiteProfileStore(args.store) as store:
+            index = CandidateIndex.from_store(store, follow=False)
+        
+        if args.query:
+            try:
+                candidate_ids = index.search(args.query, limit=args.top)
+            except ValueError as e:
+                print(f"Invalid query: {e}", file=sys.stderr)
+                return 2
+            for candidate_id in candidate_ids:
+                print(json.dumps({"candidate_id": candidate_id}))
+        else:
+            lexicon = CompiledLexicon.from_file(args.lexicon)
+            jd_skills = jd_cache.parse_job_description_cached(Path(args.jd).read_text(), lexicon)["jd_required_skills"]
+            for match in index.top_matches(jd_skills, args.top):
+                print(json.dumps(match))
+    
+    elif args.command == "role-fits":
+        # Imported here: the matrix pulls in numpy, which no other command needs
+        from .role_fit import RoleFitMatrix
+        
+        with open(args.roles, 'r') as f:
+            roles_library = json.load(f).get("roles", [])
+        try:
+            matrix = RoleFitMatrix(roles_library, args.required_weight, args.preferred_weight)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            return 2
+        
+        with SQLiteProfileStore(args.store) as store:
+            candidates = list(store.iter_skills())
+        fits = matrix.role_fits([skills for _, _, skills in candidates], args.top, args.min_fit)
+        for (candidate_id, filename, _), candidate_fits in zip(candidates, fits):
+            print(json.dumps({"candidate_id": candidate_id, "filename": filename, "role_fits": candidate_fits}))
+    
+    elif args.command == "migrate-profiles":
+        with SQLiteProfileStore(args.store) as store:
+            if store.count():
+                print(f"{args.store} already holds profiles; refusing to migrate twice", file=sys.stderr)
+                return 1
+            copied = migrate_profiles(DirectoryProfileStore(args.source), store)
+        print(f"Migrated {copied} profiles from {args.source} to {args.store}", file=sys.stderr)
+    
+    elif args.command == "job":
+        from . import batch_jobs
+        
+        job_dir = Path(args.job_dir)
+        if not (job_dir / "manifest.json").exists():
+            if not args.jd or not args.resumes:
+                print(f"{job_dir} holds no job yet: --jd and --resumes are needed to create it", file=sys.stderr)
+                return 2
+            data = load_screening_data(args.lexicon, args.roles, args.artifact or None)
+            batch_jobs.create_job(
+                args.job_dir,
+                Path(args.jd).read_text(),
+                args.resumes,
+                args.shard_size,
+                args.extractor,
+                args.max_pages,
+                args.max_chars,
+                batch_jobs.data_hash(data.skills, data.roles)
+            )
+        status = batch_jobs.job_status(args.job_dir, args.lease)
+        print(
+            f"Job {args.job_dir}: {status['files_done']}/{status['files']} files, "
+            f"{status['shards_done']}/{status['shards']} shards done",
+            file=sys.stderr
+        )
+        
+        start = time.perf_counter()
+        stats = batch_jobs.run_job(
+            args.job_dir,
+            args.workers,
+            lexicon_path=args.lexicon,
+            roles_path=args.roles,
+            resume_dir=args.resumes,
+            artifact_path=args.artifact or None,
+            cache_path=args.cache,
+            sandbox_limits=_sandbox_limits(args),
+            lease=args.lease
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"Screened {stats['files']} files in {stats['shards']} shards in {elapsed:.1f}s",
+            file=sys.stderr
+        )
+        
+        try:
+            summary = batch_jobs.merge_results(args.job_dir, args.output)
+        except RuntimeError as e:
+            # Shards still held by workers elsewhere; the last one to finish merges
+            print(f"Not merging yet: {e}", file=sys.stderr)
+            return 0
+        for filename, error in summary["errors"]:
+            print(f"Error processing {filename}: {error}", file=sys.stderr)
+        print(
+            f"Merged {summary['screened']}/{summary['files']} files "
+            f"({summary['duplicates']} duplicates, {summary['empty']} empty, {summary['failed']} failed) "
+            f"into {args.output or job_dir / 'results.jsonl'}",
+            file=sys.stderr
+        )
+    
+    elif args.command == "job-status":
+        from .batch_jobs import job_status
+        
+        print(json.dumps(job_status(args.job_dir)))
+    
+    elif args.command == "serve":
+        # Imported here: only the service needs the asyncio HTTP stack
+        import asyncio
+        from .service import ScreeningService, serve
+        
+        metrics.enable()
+        service = ScreeningService(
+            args.lexicon,
+            args.roles,
+            workers=args.workers,
+            queue_size=args.queue_size,
+            tenant_concurrency=args.tenant_concurrency,
+            tenant_queue_size=args.tenant_queue_size,
+            cache_path=args.cache,
+            artifact_path=args.artifact or None,
+            max_pages=args.max_pages,
+            max_chars=args.max_chars,
+            sandbox_limits=_sandbox_limits(args),
+            store_path=args.store
+        )
+        
+        def ready(address):
+            print(f"Serving on http://{address[0]}:{address[1]} with {service.workers} workers", file=sys.stderr)
+        
+        try:
+            asyncio.run(serve(service, args.host, args.port, args.max_request_mb, ready))
+        except KeyboardInterrupt:
+            pass
+    
+    elif args.command == "build-artifact":
+        data = build_screening_data(args.lexicon, args.roles)
+        write_artifact(data, args.output)
+        print(
+            f"Wrote {len(data.skills)} skills and {len(data.roles)} roles to {args.output} "
+            f"(source hash {data.source_hash[:12]})",
+            file=sys.stderr
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Precompiled screening data: lexicon matcher and role index in one file.
+
+Building the compiled lexicon and role index from JSON is repeated by every
+new process (app server, CLI run, pool worker). The artifact stores both
+prebuilt, stamped with a format version and a hash of the source JSON files,
+so a stale or incompatible artifact is rebuilt instead of being used.
+
+The file is a local cache written by this package and loaded with pickle;
+do not load artifacts from untrusted sources.
+"""
+import gc
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .role_matcher import RoleIndex
+from .skill_extractor import CompiledLexicon
+
+# Bump whenever CompiledLexicon or RoleIndex change their internal layout
+ARTIFACT_VERSION = 1
+_MAGIC = b"RMXA\n"
+
+
+class ScreeningData:
+    """Skills lexicon and role library with their prebuilt matcher and index."""
+    
+    def __init__(
+        self,
+        skills: List[str],
+        roles: List[dict],
+        lexicon: CompiledLexicon,
+        role_index: RoleIndex,
+        source_hash: str
+    ):
+        self.skills = skills
+        self.roles = roles
+        self.lexicon = lexicon
+        self.role_index = role_index
+        self.source_hash = source_hash
+
+
+def source_hash(lexicon_path: str, roles_path: str) -> str:
+    """
+    Hash identifying the inputs and format of an artifact.
+    
+    Args:
+        lexicon_path: Path to skills_lexicon.json
+        roles_path: Path to role_library.json
+        
+    Returns:
+        Hex digest over the artifact version, Python version and both files
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{ARTIFACT_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    for path in (lexicon_path, roles_path):
+        with open(path, 'rb') as f:
+            content = f.read()
+        digest.update(len(content).to_bytes(8, "big"))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def build_screening_data(lexicon_path: str, roles_path: str) -> ScreeningData:
+    """
+    Build screening data from the JSON sources.
+    
+    Args:
+        lexicon_path: Path to skills_lexicon.json
+        roles_path: Path to role_library.json
+        
+    Returns:
+        ScreeningData with a freshly compiled lexicon and role index
+    """
+    with open(lexicon_path, 'r') as f:
+        skills = json.load(f).get("skills", [])
+    with open(roles_path, 'r') as f:
+        roles = json.load(f).get("roles", [])
+    return ScreeningData(
+        skills,
+        roles,
+        CompiledLexicon(skills),
+        RoleIndex(roles),
+        source_hash(lexicon_path, roles_path)
+    )
+
+
+def write_artifact(data: ScreeningData, artifact_path: str):
+    """
+    Write screening data to an artifact file atomically.
+    
+    Args:
+        data: Screening data to store
+        artifact_path: Destination file
+    """
+    artifact_path = Path(artifact_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    header = json.dumps({"version": ARTIFACT_VERSION, "source_hash": data.source_hash}).encode()
+    payload = pickle.dumps(
+        {"skills": data.skills, "roles": data.roles, "lexicon": data.lexicon, "role_index": data.role_index},
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+    
+    # Concurrent writers (e.g. pool workers) each write their own temp file
+    tmp_path = artifact_path.with_name(f"{artifact_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_MAGIC + header + b"\n" + payload)
+    os.replace(tmp_path, artifact_path)
+
+
+def read_artifact(artifact_path: str, expected_hash: Optional[str] = None) -> Optional[ScreeningData]:
+    """
+    Load screening data from an artifact file.
+    
+    Args:
+        artifact_path: Artifact file
+        expected_hash: Source hash the artifact must carry (default: any)
+        
+    Returns:
+        ScreeningData, or None if the file is missing, stale or unreadable
+    """
+    try:
+        with open(artifact_path, 'rb') as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                return None
+            header = json.loads(f.readline())
+            if header.get("version") != ARTIFACT_VERSION:
+                return None
+            if expected_hash is not None and header.get("source_hash") != expected_hash:
+                return None
+            payload = f.read()
+    except (OSError, ValueError):
+        return None
+    
+    # Unpickling allocates many small dicts; collection passes would only slow it down
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        stored = pickle.loads(payload)
+    except Exception as e:
+        print(f"Error reading screening data artifact: {e}")
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    return ScreeningData(
+        stored["skills"],
+        stored["roles"],
+        stored["lexicon"],
+        stored["role_index"],
+        header["source_hash"]
+    )
+
+
+def load_screening_data(
+    lexicon_path: str,
+    roles_path: str,
+    artifact_path: Optional[str] = None
+) -> ScreeningData:
+    """
+    Load screening data from the artifact, rebuilding it if stale.
+    
+    Args:
+        lexicon_path: Path to skills_lexicon.json
+        roles_path: Path to role_library.json
+        artifact_path: Artifact file to read and refresh (default: build in memory only)
+        
+    Returns:
+        ScreeningData matching the current JSON sources
+    """
+    if artifact_path is None:
+        return build_screening_data(lexicon_path, roles_path)
+    
+    expected_hash = source_hash(lexicon_path, roles_path)
+    data = read_artifact(artifact_path, expected_hash)
+    if data is not None:
+        return data
+    
+    data = build_screening_data(lexicon_path, roles_path)
+    try:
+        write_artifact(data, artifact_path)
+    except OSError as e:
+        print(f"Error writing screening data artifact: {e}")
+    return data
@@ -0,0 +1,256 @@
+"""
+Persistent content-addressed cache for extracted resume text and skills.
+"""
+import atexit
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import List, Optional
+
+from .file_loader import EXTRACTOR_VERSION
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Eviction trims the cache to this share of max_bytes, so it runs once per
+# tenth of the cache turned over rather than on every insert once full
+EVICT_TO = 0.9
+# Seconds between writes of a process's hit/miss counts to the database
+STATS_FLUSH_INTERVAL = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_extractions_last_access ON extractions (last_access);
+CREATE TABLE IF NOT EXISTS skills (
+    key TEXT NOT NULL REFERENCES extractions (key) ON DELETE CASCADE,
+    lexicon_hash TEXT NOT NULL,
+    skills TEXT NOT NULL,
+    PRIMARY KEY (key, lexicon_hash)
+);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('hits', 0), ('misses', 0);
+-- Running total of extractions.size, kept in step by put_text
+INSERT OR IGNORE INTO stats (name, value) SELECT 'size_bytes', COALESCE(SUM(size), 0) FROM extractions;
+"""
+
+
+def file_cache_key(file_bytes: bytes, *options) -> str:
+    """
+    Build the cache key for an uploaded file.
+    
+    Args:
+        file_bytes: Raw content of the uploaded file
+        *options: Extraction settings that change the output, e.g. page budgets
+        
+    Returns:
+        SHA-256 of the content combined with the extractor version and options
+    """
+    return ":".join([hashlib.sha256(file_bytes).hexdigest(), EXTRACTOR_VERSION] + [str(o) for o in options])
+
+
+class ExtractionCache:
+    """
+    SQLite cache of extracted text and per-lexicon skill lists.
+    
+    Entries are keyed by file content hash, so re-uploads of the same resume
+    skip parsing. The database runs in WAL mode with a busy timeout and one
+    connection per thread, which makes it safe to share between Streamlit
+    sessions and worker processes. Total text size is bounded by evicting
+    the least recently used entries once a running total stored next to
+    them passes max_bytes. Hit and miss counters are kept in memory and
+    added to the database every STATS_FLUSH_INTERVAL seconds, on stats(),
+    on close() and at exit, so they cover every process using the cache.
+    """
+    
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending = {"hits": 0, "misses": 0}
+        self._last_flush = time.monotonic()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        with conn:
+            conn.executescript(_SCHEMA)
+        # Pool workers never close their cache; keep their last counts anyway
+        atexit.register(_flush_at_exit, weakref.ref(self))
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+    
+    def _count(self, name: str):
+        """Count a lookup, writing the counts out when the flush interval has passed."""
+        with self._lock:
+            self._pending[name] += 1
+            due = time.monotonic() - self._last_flush >= STATS_FLUSH_INTERVAL
+        if due:
+            self.flush_stats()
+    
+    def flush_stats(self):
+        """Add this process's pending hit and miss counts to the database."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {"hits": 0, "misses": 0}
+            self._last_flush = time.monotonic()
+        if not any(pending.values()):
+            return
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "UPDATE stats SET value = value + ? WHERE name = ?",
+                [(count, name) for name, count in pending.items() if count]
+            )
+    
+    def get_text(self, key: str) -> Optional[str]:
+        """
+        Look up extracted text, refreshing its LRU position on a hit.
+        
+        Args:
+            key: Cache key from file_cache_key
+            
+        Returns:
+            Cached text or None on a miss
+        """
+        conn = self._connect()
+        with conn:
+            row = conn.execute("SELECT text FROM extractions WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE extractions SET last_access = ? WHERE key = ?", (time.time(), key))
+        self._count("misses" if row is None else "hits")
+        return row[0] if row is not None else None
+    
+    def put_text(self, key: str, text: str):
+        """
+        Store extracted text, evicting old entries if the size bound is passed.
+        
+        Args:
+            key: Cache key from file_cache_key
+            text: Extracted text
+        """
+        size = len(text.encode("utf-8"))
+        conn = self._connect()
+        with conn:
+            # Take the write lock up front so the size read below stays true
+            # until the running total is updated
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT size FROM extractions WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO extractions (key, text, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time())
+            )
+            conn.execute(
+                "UPDATE stats SET value = value + ? WHERE name = 'size_bytes'",
+                (size - (row[0] if row else 0),)
+            )
+            total = conn.execute("SELECT value FROM stats WHERE name = 'size_bytes'").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            
+            conn.execute(
+                """
+                DELETE FROM extractions WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) AS running
+                        FROM extractions
+                    ) WHERE running > ?
+                )
+                """,
+                (int(self.max_bytes * EVICT_TO),)
+            )
+            conn.execute(
+                "UPDATE stats SET value = (SELECT COALESCE(SUM(size), 0) FROM extractions) WHERE name = 'size_bytes'"
+            )
+    
+    def get_skills(self, key: str, lexicon_hash: str) -> Optional[List[str]]:
+        """
+        Look up the skills extracted from a cached file with a given lexicon.
+        
+        Args:
+            key: Cache key from file_cache_key
+            lexicon_hash: CompiledLexicon.fingerprint of the lexicon used
+            
+        Returns:
+            Cached skill list or None if not present
+        """
+        row = self._connect().execute(
+            "SELECT skills FROM skills WHERE key = ? AND lexicon_hash = ?",
+            (key, lexicon_hash)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put_skills(self, key: str, lexicon_hash: str, skills: List[str]):
+        """
+        Store the skills extracted from a cached file with a given lexicon.
+        
+        Args:
+            key: Cache key from file_cache_key
+            lexicon_hash: CompiledLexicon.fingerprint of the lexicon used
+            skills: Extracted skill list
+        """
+        conn = self._connect()
+        with conn:
+            # Skip if the text entry was evicted in the meantime
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO skills (key, lexicon_hash, skills)
+                SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM extractions WHERE key = ?)
+                """,
+                (key, lexicon_hash, json.dumps(skills), key)
+            )
+    
+    def stats(self) -> dict:
+        """
+        Get cache counters and size.
+        
+        Returns:
+            Dictionary with hits, misses, hit_rate, entries and size_bytes
+        """
+        self.flush_stats()
+        conn = self._connect()
+        counters = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+        entries = conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+        lookups = counters.get("hits", 0) + counters.get("misses", 0)
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "hit_rate": round(counters.get("hits", 0) / lookups, 2) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": counters.get("size_bytes", 0)
+        }
+    
+    def close(self):
+        """Write out pending counters and close this thread's connection."""
+        self.flush_stats()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _flush_at_exit(cache_ref: "weakref.ref"):
+    """Write out the pending counters of a cache that is still alive."""
+    cache = cache_ref()
+    if cache is not None:
+        try:
+            cache.flush_stats()
+        except sqlite3.Error:
+            pass
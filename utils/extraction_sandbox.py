@@ -0,0 +1,293 @@
+"""
+Document text extraction in isolated worker processes.
+
+PDF parsing is the one stage that runs untrusted input through a large
+third-party parser. A malformed file can make it loop or allocate without
+bound, which in-process would hang or OOM-kill the app server with every
+session on it. The sandbox runs extraction in long-lived child processes
+and holds each file to a wall-clock timeout and a memory cap; a child that
+breaches either is killed and replaced, and the file is reported as failed
+with the reason.
+
+The memory cap is enforced twice. Inside the child it is an address-space
+limit (RLIMIT_AS), so an allocation past it fails with MemoryError and the
+worker reports the file before exiting; address space counts reserved as
+well as resident memory, so this is the stricter measure. The parent also
+samples the child's resident set size from /proc every POLL_INTERVAL and
+kills a child above the cap, which covers systems where the limit cannot be
+set, though a fast allocation can overshoot between samples. The limit is
+POSIX-only and the sampling Linux-only; the timeout applies everywhere.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from . import metrics
+from .file_loader import iter_text_from_file, DEFAULT_EXTRACTOR
+
+# Budgets per file: far above what any real resume needs
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_MEMORY_MB = 1024
+
+# How often a busy worker is checked against its budgets, in seconds
+POLL_INTERVAL = 0.05
+
+# Time allowed for a new worker to start and import the parsers
+STARTUP_TIMEOUT = 60.0
+
+_MB = 1024 * 1024
+_READY = "ready"
+
+
+class ExtractionError(RuntimeError):
+    """A file was abandoned because its worker breached a budget or died."""
+
+
+def _limit_address_space(max_memory_mb: int):
+    """Cap the calling process's address space at max_memory_mb."""
+    if resource is None:
+        return
+    limit = max_memory_mb * _MB
+    try:
+        hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        # Not permitted here; the parent's resident-size sampling still applies
+        pass
+
+
+def _worker_main(conn, max_memory_mb: Optional[int] = None):
+    """Child process loop: extract text for each task until told to stop."""
+    # Import the parsers before reporting ready so their import time is not
+    # charged to the first file's budget
+    import pdfplumber  # noqa: F401
+    
+    if max_memory_mb is not None:
+        _limit_address_space(max_memory_mb)
+    
+    # Counters such as pages read are collected here and shipped with each reply
+    metrics.enable()
+    conn.send(_READY)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        file_bytes, max_pages, max_chars, extractor = task
+        try:
+            text = "\n".join(iter_text_from_file(file_bytes, max_pages, max_chars, extractor)).strip()
+            conn.send(("ok", text, metrics.REGISTRY.snapshot(reset=True)))
+        except MemoryError:
+            conn.send(("memory", None, None))
+            return
+        except Exception as e:
+            conn.send(("error", str(e), metrics.REGISTRY.snapshot(reset=True)))
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm", 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _Worker:
+    """One extraction child process and the parent's end of its pipe."""
+    
+    def __init__(self, context, max_memory_mb: Optional[int] = None):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, max_memory_mb), daemon=True)
+        self.process.start()
+        child_conn.close()
+        try:
+            ready = self.conn.recv() if self.conn.poll(STARTUP_TIMEOUT) else None
+        except EOFError:
+            ready = None
+        if ready != _READY:
+            self.kill()
+            raise ExtractionError("extraction worker failed to start")
+    
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+    
+    def stop(self):
+        """Ask the worker to exit after its current task."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+    
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ExtractionSandbox:
+    """
+    Pool of extraction worker processes with per-file time and memory budgets.
+    
+    Workers start on first use and are reused across files. extract_text is
+    safe to call from several threads; at most `workers` files are extracted
+    at once and further callers wait for a free worker. timeout (seconds per
+    file) and max_memory_mb (memory per worker) may be None for no limit.
+    """
+    
+    def __init__(
+        self,
+        workers: int = 1,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        max_memory_mb: Optional[int] = DEFAULT_MAX_MEMORY_MB
+    ):
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        # Spawn rather than fork: the Streamlit server is multi-threaded
+        self._context = multiprocessing.get_context("spawn")
+        self._slots = threading.BoundedSemaphore(max(1, workers))
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._stats = {"files": 0, "timeouts": 0, "memory": 0, "crashes": 0, "restarts": 0}
+    
+    def extract_text(
+        self,
+        file_bytes: bytes,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        extractor: str = DEFAULT_EXTRACTOR
+    ) -> str:
+        """
+        Extract a document's text in a worker process.
+        
+        Gives the same text as joining iter_text_from_file's chunks with
+        newlines and stripping the result.
+        
+        Args:
+            file_bytes: Raw content of the file (bytes or memoryview)
+            max_pages: Maximum number of PDF pages to read (None for all)
+            max_chars: Maximum number of characters to extract (None for all)
+            extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+            
+        Returns:
+            Extracted text
+            
+        Raises:
+            ExtractionError: If the worker timed out, exceeded the memory cap
+                or died; the worker is replaced before the next file
+            ValueError: If the parser rejected the file (the worker is kept)
+        """
+        with self._slots:
+            worker = self._checkout()
+            try:
+                status, payload, worker_metrics = self._run(
+                    worker, (bytes(file_bytes), max_pages, max_chars, extractor)
+                )
+            except BaseException:
+                worker.kill()
+                raise
+            
+            if status == "memory":
+                worker.kill()
+                self._count("memory")
+                raise ExtractionError("extraction ran out of memory")
+            with self._lock:
+                self._stats["files"] += 1
+            if self._over_memory(worker) is not None:
+                # The file finished, but a worker left this large would fail the next one
+                worker.kill()
+                with self._lock:
+                    self._stats["restarts"] += 1
+            else:
+                with self._lock:
+                    self._idle.append(worker)
+        
+        if worker_metrics and metrics.is_enabled():
+            metrics.REGISTRY.merge(worker_metrics)
+        if status == "error":
+            raise ValueError(payload)
+        return payload
+    
+    def _checkout(self) -> _Worker:
+        """Take an idle live worker, starting a new one if there is none."""
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+                worker.kill()
+        return _Worker(self._context, self.max_memory_mb)
+    
+    def _run(self, worker: _Worker, task: tuple) -> tuple:
+        """Send one task to a worker and wait for its reply within the budgets."""
+        start = time.monotonic()
+        try:
+            worker.conn.send(task)
+        except OSError:
+            self._count("crashes")
+            raise ExtractionError("extraction worker died before the file was sent")
+        
+        while not worker.conn.poll(POLL_INTERVAL):
+            if self.timeout is not None and time.monotonic() - start > self.timeout:
+                self._count("timeouts")
+                raise ExtractionError(f"extraction timed out after {self.timeout:g}s")
+            rss = self._over_memory(worker)
+            if rss is not None:
+                self._count("memory")
+                raise ExtractionError(
+                    f"extraction exceeded the {self.max_memory_mb} MB memory limit ({rss // _MB} MB in use)"
+                )
+        
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            worker.process.join(1)
+            self._count("crashes")
+            raise ExtractionError(f"extraction worker died (exit code {worker.process.exitcode})")
+    
+    def _over_memory(self, worker: _Worker) -> Optional[int]:
+        """The worker's resident size in bytes if it is above the cap, else None."""
+        if self.max_memory_mb is None:
+            return None
+        rss = _rss_bytes(worker.process.pid)
+        return rss if rss is not None and rss > self.max_memory_mb * _MB else None
+    
+    def _count(self, reason: str):
+        with self._lock:
+            self._stats["files"] += 1
+            self._stats[reason] += 1
+            self._stats["restarts"] += 1
+    
+    def stats(self) -> dict:
+        """
+        Extraction counters since the sandbox was created.
+        
+        Returns:
+            Dictionary with files, timeouts, memory (cap breaches), crashes
+            and restarts (workers replaced after a failure or for being left
+            above the memory cap by a finished file)
+        """
+        with self._lock:
+            return dict(self._stats)
+    
+    def close(self):
+        """Stop all idle workers."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+            worker.process.join(1)
+            if worker.is_alive():
+                worker.kill()
@@ -1,72 +1,500 @@
 """
 File loader utility to extract text from PDF and DOCX files.
 """
-import pdfplumber
-from docx import Document
-from typing import Optional
+import io
+import os
+import threading
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from . import metrics
 
-def extract_text_from_pdf(file_path: str) -> str:
+# Bump whenever extraction output changes so cached text is invalidated
+EXTRACTOR_VERSION = "2"
+
+# A path, raw bytes or an open binary file object
+DocumentSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+# PDF readers accept junk before the header, so look a little further in
+_PDF_MAGIC = b"%PDF-"
+_PDF_SNIFF_BYTES = 1024
+_ZIP_MAGIC = b"PK\x03\x04"
+
+RESUME_SUFFIXES = {".pdf", ".docx"}
+
+
+def find_resumes(resume_dir: Path) -> List[Path]:
+    """
+    Find resume files under a directory.
+    
+    Args:
+        resume_dir: Directory to search recursively
+        
+    Returns:
+        Sorted list of PDF and DOCX paths
+    """
+    return sorted(
+        path for path in resume_dir.rglob("*")
+        if path.is_file() and path.suffix.lower() in RESUME_SUFFIXES
+    )
+
+
+def _open_source(source: DocumentSource) -> Union[str, os.PathLike, BinaryIO]:
+    """
+    Normalize a document source to a path or a seekable binary stream.
+    
+    Bytes-like sources are wrapped in memory so nothing is written to disk.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if not source.seekable():
+        return io.BytesIO(source.read())
+    source.seek(0)
+    return source
+
+
+def sniff_format(source: DocumentSource) -> Optional[str]:
+    """
+    Detect the document format from its leading bytes.
+    
+    Args:
+        source: Path, bytes, memoryview or binary file object
+        
+    Returns:
+        "pdf", "docx" or None if the format is not supported
+    """
+    stream = _open_source(source)
+    if isinstance(stream, (str, os.PathLike)):
+        with open(stream, 'rb') as f:
+            return sniff_format(f)
+    
+    header = stream.read(_PDF_SNIFF_BYTES)
+    stream.seek(0)
+    
+    if header.startswith(_ZIP_MAGIC):
+        # DOCX is a zip container with a word/ part
+        try:
+            with zipfile.ZipFile(stream) as archive:
+                is_docx = "word/document.xml" in archive.namelist()
+        except zipfile.BadZipFile:
+            is_docx = False
+        finally:
+            stream.seek(0)
+        return "docx" if is_docx else None
+    
+    if _PDF_MAGIC in header:
+        return "pdf"
+    
+    return None
+
+
+def _apply_char_budget(chunks: Iterator[str], max_chars: Optional[int]) -> Iterator[str]:
+    """Yield chunks until max_chars is reached, truncating the last one."""
+    remaining = max_chars
+    for chunk in chunks:
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+        yield chunk
+
+
+def _pdfplumber_pages(stream: BinaryIO, max_pages: Optional[int]) -> Iterator[str]:
+    """Layout-aware page text from pdfplumber (accurate, slow)."""
+    # Imported on first use: pdfplumber is slow to import and many runs see no PDFs
+    import pdfplumber
+    
+    with pdfplumber.open(stream) as pdf:
+        for page in pdf.pages[:max_pages]:
+            page_text = page.extract_text()
+            page.close()
+            yield page_text or ""
+
+
+def _pdfminer_pages(stream: BinaryIO, max_pages: Optional[int]) -> Iterator[str]:
+    """Page text from pdfminer.six with line grouping but no reading-order analysis."""
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    
+    resources = PDFResourceManager()
+    for page_number, page in enumerate(PDFPage.get_pages(stream)):
+        if max_pages is not None and page_number >= max_pages:
+            return
+        output = io.StringIO()
+        device = TextConverter(resources, output, laparams=LAParams(boxes_flow=None))
+        PDFPageInterpreter(resources, device).process_page(page)
+        device.close()
+        yield output.getvalue().replace("\x0c", "").strip()
+
+
+# pdfium is not thread-safe, so documents are read one at a time per process
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _pdfium_pages(stream: BinaryIO, max_pages: Optional[int]) -> Iterator[str]:
+    """Page text from PDFium's text layer via pypdfium2 (fast, no layout)."""
+    import pypdfium2
+    
+    pages = []
+    with _PDFIUM_LOCK:
+        pdf = pypdfium2.PdfDocument(stream.read())
+        try:
+            for page_number in range(min(len(pdf), max_pages) if max_pages is not None else len(pdf)):
+                page = pdf[page_number]
+                text_page = page.get_textpage()
+                pages.append(text_page.get_text_range().replace("\r\n", "\n").replace("\r", "\n").strip())
+                text_page.close()
+                page.close()
+        finally:
+            pdf.close()
+    return iter(pages)
+
+
+_W_NAMESPACES = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    # ISO 29500 Strict documents use their own namespace for the same markup
+    "http://purl.oclc.org/ooxml/wordprocessingml/main"
+)
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+
+def _w_tags(*names: str) -> frozenset:
+    return frozenset(f"{{{namespace}}}{name}" for namespace in _W_NAMESPACES for name in names)
+
+
+_OOXML_PARAGRAPH = _w_tags("p")
+_OOXML_RUN = _w_tags("r")
+_OOXML_TEXT = _w_tags("t")
+# Run content that stands for a character, as python-docx renders it
+_OOXML_TABS = _w_tags("tab", "ptab")
+_OOXML_NEWLINES = _w_tags("cr")
+_OOXML_BREAKS = _w_tags("br")
+_OOXML_HYPHENS = _w_tags("noBreakHyphen")
+_OOXML_BREAK_TYPE = frozenset(f"{{{namespace}}}type" for namespace in _W_NAMESPACES)
+
+
+def _ooxml_part_names(archive: zipfile.ZipFile) -> list:
+    """Text-bearing parts in reading order: headers, body, notes, footers."""
+    def numbered(prefix):
+        names = [
+            name for name in archive.namelist()
+            if name.startswith(prefix) and name.endswith(".xml") and name[len(prefix):-4].isdigit()
+        ]
+        return sorted(names, key=lambda name: int(name[len(prefix):-4]))
+    
+    names = set(archive.namelist())
+    return (
+        numbered("word/header")
+        + ["word/document.xml"]
+        + [name for name in ("word/footnotes.xml", "word/endnotes.xml") if name in names]
+        + numbered("word/footer")
+    )
+
+
+def _ooxml_part_paragraphs(part: BinaryIO) -> Iterator[str]:
+    """
+    Paragraph text of one WordprocessingML part, streamed with iterparse.
+    
+    Every element is detached from its parent once it ends, so memory is
+    bounded by the nesting depth rather than the part's size. Paragraphs in
+    text boxes nest inside a run of the enclosing paragraph and are yielded
+    before it. Deleted text (w:delText) and field codes (w:instrText) are not
+    text runs and are skipped, as is the w:pict copy of a text box under
+    mc:Fallback, which duplicates the drawing's text.
+    """
+    from xml.etree.ElementTree import iterparse
+    
+    elements = []
+    paragraphs = []
+    runs = fallbacks = 0
+    for event, element in iterparse(part, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            elements.append(element)
+            if tag in _OOXML_PARAGRAPH:
+                # A text box paragraph starts outside any run of its own
+                paragraphs.append(([], runs))
+                runs = 0
+            elif tag in _OOXML_RUN:
+                runs += 1
+            elif tag == _MC_FALLBACK:
+                fallbacks += 1
+            continue
+        
+        elements.pop()
+        if elements:
+            elements[-1].remove(element)
+        if tag in _OOXML_PARAGRAPH:
+            chunks, runs = paragraphs.pop()
+            if not fallbacks:
+                yield "".join(chunks)
+        elif tag in _OOXML_RUN:
+            runs -= 1
+        elif tag == _MC_FALLBACK:
+            fallbacks -= 1
+        elif runs and paragraphs:
+            # Tab stops in paragraph properties are also w:tab, hence the run check
+            chunks = paragraphs[-1][0]
+            if tag in _OOXML_TEXT:
+                chunks.append(element.text or "")
+            elif tag in _OOXML_TABS:
+                chunks.append("\t")
+            elif tag in _OOXML_NEWLINES:
+                chunks.append("\n")
+            elif tag in _OOXML_BREAKS:
+                # Line breaks only; page and column breaks carry no text
+                break_type = next((element.get(name) for name in _OOXML_BREAK_TYPE if element.get(name)), None)
+                if break_type in (None, "textWrapping"):
+                    chunks.append("\n")
+            elif tag in _OOXML_HYPHENS:
+                chunks.append("-")
+
+
+def _ooxml_paragraphs(stream: BinaryIO) -> Iterator[str]:
+    """
+    Paragraph text read straight from the DOCX zip, without python-docx.
+    
+    Covers the body (including tables, content controls, tracked insertions
+    and text boxes), headers, footers, footnotes and endnotes. Each part is
+    decompressed and parsed as a stream, so memory stays flat on large files
+    and a character budget stops reading early.
+    """
+    with zipfile.ZipFile(stream) as archive:
+        for name in _ooxml_part_names(archive):
+            with archive.open(name) as part:
+                yield from _ooxml_part_paragraphs(part)
+
+
+# Readers by backend name. PDF readers take (stream, max_pages) and yield one
+# string per page read; DOCX readers take a stream and yield paragraphs.
+PDF_BACKENDS: Dict[str, Callable[[BinaryIO, Optional[int]], Iterator[str]]] = {
+    "pdfplumber": _pdfplumber_pages,
+    "pdfminer": _pdfminer_pages,
+    "pdfium": _pdfium_pages
+}
+DOCX_BACKENDS: Dict[str, Callable[[BinaryIO], Iterator[str]]] = {
+    "ooxml": _ooxml_paragraphs
+}
+
+# Extractors selectable per run: (PDF backend, DOCX backend). "auto" is a
+# policy on top: the fast extractor, falling back to the accurate one for
+# PDFs where it finds suspiciously little text.
+EXTRACTORS: Dict[str, Tuple[str, str]] = {
+    "accurate": ("pdfplumber", "ooxml"),
+    "fast": ("pdfium", "ooxml"),
+    "pdfminer": ("pdfminer", "ooxml")
+}
+DEFAULT_EXTRACTOR = "accurate"
+AUTO_EXTRACTOR = "auto"
+EXTRACTOR_CHOICES = list(EXTRACTORS) + [AUTO_EXTRACTOR]
+
+# Below this many characters per page read, "auto" retries with the accurate
+# extractor; a real resume page has a few thousand
+AUTO_MIN_CHARS_PER_PAGE = 200
+
+
+def _check_extractor(extractor: str):
+    if extractor != AUTO_EXTRACTOR and extractor not in EXTRACTORS:
+        raise ValueError(f"Unknown extractor {extractor!r}: expected one of {', '.join(EXTRACTOR_CHOICES)}")
+
+
+def _auto_pdf_pages(stream: BinaryIO, max_pages: Optional[int]) -> Iterator[str]:
+    """Fast page text, or accurate page text if the fast backend found too little."""
+    fast, accurate = EXTRACTORS["fast"][0], EXTRACTORS[DEFAULT_EXTRACTOR][0]
+    try:
+        pages = list(PDF_BACKENDS[fast](stream, max_pages))
+    except Exception:
+        pages = None
+    if pages is not None and sum(len(text) for text in pages) >= AUTO_MIN_CHARS_PER_PAGE * max(1, len(pages)):
+        return iter(pages)
+    
+    metrics.count("extractor_fallbacks", 1, "pdf")
+    stream.seek(0)
+    return PDF_BACKENDS[accurate](stream, max_pages)
+
+
+def iter_pdf_pages(
+    source: DocumentSource,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Iterator[str]:
+    """
+    Yield the text of each PDF page, stopping early at the given budgets.
+    
+    Pages without text are skipped. With the accurate extractor each page is
+    released after extraction, so memory stays flat on long documents.
+    
+    Args:
+        source: Path, bytes, memoryview or binary file object of the PDF
+        max_pages: Maximum number of pages to read (default: all)
+        max_chars: Maximum total characters to yield (default: unlimited)
+        extractor: Name from EXTRACTOR_CHOICES
+        
+    Yields:
+        Page text strings
+    """
+    _check_extractor(extractor)
+    
+    def read(stream):
+        if extractor == AUTO_EXTRACTOR:
+            page_texts = _auto_pdf_pages(stream, max_pages)
+        else:
+            page_texts = PDF_BACKENDS[EXTRACTORS[extractor][0]](stream, max_pages)
+        for page_text in page_texts:
+            metrics.count("pages", 1, "pdf")
+            if page_text:
+                yield page_text
+    
+    def pages():
+        stream = _open_source(source)
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, 'rb') as f:
+                yield from read(f)
+        else:
+            yield from read(stream)
+    
+    return _apply_char_budget(pages(), max_chars)
+
+
+def iter_docx_paragraphs(
+    source: DocumentSource,
+    max_chars: Optional[int] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Iterator[str]:
+    """
+    Yield the text of each DOCX paragraph, stopping early at max_chars.
+    
+    Args:
+        source: Path, bytes, memoryview or binary file object of the DOCX
+        max_chars: Maximum total characters to yield (default: unlimited)
+        extractor: Name from EXTRACTOR_CHOICES
+        
+    Yields:
+        Paragraph text strings
+    """
+    _check_extractor(extractor)
+    # DOCX text is exact with every backend, so "auto" simply takes the fast one
+    backend = EXTRACTORS["fast" if extractor == AUTO_EXTRACTOR else extractor][1]
+    return _apply_char_budget(DOCX_BACKENDS[backend](_open_source(source)), max_chars)
+
+
+def iter_text_from_file(
+    source: DocumentSource,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Iterator[str]:
+    """
+    Stream text chunks from a document, detecting its format from the content.
+    
+    Joining the chunks with newlines gives the same text as
+    extract_text_from_file under the same budgets.
+    
+    Args:
+        source: Path, bytes, memoryview or binary file object
+        max_pages: Maximum number of PDF pages to read (default: all)
+        max_chars: Maximum total characters to yield (default: unlimited)
+        extractor: Name from EXTRACTOR_CHOICES (default: accurate)
+        
+    Yields:
+        Text chunks (PDF pages or DOCX paragraphs)
+        
+    Raises:
+        ValueError: If the format is not supported or the extractor is unknown
+    """
+    stream = _open_source(source)
+    file_format = sniff_format(stream)
+    
+    if file_format == "pdf":
+        return iter_pdf_pages(stream, max_pages, max_chars, extractor)
+    elif file_format == "docx":
+        return iter_docx_paragraphs(stream, max_chars, extractor)
+    else:
+        raise ValueError("Unsupported file format: expected PDF or DOCX content")
+
+
+def extract_text_from_pdf(
+    source: DocumentSource,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> str:
     """
-    Extract text from a PDF file using pdfplumber.
+    Extract text from a PDF file (with pdfplumber unless another extractor is chosen).
     
     Args:
-        file_path: Path to the PDF file
+        source: Path, bytes, memoryview or binary file object of the PDF
+        max_pages: Maximum number of pages to read (default: all)
+        max_chars: Maximum number of characters to extract (default: unlimited)
+        extractor: Name from EXTRACTOR_CHOICES
         
     Returns:
         Extracted text as a string
     """
-    text = ""
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        text = "\n".join(iter_pdf_pages(source, max_pages, max_chars, extractor))
     except Exception as e:
         print(f"Error extracting PDF text: {e}")
         return ""
     return text.strip()
 
 
-def extract_text_from_docx(file_path: str) -> str:
+def extract_text_from_docx(
+    source: DocumentSource,
+    max_chars: Optional[int] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> str:
     """
-    Extract text from a DOCX file using python-docx.
+    Extract text from a DOCX file, including tables, headers and footers.
     
     Args:
-        file_path: Path to the DOCX file
+        source: Path, bytes, memoryview or binary file object of the DOCX
+        max_chars: Maximum number of characters to extract (default: unlimited)
+        extractor: Name from EXTRACTOR_CHOICES
         
     Returns:
         Extracted text as a string
     """
-    text = ""
     try:
-        doc = Document(file_path)
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        text = "\n".join(iter_docx_paragraphs(source, max_chars, extractor))
     except Exception as e:
         print(f"Error extracting DOCX text: {e}")
         return ""
     return text.strip()
 
 
-def extract_text_from_file(file_path: str, file_extension: str) -> Optional[str]:
+def extract_text_from_file(
+    source: DocumentSource,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Optional[str]:
     """
-    Extract text from a file based on its extension.
+    Extract text from a document, detecting its format from the content.
     
     Args:
-        file_path: Path to the file
-        file_extension: File extension (pdf or docx)
+        source: Path, bytes, memoryview or binary file object
+        max_pages: Maximum number of PDF pages to read (default: all)
+        max_chars: Maximum number of characters to extract (default: unlimited)
+        extractor: Name from EXTRACTOR_CHOICES (default: accurate)
         
     Returns:
         Extracted text as a string or None if unsupported format
     """
-    file_extension = file_extension.lower()
+    stream = _open_source(source)
+    file_format = sniff_format(stream)
     
-    if file_extension == "pdf":
-        return extract_text_from_pdf(file_path)
-    elif file_extension in ["docx", "doc"]:
-        return extract_text_from_docx(file_path)
+    if file_format == "pdf":
+        return extract_text_from_pdf(stream, max_pages, max_chars, extractor)
+    elif file_format == "docx":
+        return extract_text_from_docx(stream, max_chars, extractor)
     else:
-        print(f"Unsupported file format: {file_extension}")
+        print("Unsupported file format: expected PDF or DOCX content")
         return None
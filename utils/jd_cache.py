@@ -0,0 +1,275 @@
+"""
+Process-wide cache of parsed job descriptions.
+
+The same JD templates are pasted again and again, by different recruiters
+and sessions, with nothing but line wrapping, indentation or capitalization
+changed. Parsing is keyed by a hash of the text with whitespace runs
+collapsed and case folded, plus the lexicon fingerprint, so all of those
+share one entry. Skills are matched on the whitespace-collapsed text, which
+keeps the result a function of the key: a multi-word skill broken across a
+line wrap is found the same way whichever copy came first.
+
+Entries live in a thread-safe in-memory LRU bounded by entry count and age.
+With a database path they are also written to SQLite, so a restarted process
+(or another process on the same file) starts warm.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from . import metrics
+from .skill_extractor import CompiledLexicon, compile_lexicon
+
+DEFAULT_MAX_ENTRIES = 512
+# Seconds a parsed JD is reused; None keeps entries until evicted
+DEFAULT_TTL = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed_jds (
+    key TEXT PRIMARY KEY,
+    skills TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parsed_jds_last_access ON parsed_jds (last_access);
+"""
+
+
+def normalize_jd_text(jd_text: str) -> str:
+    """
+    Collapse whitespace runs to single spaces, trim and lowercase.
+    
+    Args:
+        jd_text: Job description text
+        
+    Returns:
+        Normalized text used for the cache key
+    """
+    return " ".join(jd_text.split()).lower()
+
+
+def jd_cache_key(jd_text: str, lexicon: CompiledLexicon) -> str:
+    """
+    Build the cache key of a job description.
+    
+    Args:
+        jd_text: Job description text
+        lexicon: Compiled lexicon the JD is matched against
+        
+    Returns:
+        SHA-256 of the normalized text combined with the lexicon fingerprint
+    """
+    digest = hashlib.sha256(normalize_jd_text(jd_text).encode("utf-8")).hexdigest()
+    return f"{digest}:{lexicon.fingerprint}"
+
+
+class JDCache:
+    """
+    LRU + TTL cache of JD skill lists, optionally persisted to SQLite.
+    
+    Safe to share between threads. Lookups that miss memory fall back to
+    the database before parsing; the database runs in WAL mode with one
+    connection per thread, like the extraction cache, and is bounded by the
+    same entry count and age.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        db_path: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: Parsed JDs kept in memory (and in the database)
+            ttl: Seconds an entry is reused, or None for no age limit
+            db_path: Optional SQLite file to persist entries to
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.db_path = str(db_path) if db_path else None
+        self._entries: "OrderedDict[str, Tuple[Tuple[str, ...], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        
+        if self.db_path:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            with conn:
+                conn.executescript(_SCHEMA)
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created >= self.ttl
+    
+    def parse(self, jd_text: str, skills_lexicon: Union[List[str], CompiledLexicon]) -> dict:
+        """
+        Parse a job description, reusing the parse of an equivalent text.
+        
+        Args:
+            jd_text: Job description text
+            skills_lexicon: List of skills or a CompiledLexicon to match against
+            
+        Returns:
+            Dictionary shaped like parse_job_description's, with this call's jd_text
+        """
+        lexicon = compile_lexicon(skills_lexicon)
+        key = jd_cache_key(jd_text, lexicon)
+        skills = self._get(key)
+        if skills is None:
+            skills = tuple(lexicon.find(" ".join(jd_text.split())))
+            self._put(key, skills)
+        
+        return {
+            "jd_text": jd_text,
+            "jd_required_skills": list(skills),
+            "total_jd_skills": len(skills)
+        }
+    
+    def _get(self, key: str) -> Optional[Tuple[str, ...]]:
+        """Cached skills of a key, from memory or the database, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    metrics.count("jd_cache_hits")
+                    return entry[0]
+                del self._entries[key]
+                self._stats["expired"] += 1
+        
+        if self.db_path:
+            conn = self._connect()
+            with conn:
+                row = conn.execute("SELECT skills, created FROM parsed_jds WHERE key = ?", (key,)).fetchone()
+                if row is not None and not self._expired(row[1], now):
+                    conn.execute("UPDATE parsed_jds SET last_access = ? WHERE key = ?", (now, key))
+                    skills = tuple(json.loads(row[0]))
+                    with self._lock:
+                        self._remember(key, skills, row[1])
+                        self._stats["hits"] += 1
+                        self._stats["disk_hits"] += 1
+                    metrics.count("jd_cache_hits")
+                    return skills
+        
+        with self._lock:
+            self._stats["misses"] += 1
+        metrics.count("jd_cache_misses")
+        return None
+    
+    def _put(self, key: str, skills: Tuple[str, ...]):
+        """Store freshly parsed skills in memory and the database."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, skills, now)
+        
+        if self.db_path:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO parsed_jds (key, skills, created, last_access) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(list(skills)), now, now)
+                )
+                if self.ttl is not None:
+                    conn.execute("DELETE FROM parsed_jds WHERE created < ?", (now - self.ttl,))
+                conn.execute(
+                    """
+                    DELETE FROM parsed_jds WHERE key NOT IN (
+                        SELECT key FROM parsed_jds ORDER BY last_access DESC, key LIMIT ?
+                    )
+                    """,
+                    (self.max_entries,)
+                )
+    
+    def _remember(self, key: str, skills: Tuple[str, ...], created: float):
+        """Insert into the in-memory LRU; the caller holds the lock."""
+        self._entries[key] = (skills, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+    
+    def stats(self) -> dict:
+        """
+        Get cache counters and size.
+        
+        Returns:
+            Dictionary with hits (disk_hits of them from the database),
+            misses, hit_rate, entries (in memory), evictions and expired
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 2) if lookups else 0.0
+        return stats
+    
+    def clear(self):
+        """Drop every entry, in memory and in the database."""
+        with self._lock:
+            self._entries.clear()
+        if self.db_path:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM parsed_jds")
+
+
+_cache = JDCache()
+_cache_lock = threading.Lock()
+
+
+def configure(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    ttl: Optional[float] = DEFAULT_TTL,
+    db_path: Optional[str] = None
+) -> JDCache:
+    """
+    Replace the process-wide cache, e.g. to persist it.
+    
+    Args:
+        max_entries: Parsed JDs kept
+        ttl: Seconds an entry is reused, or None for no age limit
+        db_path: Optional SQLite file to persist entries to
+        
+    Returns:
+        The new process-wide JDCache
+    """
+    global _cache
+    with _cache_lock:
+        _cache = JDCache(max_entries, ttl, db_path)
+        return _cache
+
+
+def get_jd_cache() -> JDCache:
+    """The process-wide JDCache."""
+    return _cache
+
+
+def parse_job_description_cached(jd_text: str, skills_lexicon: Union[List[str], CompiledLexicon]) -> dict:
+    """
+    Parse a job description through the process-wide cache.
+    
+    Args:
+        jd_text: Job description text
+        skills_lexicon: List of skills or a CompiledLexicon to match against
+        
+    Returns:
+        Dictionary with jd_text, jd_required_skills and total_jd_skills
+    """
+    return _cache.parse(jd_text, skills_lexicon)
@@ -1,17 +1,17 @@
 """
 Job Description parser utility.
 """
-from typing import List
-from .skill_extractor import extract_skills
+from typing import List, Union
+from .skill_extractor import extract_skills, CompiledLexicon
 
 
-def parse_job_description(jd_text: str, skills_lexicon: List[str]) -> dict:
+def parse_job_description(jd_text: str, skills_lexicon: Union[List[str], CompiledLexicon]) -> dict:
     """
     Parse job description and extract required skills.
     
     Args:
         jd_text: Job description text
-        skills_lexicon: List of skills to match against
+        skills_lexicon: List of skills or a CompiledLexicon to match against
         
     Returns:
         Dictionary with extracted JD information
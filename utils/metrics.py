@@ -0,0 +1,323 @@
+"""
+Lightweight per-stage timing and counters for the screening pipeline.
+
+Collection is off by default. While disabled, span() returns a shared no-op
+context manager and count() returns immediately, so instrumented code pays
+only a function call and a flag check.
+"""
+import bisect
+import heapq
+import json
+import threading
+import time
+from typing import Dict, List, Tuple
+
+# Latency histogram bucket upper bounds in seconds (Prometheus "le")
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SLOW_FILES_KEPT = 10
+
+_enabled = False
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with count, sum and max."""
+    
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float):
+        self.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def quantile(self, q: float) -> float:
+        """
+        Approximate a quantile as the upper bound of the bucket holding it.
+        
+        Args:
+            q: Quantile between 0 and 1
+            
+        Returns:
+            Bucket upper bound in seconds (the observed max for the +Inf bucket)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKETS, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+    
+    def to_dict(self) -> dict:
+        return {
+            "buckets": list(self.bucket_counts),
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max
+        }
+    
+    def merge(self, data: dict):
+        for i, bucket_count in enumerate(data["buckets"]):
+            self.bucket_counts[i] += bucket_count
+        self.count += data["count"]
+        self.total += data["sum"]
+        self.max = max(self.max, data["max"])
+
+
+class _Span:
+    """Times a block and records it in a registry on exit."""
+    
+    __slots__ = ("_registry", "_stage", "_file_type", "_start")
+    
+    def __init__(self, registry: "MetricsRegistry", stage: str, file_type: str):
+        self._registry = registry
+        self._stage = stage
+        self._file_type = file_type
+    
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._registry.observe(self._stage, time.perf_counter() - self._start, self._file_type)
+        if exc_type is not None:
+            self._registry.count("errors", 1, self._file_type)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while collection is disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of stage latency histograms and counters.
+    
+    Histograms are keyed by (stage, file_type) and counters by
+    (name, file_type); file_type is "" where it does not apply. The
+    slowest files seen are kept to help find pathological documents.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[Tuple[str, str], float] = {}
+        self._slow_files: List[Tuple[float, str, str]] = []
+    
+    def span(self, stage: str, file_type: str = "") -> _Span:
+        """Context manager timing a block as one observation of a stage."""
+        return _Span(self, stage, file_type)
+    
+    def observe(self, stage: str, seconds: float, file_type: str = ""):
+        """Record one stage latency in seconds."""
+        with self._lock:
+            histogram = self._histograms.get((stage, file_type))
+            if histogram is None:
+                histogram = self._histograms[(stage, file_type)] = Histogram()
+            histogram.observe(seconds)
+    
+    def count(self, name: str, amount: float = 1, file_type: str = ""):
+        """Add to a counter such as files, bytes, pages or errors."""
+        with self._lock:
+            key = (name, file_type)
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def record_file(self, filename: str, file_type: str, seconds: float):
+        """Remember a file's processing time if it is among the slowest."""
+        with self._lock:
+            entry = (seconds, filename, file_type)
+            if len(self._slow_files) < SLOW_FILES_KEPT:
+                heapq.heappush(self._slow_files, entry)
+            elif entry > self._slow_files[0]:
+                heapq.heapreplace(self._slow_files, entry)
+    
+    def reset(self):
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._slow_files.clear()
+    
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        Copy the recorded metrics as plain data.
+        
+        Args:
+            reset: Also clear the registry (used to ship deltas from workers)
+            
+        Returns:
+            JSON-serializable dictionary accepted by merge()
+        """
+        with self._lock:
+            data = {
+                "stages": [
+                    {"stage": stage, "file_type": file_type, **histogram.to_dict()}
+                    for (stage, file_type), histogram in sorted(self._histograms.items())
+                ],
+                "counters": [
+                    {"name": name, "file_type": file_type, "value": value}
+                    for (name, file_type), value in sorted(self._counters.items())
+                ],
+                "slow_files": [
+                    {"filename": filename, "file_type": file_type, "seconds": seconds}
+                    for seconds, filename, file_type in sorted(self._slow_files, reverse=True)
+                ]
+            }
+            if reset:
+                self._histograms.clear()
+                self._counters.clear()
+                self._slow_files.clear()
+        return data
+    
+    def merge(self, data: dict):
+        """Add a snapshot taken elsewhere, e.g. in a worker process."""
+        with self._lock:
+            for stage in data["stages"]:
+                key = (stage["stage"], stage["file_type"])
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.merge(stage)
+            for counter in data["counters"]:
+                key = (counter["name"], counter["file_type"])
+                self._counters[key] = self._counters.get(key, 0) + counter["value"]
+        for slow in data["slow_files"]:
+            self.record_file(slow["filename"], slow["file_type"], slow["seconds"])
+    
+    def summary(self) -> List[dict]:
+        """
+        Per-stage latency summary for display.
+        
+        Returns:
+            List of dicts with stage, file_type, count, mean_ms, p50_ms, p95_ms and max_ms
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+            return [
+                {
+                    "stage": stage,
+                    "file_type": file_type,
+                    "count": histogram.count,
+                    "mean_ms": round(histogram.total / histogram.count * 1000, 2) if histogram.count else 0.0,
+                    "p50_ms": round(histogram.quantile(0.5) * 1000, 2),
+                    "p95_ms": round(histogram.quantile(0.95) * 1000, 2),
+                    "max_ms": round(histogram.max * 1000, 2)
+                }
+                for (stage, file_type), histogram in items
+            ]
+    
+    def to_json(self) -> str:
+        """Metrics snapshot as a JSON document."""
+        data = self.snapshot()
+        data["bucket_bounds"] = list(BUCKETS)
+        return json.dumps(data, indent=2)
+    
+    def to_prometheus(self, prefix: str = "rolematrix") -> str:
+        """
+        Metrics in the Prometheus text exposition format.
+        
+        Args:
+            prefix: Metric name prefix
+            
+        Returns:
+            Exposition text ending with a newline
+        """
+        data = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds Pipeline stage latency",
+            f"# TYPE {prefix}_stage_seconds histogram"
+        ]
+        for stage in data["stages"]:
+            labels = _labels(stage=stage["stage"], file_type=stage["file_type"])
+            cumulative = 0
+            for bound, bucket_count in zip(list(BUCKETS) + ["+Inf"], stage["buckets"]):
+                cumulative += bucket_count
+                lines.append(f'{prefix}_stage_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_stage_seconds_sum{{{labels}}} {stage['sum']}")
+            lines.append(f"{prefix}_stage_seconds_count{{{labels}}} {stage['count']}")
+        
+        names = sorted({counter["name"] for counter in data["counters"]})
+        for name in names:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for counter in data["counters"]:
+                if counter["name"] == name:
+                    labels = _labels(file_type=counter["file_type"])
+                    value = counter["value"]
+                    lines.append(f"{prefix}_{name}_total{{{labels}}} {int(value) if value == int(value) else value}")
+        
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    """Format non-empty label values as a Prometheus label list."""
+    return ",".join(
+        f'{key}="{value}"'
+        for key, value in labels.items() if value
+    )
+
+
+# Process-wide registry used by the pipeline
+REGISTRY = MetricsRegistry()
+
+
+def enable(enabled: bool = True):
+    """Turn metrics collection on or off for this process."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Whether metrics are being collected."""
+    return _enabled
+
+
+def span(stage: str, file_type: str = ""):
+    """
+    Time a block as one observation of a pipeline stage.
+    
+    Args:
+        stage: Stage name, e.g. "parse" or "scoring"
+        file_type: "pdf", "docx" or "" if not file-specific
+        
+    Returns:
+        Context manager; a shared no-op while collection is disabled
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return REGISTRY.span(stage, file_type)
+
+
+def count(name: str, amount: float = 1, file_type: str = ""):
+    """Add to a counter in the process-wide registry when enabled."""
+    if _enabled:
+        REGISTRY.count(name, amount, file_type)
+
+
+def observe(stage: str, seconds: float, file_type: str = ""):
+    """Record a stage latency in the process-wide registry when enabled."""
+    if _enabled:
+        REGISTRY.observe(stage, seconds, file_type)
+
+
+def record_file(filename: str, file_type: str, seconds: float):
+    """Track a file's processing time among the slowest when enabled."""
+    if _enabled:
+        REGISTRY.record_file(filename, file_type, seconds)
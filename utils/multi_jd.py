@@ -0,0 +1,195 @@
+"""
+Screening one batch of resumes against many job descriptions at once.
+"""
+import re
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .batch_scoring import SkillMatrix, RECOMMENDATIONS
+from .extraction_cache import ExtractionCache
+from .file_loader import DEFAULT_EXTRACTOR
+from .jd_cache import parse_job_description_cached
+from .pipeline import extract_resume, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+from .scoring import calculate_confidence_score, INTERVIEW_THRESHOLD, MAYBE_THRESHOLD
+from .skill_extractor import compile_lexicon, CompiledLexicon
+
+# A line holding only "---" separates pasted job descriptions
+_JD_SEPARATOR = re.compile(r"^\s*-{3,}\s*$", re.MULTILINE)
+MAX_TITLE_LENGTH = 60
+
+
+def split_job_descriptions(text: str) -> List[str]:
+    """
+    Split pasted text into job descriptions.
+    
+    Args:
+        text: Job descriptions separated by lines containing only "---"
+        
+    Returns:
+        List of non-empty job description texts
+    """
+    return [part.strip() for part in _JD_SEPARATOR.split(text) if part.strip()]
+
+
+def jd_titles(jd_texts: List[str]) -> List[str]:
+    """
+    Name job descriptions by their first non-empty line.
+    
+    Args:
+        jd_texts: Job description texts
+        
+    Returns:
+        Unique titles, one per job description
+    """
+    titles = []
+    seen = {}
+    for position, jd_text in enumerate(jd_texts, start=1):
+        first_line = next((line.strip() for line in jd_text.splitlines() if line.strip()), "")
+        title = first_line[:MAX_TITLE_LENGTH] or f"JD {position}"
+        
+        seen[title] = seen.get(title, 0) + 1
+        if seen[title] > 1:
+            title = f"{title} ({seen[title]})"
+        titles.append(title)
+    return titles
+
+
+class MultiJDResult:
+    """
+    Candidate x JD confidence matrix with the best requisition per candidate.
+    
+    Rows follow the candidate order, columns the JD order. Full scoring
+    results for a single candidate/JD pair are computed on demand.
+    """
+    
+    def __init__(
+        self,
+        filenames: List[str],
+        candidate_skills: List[List[str]],
+        titles: List[str],
+        jds: List[dict]
+    ):
+        self.filenames = list(filenames)
+        self.candidate_skills = list(candidate_skills)
+        self.titles = list(titles)
+        self.jds = list(jds)
+        
+        matrix = SkillMatrix()
+        matrix.extend(self.candidate_skills)
+        self.confidence = matrix.confidence_matrix([jd["jd_required_skills"] for jd in self.jds])
+        
+        # Ties go to the JD listed first
+        if self.jds:
+            self.best_jd = self.confidence.argmax(axis=1)
+            self.best_confidence = self.confidence[np.arange(len(self.filenames)), self.best_jd]
+        else:
+            self.best_jd = np.zeros(len(self.filenames), dtype=np.int64)
+            self.best_confidence = np.zeros(len(self.filenames), dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return len(self.filenames)
+    
+    def match(self, row: int, jd: int) -> dict:
+        """
+        Full scoring result for one candidate against one JD.
+        
+        Args:
+            row: Candidate row index
+            jd: JD column index
+            
+        Returns:
+            Dictionary from calculate_confidence_score
+        """
+        return calculate_confidence_score(self.candidate_skills[row], self.jds[jd]["jd_required_skills"])
+    
+    def assignments(self) -> List[dict]:
+        """
+        Best requisition for every candidate.
+        
+        Returns:
+            List of dicts with filename, best_jd, confidence and recommendation
+        """
+        assignments = []
+        for row, (jd, confidence) in enumerate(zip(self.best_jd.tolist(), self.best_confidence.tolist())):
+            if confidence >= INTERVIEW_THRESHOLD:
+                recommendation = RECOMMENDATIONS[0]
+            elif confidence >= MAYBE_THRESHOLD:
+                recommendation = RECOMMENDATIONS[1]
+            else:
+                recommendation = RECOMMENDATIONS[2]
+            
+            assignments.append({
+                "filename": self.filenames[row],
+                "best_jd": self.titles[jd] if self.jds else None,
+                "confidence": confidence,
+                "recommendation": recommendation
+            })
+        return assignments
+
+
+def score_multi_jd(
+    candidates: List[Tuple[str, List[str]]],
+    jd_texts: List[str],
+    skills_lexicon: Union[List[str], CompiledLexicon],
+    titles: Optional[List[str]] = None
+) -> MultiJDResult:
+    """
+    Score already-extracted candidates against several job descriptions.
+    
+    Args:
+        candidates: List of (filename, extracted skills) pairs
+        jd_texts: Job description texts
+        skills_lexicon: List of skills or a CompiledLexicon to match against
+        titles: JD names (default: first line of each JD)
+        
+    Returns:
+        MultiJDResult with the full confidence matrix
+    """
+    skills_lexicon = compile_lexicon(skills_lexicon)
+    jds = [parse_job_description_cached(jd_text, skills_lexicon) for jd_text in jd_texts]
+    
+    return MultiJDResult(
+        [filename for filename, _ in candidates],
+        [skills for _, skills in candidates],
+        titles if titles is not None else jd_titles(jd_texts),
+        jds
+    )
+
+
+def screen_multi_jd(
+    files: Iterable[Tuple[str, bytes]],
+    jd_texts: List[str],
+    skills_lexicon: Union[List[str], CompiledLexicon],
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> MultiJDResult:
+    """
+    Extract each resume once and score it against every job description.
+    
+    Files with no extractable text are left out of the result.
+    
+    Args:
+        files: Iterable of (filename, file bytes) pairs
+        jd_texts: Job description texts
+        skills_lexicon: List of skills or a CompiledLexicon to match against
+        cache: Optional extraction cache; on a hit parsing is skipped
+        max_pages: Maximum number of PDF pages to read (None for all)
+        max_chars: Maximum number of characters to extract (None for all)
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Returns:
+        MultiJDResult with the full confidence matrix
+    """
+    skills_lexicon = compile_lexicon(skills_lexicon)
+    candidates = []
+    for filename, file_bytes in files:
+        raw_text, resume_skills = extract_resume(
+            file_bytes, skills_lexicon, cache, max_pages, max_chars, extractor=extractor
+        )
+        if raw_text:
+            candidates.append((filename, resume_skills))
+    
+    return score_multi_jd(candidates, jd_texts, skills_lexicon)
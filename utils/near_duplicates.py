@@ -0,0 +1,359 @@
+"""
+Near-duplicate resume detection with MinHash signatures and LSH buckets.
+
+Resubmitted or lightly edited resumes are recognised from their extracted
+text, so they can link to the profile already stored instead of being
+screened again. Byte-identical files are caught earlier, from a content
+hash, before any parsing.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+SHINGLE_WORDS = 3
+SEED = 1
+
+_WORD_PATTERN = re.compile(r"\w+")
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    doc_id TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, doc_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS contents (
+    content_key TEXT PRIMARY KEY,
+    doc_id TEXT NOT NULL
+);
+"""
+
+
+def content_key(file_bytes: bytes) -> str:
+    """SHA-256 of a file's bytes, used to recognise identical resubmissions."""
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose LSH bands and rows per band for a similarity threshold.
+    
+    Minimises the sum of the false positive and false negative areas under
+    the banding S-curve, so pairs near the threshold are the ones left for
+    the exact signature comparison.
+    
+    Args:
+        threshold: Jaccard similarity treated as a duplicate
+        num_perm: Signature length
+        
+    Returns:
+        (bands, rows) with bands * rows <= num_perm
+    """
+    steps = 100
+    
+    def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+        return 1 - (1 - similarity ** rows) ** bands
+    
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        below = [threshold * (i + 0.5) / steps for i in range(steps)]
+        above = [threshold + (1 - threshold) * (i + 0.5) / steps for i in range(steps)]
+        false_positive = sum(candidate_probability(s, bands, rows) for s in below) * threshold / steps
+        false_negative = sum(1 - candidate_probability(s, bands, rows) for s in above) * (1 - threshold) / steps
+        error = false_positive + false_negative
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """
+    MinHash signatures of word shingles.
+    
+    Text is lowercased and split into words; every run of SHINGLE_WORDS
+    consecutive words is one shingle. The fraction of equal signature
+    positions estimates the Jaccard similarity of two texts' shingle sets.
+    Signatures only depend on num_perm and seed, so they can be stored.
+    """
+    
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = SEED):
+        self.num_perm = num_perm
+        # RandomState's stream is fixed across NumPy versions
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        MinHash signature of a text.
+        
+        Args:
+            text: Extracted resume text
+            
+        Returns:
+            uint32 array of num_perm values, or None if the text has no words
+        """
+        words = _WORD_PATTERN.findall(text.lower())
+        if not words:
+            return None
+        size = min(SHINGLE_WORDS, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # Universal hashing; uint64 products wrap, as in the usual MinHash construction
+        permuted = (hashes[:, None] * self._a + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+@lru_cache(maxsize=None)
+def _default_hasher() -> MinHasher:
+    return MinHasher()
+
+
+def text_signature(text: str) -> Optional[np.ndarray]:
+    """MinHash signature with the default parameters used by NearDuplicateIndex."""
+    return _default_hasher().signature(text)
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class NearDuplicateIndex:
+    """
+    SQLite-backed MinHash LSH index of screened resumes.
+    
+    Each signature is cut into bands; documents sharing any band bucket with
+    a query are candidates, and only those are compared in full. Buckets
+    live in an indexed table, so a lookup costs one index probe per band
+    plus the candidates, however many documents are stored. Like the
+    extraction cache, the database runs in WAL mode with one connection per
+    thread and can be shared between processes; ":memory:" gives a private
+    index for a single run.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.db_path = str(db_path)
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self._local = threading.local()
+        self._shared = None
+        if self.db_path == ":memory:":
+            self._shared = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        with conn:
+            conn.executescript(_SCHEMA)
+            meta = dict(conn.execute("SELECT name, value FROM meta").fetchall())
+            if meta.get("num_perm", num_perm) != num_perm or meta.get("seed", SEED) != SEED:
+                raise ValueError(f"{self.db_path} holds signatures of a different length or seed")
+            conn.executemany(
+                "INSERT OR IGNORE INTO meta (name, value) VALUES (?, ?)",
+                [("num_perm", num_perm), ("seed", SEED), ("bands", self.bands), ("rows", self.rows)]
+            )
+        
+        if (meta.get("bands"), meta.get("rows")) not in ((None, None), (self.bands, self.rows)):
+            self._rebuild_buckets()
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._shared is not None:
+            return self._shared
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _bucket_rows(self, doc_id: str, signature: np.ndarray) -> Iterable[Tuple[int, int, str]]:
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), "little", signed=True)
+            yield band, bucket, doc_id
+    
+    def _rebuild_buckets(self):
+        """Re-band every stored signature after the threshold changed."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM buckets")
+            for doc_id, blob in conn.execute("SELECT doc_id, signature FROM documents").fetchall():
+                conn.executemany(
+                    "INSERT OR IGNORE INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                    self._bucket_rows(doc_id, np.frombuffer(blob, dtype=np.uint32))
+                )
+            conn.executemany(
+                "UPDATE meta SET value = ? WHERE name = ?",
+                [(self.bands, "bands"), (self.rows, "rows")]
+            )
+    
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of extracted text (None if it has no words)."""
+        return self.hasher.signature(text)
+    
+    def find_exact(self, key: str) -> Optional[str]:
+        """
+        Look up a byte-identical file.
+        
+        Args:
+            key: content_key of the file
+            
+        Returns:
+            doc_id the content was indexed under, or None
+        """
+        row = self._connect().execute("SELECT doc_id FROM contents WHERE content_key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def find(self, signature: Optional[np.ndarray]) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed document at or above the threshold.
+        
+        Args:
+            signature: MinHash signature of the query text
+            
+        Returns:
+            (doc_id, similarity) of the best match, or None
+        """
+        matches = self.query(signature, limit=1)
+        return matches[0] if matches else None
+    
+    def query(self, signature: Optional[np.ndarray], limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Find indexed documents at or above the similarity threshold.
+        
+        Args:
+            signature: MinHash signature of the query text
+            limit: Maximum number of matches (default: all)
+            
+        Returns:
+            List of (doc_id, similarity), most similar first
+        """
+        if signature is None:
+            return []
+        conn = self._connect()
+        candidates = set()
+        for band, bucket, _ in self._bucket_rows("", signature):
+            candidates.update(
+                row[0] for row in conn.execute(
+                    "SELECT doc_id FROM buckets WHERE band = ? AND bucket = ?", (band, bucket)
+                )
+            )
+        
+        matches = []
+        candidates = sorted(candidates)
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(candidates), 500):
+            batch = candidates[start:start + 500]
+            rows = conn.execute(
+                f"SELECT doc_id, signature FROM documents WHERE doc_id IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            for doc_id, blob in rows:
+                score = similarity(signature, np.frombuffer(blob, dtype=np.uint32))
+                if score >= self.threshold:
+                    matches.append((doc_id, score))
+        
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit] if limit is not None else matches
+    
+    def add(self, doc_id: str, signature: Optional[np.ndarray], key: Optional[str] = None):
+        """
+        Index a screened document.
+        
+        Args:
+            doc_id: Identifier matches link to, e.g. the profile's candidate_id
+            signature: MinHash signature of its text (None to index the content key only)
+            key: Optional content_key of the file, for exact lookups
+        """
+        conn = self._connect()
+        with conn:
+            if signature is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (doc_id, signature) VALUES (?, ?)",
+                    (doc_id, signature.astype(np.uint32).tobytes())
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                    self._bucket_rows(doc_id, signature)
+                )
+            if key is not None:
+                conn.execute(
+                    "INSERT OR IGNORE INTO contents (content_key, doc_id) VALUES (?, ?)",
+                    (key, doc_id)
+                )
+    
+    def close(self):
+        """Close this thread's connection (or the shared in-memory one)."""
+        conn = self._shared or getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._shared = None
+        self._local.conn = None
+
+
+def duplicate_link(
+    filename: str,
+    doc_id: str,
+    score: float,
+    exact: bool = False,
+    timestamp: Optional[str] = None
+) -> dict:
+    """
+    Record returned in place of a profile for a duplicate resume.
+    
+    Args:
+        filename: Original filename of the duplicate
+        doc_id: candidate_id of the profile it duplicates
+        score: Estimated text similarity
+        exact: Whether the files are byte-identical
+        timestamp: ISO time the duplicate was found (default: now)
+        
+    Returns:
+        Dictionary with filename, timestamp, duplicate_of, similarity and exact
+    """
+    return {
+        "filename": filename,
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "duplicate_of": doc_id,
+        "similarity": round(score, 3),
+        "exact": exact
+    }
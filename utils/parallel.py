@@ -0,0 +1,218 @@
+"""
+Process-pool execution of the screening pipeline.
+"""
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from . import metrics
+from .data_artifact import load_screening_data
+from .extraction_cache import ExtractionCache
+from .extraction_sandbox import ExtractionSandbox
+from .file_loader import DEFAULT_EXTRACTOR
+from .pipeline import screen_resume, metrics_file_type, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+
+# Per-worker state, populated once by the pool initializer so the lexicon
+# and role library are never pickled along with individual tasks.
+_worker_state = {}
+
+
+def init_worker(
+    lexicon_path: str,
+    roles_path: str,
+    cache_path: Optional[str],
+    collect_metrics: bool = False,
+    artifact_path: Optional[str] = None,
+    duplicates_path: Optional[str] = None,
+    dedup_threshold: Optional[float] = None,
+    sandbox_limits: Optional[Tuple[Optional[float], Optional[int]]] = None
+):
+    """
+    Pool initializer: load the compiled lexicon and role index in a worker process.
+    
+    Used by screen_resumes_parallel and the screening service, whose pools
+    then run screen_chunk.
+    
+    Args:
+        lexicon_path: Path to skills_lexicon.json
+        roles_path: Path to role_library.json
+        cache_path: Optional ExtractionCache database
+        collect_metrics: Collect metrics in the worker to ship back with results
+        artifact_path: Optional precompiled data artifact
+        duplicates_path: Optional NearDuplicateIndex database
+        dedup_threshold: Jaccard similarity treated as a near duplicate (default: the index's)
+        sandbox_limits: Optional (timeout seconds, memory MB) to parse files
+            in a sandboxed child
+    """
+    metrics.enable(collect_metrics)
+    data = load_screening_data(lexicon_path, roles_path, artifact_path)
+    _worker_state["lexicon"] = data.lexicon
+    _worker_state["roles"] = data.role_index
+    _worker_state["cache"] = ExtractionCache(cache_path) if cache_path else None
+    _worker_state["duplicates"] = None
+    if duplicates_path:
+        from .near_duplicates import NearDuplicateIndex, DEFAULT_THRESHOLD
+        threshold = dedup_threshold if dedup_threshold is not None else DEFAULT_THRESHOLD
+        _worker_state["duplicates"] = NearDuplicateIndex(duplicates_path, threshold)
+    # Each worker parses through its own sandboxed child, so a file that hangs
+    # or balloons is killed without taking the worker and its chunk with it
+    _worker_state["sandbox"] = None
+    if sandbox_limits:
+        _worker_state["sandbox"] = ExtractionSandbox(1, *sandbox_limits)
+
+
+def screen_chunk(
+    chunk: List[Tuple[int, str, bytes]],
+    jd_skills: List[str],
+    max_pages: Optional[int],
+    max_chars: Optional[int],
+    text_signature: bool = False,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Tuple[List[Tuple[int, Optional[dict], Optional[str]]], Optional[dict]]:
+    """
+    Screen a chunk of files inside a worker process set up by init_worker.
+    
+    Args:
+        chunk: (index, filename, file bytes) triples
+        jd_skills: Skills required by the job description
+        max_pages: Maximum number of PDF pages to read per file
+        max_chars: Maximum number of characters to extract per file
+        text_signature: Also return each text's MinHash signature in its profile
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Returns:
+        (index, profile or None, error or None) for each file, and this
+        chunk's metrics delta (None when metrics are disabled)
+    """
+    results = []
+    for index, filename, file_bytes in chunk:
+        try:
+            profile = screen_resume(
+                file_bytes,
+                filename,
+                _worker_state["lexicon"],
+                jd_skills,
+                _worker_state["roles"],
+                _worker_state["cache"],
+                max_pages,
+                max_chars,
+                _worker_state["duplicates"],
+                text_signature,
+                _worker_state["sandbox"],
+                extractor
+            )
+            results.append((index, profile, None))
+        except Exception as e:
+            if metrics.is_enabled():
+                metrics.count("errors", 1, metrics_file_type(file_bytes))
+            results.append((index, None, str(e)))
+    
+    # Ship this chunk's metrics to the parent, which merges them
+    return results, metrics.REGISTRY.snapshot(reset=True) if metrics.is_enabled() else None
+
+
+def default_worker_count() -> int:
+    """Number of workers used when none is configured."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _iter_chunks(files: Iterable[Tuple[str, bytes]], chunk_size: int) -> Iterator[List[Tuple[int, str, bytes]]]:
+    """Group (filename, bytes) pairs into indexed chunks without materializing them all."""
+    chunk = []
+    for index, (filename, file_bytes) in enumerate(files):
+        chunk.append((index, filename, file_bytes))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def screen_resumes_parallel(
+    files: Iterable[Tuple[str, bytes]],
+    jd_skills: List[str],
+    lexicon_path: str,
+    roles_path: str,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 1,
+    cache_path: Optional[str] = None,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    artifact_path: Optional[str] = None,
+    duplicates_path: Optional[str] = None,
+    dedup_threshold: Optional[float] = None,
+    text_signature: bool = False,
+    sandbox_limits: Optional[Tuple[Optional[float], Optional[int]]] = None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Screen resumes on a process pool, yielding results as they complete.
+    
+    Files are consumed lazily and only a bounded number of chunks is in
+    flight at once, so memory stays flat however many files are passed.
+    
+    Args:
+        files: Iterable of (filename, file_bytes) pairs
+        jd_skills: List of required skills from job description
+        lexicon_path: Path to skills_lexicon.json, loaded once per worker
+        roles_path: Path to role_library.json, loaded once per worker
+        max_workers: Number of worker processes (default: CPU count - 1)
+        chunk_size: Number of files sent to a worker per task (default: 1)
+        cache_path: Optional ExtractionCache database shared by the workers
+        max_pages: Maximum number of PDF pages to read per file
+        max_chars: Maximum number of characters to extract per file
+        artifact_path: Optional precompiled data artifact (see data_artifact)
+            loaded by the workers instead of compiling from JSON
+        duplicates_path: Optional NearDuplicateIndex database shared by the
+            workers; duplicates yield link records instead of profiles
+        dedup_threshold: Similarity threshold for duplicates_path
+        text_signature: Include each profile's MinHash signature
+        sandbox_limits: Optional (timeout seconds, memory MB) per file; each
+            worker then parses in an ExtractionSandbox with these budgets
+            and files breaching them are yielded with an error
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Yields:
+        (index, profile, error) tuples in completion order, where index is
+        the position in files, profile is None if nothing was extracted and
+        error is set if processing raised. When metrics are enabled, worker
+        metrics are merged into this process's registry.
+    """
+    max_workers = max_workers or default_worker_count()
+    chunks = _iter_chunks(files, max(1, chunk_size))
+    max_in_flight = max_workers * 2
+    
+    # Spawn rather than fork: the Streamlit server is multi-threaded
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=init_worker,
+        initargs=(
+            str(lexicon_path),
+            str(roles_path),
+            str(cache_path) if cache_path else None,
+            metrics.is_enabled(),
+            str(artifact_path) if artifact_path else None,
+            str(duplicates_path) if duplicates_path else None,
+            dedup_threshold,
+            sandbox_limits
+        )
+    ) as executor:
+        task_args = (jd_skills, max_pages, max_chars, text_signature, extractor)
+        pending = set()
+        for chunk in itertools.islice(chunks, max_in_flight):
+            pending.add(executor.submit(screen_chunk, chunk, *task_args))
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for chunk in itertools.islice(chunks, len(done)):
+                pending.add(executor.submit(screen_chunk, chunk, *task_args))
+            for future in done:
+                results, worker_metrics = future.result()
+                if worker_metrics:
+                    metrics.REGISTRY.merge(worker_metrics)
+                for result in results:
+                    yield result
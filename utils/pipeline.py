@@ -0,0 +1,353 @@
+"""
+Resume screening pipeline shared by the Streamlit app and batch workers.
+"""
+import hashlib
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+
+from . import metrics
+from .file_loader import iter_text_from_file, DEFAULT_EXTRACTOR
+from .skill_extractor import extract_skills, compile_lexicon, CompiledLexicon
+from .extraction_cache import ExtractionCache, file_cache_key
+from .scoring import calculate_confidence_score
+from .role_matcher import get_role_suggestions_for_candidate, RoleIndex
+
+# Extraction budgets: enough for any real resume, but a 200-page portfolio
+# uploaded by mistake cannot stall a batch
+DEFAULT_MAX_PAGES = 20
+DEFAULT_MAX_CHARS = 100_000
+
+
+def screen_resume(
+    file_bytes: bytes,
+    filename: str,
+    skills_lexicon: Union[List[str], CompiledLexicon],
+    jd_skills: List[str],
+    roles_library: Union[List[dict], RoleIndex],
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    duplicates=None,
+    text_signature: bool = False,
+    sandbox=None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Optional[dict]:
+    """
+    Extract, score and suggest roles for a single resume.
+    
+    With a near-duplicate index, a resume matching one already indexed is
+    not scored: a link record from near_duplicates.duplicate_link is
+    returned instead. Byte-identical files are recognised before parsing,
+    edited copies from their extracted text.
+    
+    Args:
+        file_bytes: Raw content of the uploaded file (bytes or memoryview)
+        filename: Original filename, recorded in the profile
+        skills_lexicon: List of skills or a CompiledLexicon to match against
+        jd_skills: List of required skills from job description
+        roles_library: List of role definitions or a prebuilt RoleIndex
+        cache: Optional extraction cache; on a hit parsing is skipped
+        max_pages: Maximum number of PDF pages to read (None for all)
+        max_chars: Maximum number of characters to extract (None for all)
+        duplicates: Optional NearDuplicateIndex; new profiles are added to it
+        text_signature: Also return the text's MinHash signature as a list
+            under profile["text_signature"] (for callers deduplicating later)
+        sandbox: Optional ExtractionSandbox to parse the file out of process
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Returns:
+        Candidate profile dictionary, duplicate link dictionary, or None if
+        no text could be extracted
+        
+    Raises:
+        ExtractionError: If sandboxed extraction breached its time or memory budget
+    """
+    start = time.perf_counter()
+    key = None
+    if duplicates is not None:
+        key = hashlib.sha256(file_bytes).hexdigest()
+        existing = duplicates.find_exact(key)
+        if existing is not None:
+            return _duplicate_link(filename, existing, 1.0, exact=True)
+    
+    raw_text, resume_skills = extract_resume(
+        file_bytes, skills_lexicon, cache, max_pages, max_chars, sandbox, extractor
+    )
+    if not raw_text:
+        return None
+    
+    signature = None
+    if duplicates is not None:
+        with metrics.span("dedup"):
+            signature = duplicates.signature(raw_text)
+            match = duplicates.find(signature)
+        if match is not None:
+            # Remember the file so an identical resubmission skips parsing
+            duplicates.add(match[0], None, key)
+            return _duplicate_link(filename, match[0], match[1])
+    elif text_signature:
+        from .near_duplicates import text_signature as compute_signature
+        signature = compute_signature(raw_text)
+    
+    profile = build_profile(filename, summarize_extraction(raw_text, resume_skills), jd_skills, roles_library)
+    if duplicates is not None:
+        duplicates.add(profile["candidate_id"], signature, key)
+    if text_signature:
+        profile["text_signature"] = signature.tolist() if signature is not None else None
+    
+    if metrics.is_enabled():
+        file_type = metrics_file_type(file_bytes)
+        elapsed = time.perf_counter() - start
+        metrics.observe("total", elapsed, file_type)
+        metrics.record_file(filename, file_type, elapsed)
+    return profile
+
+
+def _duplicate_link(filename: str, doc_id: str, score: float, exact: bool = False) -> dict:
+    # Imported here so the pipeline does not load NumPy unless deduplicating
+    from .near_duplicates import duplicate_link
+    
+    return duplicate_link(filename, doc_id, score, exact)
+
+
+def metrics_file_type(file_bytes: bytes) -> str:
+    """
+    Cheap file type label for metrics, from the leading bytes only.
+    
+    Args:
+        file_bytes: Raw content of the file
+        
+    Returns:
+        "pdf", "docx" or "unknown"
+    """
+    header = bytes(file_bytes[:1024])
+    if header.startswith(b"PK"):
+        return "docx"
+    if b"%PDF-" in header:
+        return "pdf"
+    return "unknown"
+
+
+def summarize_extraction(raw_text: str, resume_skills: List[str]) -> dict:
+    """
+    Reduce extraction output to the fields kept in a candidate profile.
+    
+    Args:
+        raw_text: Extracted resume text
+        resume_skills: Skills matched in the text
+        
+    Returns:
+        Dictionary with raw_text (truncated), raw_text_length and extracted_skills
+    """
+    return {
+        "raw_text": raw_text[:1000] + "..." if len(raw_text) > 1000 else raw_text,  # Truncate for storage
+        "raw_text_length": len(raw_text),
+        "extracted_skills": resume_skills
+    }
+
+
+def build_profile(
+    filename: str,
+    extraction: dict,
+    jd_skills: List[str],
+    roles_library: Union[List[dict], RoleIndex]
+) -> dict:
+    """
+    Score an extracted resume and assemble its candidate profile.
+    
+    Args:
+        filename: Original filename, recorded in the profile
+        extraction: Output of summarize_extraction
+        jd_skills: List of required skills from job description
+        roles_library: List of role definitions or a prebuilt RoleIndex
+        
+    Returns:
+        Candidate profile dictionary
+    """
+    resume_skills = extraction["extracted_skills"]
+    
+    # Calculate confidence score
+    with metrics.span("scoring"):
+        scoring_result = calculate_confidence_score(resume_skills, jd_skills)
+    
+    # Get alternate role suggestions
+    with metrics.span("roles"):
+        alternate_roles = get_role_suggestions_for_candidate(
+            scoring_result["confidence"],
+            resume_skills,
+            roles_library
+        )
+    
+    # Create candidate profile
+    return {
+        "candidate_id": f"candidate_{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}",
+        "filename": filename,
+        "timestamp": datetime.now().isoformat(),
+        "raw_text": extraction["raw_text"],
+        "raw_text_length": extraction["raw_text_length"],
+        "extracted_skills": resume_skills,
+        "total_skills": len(resume_skills),
+        "jd_match": scoring_result,
+        "alternate_roles": alternate_roles
+    }
+
+
+def extract_resume(
+    file_bytes: bytes,
+    skills_lexicon: Union[List[str], CompiledLexicon],
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    sandbox=None,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Tuple[str, List[str]]:
+    """
+    Extract text and skills from a resume, using the cache when given.
+    
+    Args:
+        file_bytes: Raw content of the uploaded file (bytes or memoryview)
+        skills_lexicon: List of skills or a CompiledLexicon to match against
+        cache: Optional extraction cache; on a hit parsing is skipped
+        max_pages: Maximum number of PDF pages to read (None for all)
+        max_chars: Maximum number of characters to extract (None for all)
+        sandbox: Optional ExtractionSandbox to parse the file out of process
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Returns:
+        Tuple of (extracted text, matched skills); text is empty if nothing could be extracted
+        
+    Raises:
+        ExtractionError: If sandboxed extraction breached its time or memory budget
+    """
+    skills_lexicon = compile_lexicon(skills_lexicon)
+    
+    if metrics.is_enabled():
+        file_type = metrics_file_type(file_bytes)
+        metrics.count("files", 1, file_type)
+        metrics.count("bytes", len(file_bytes), file_type)
+    
+    # Extract text, skipping parsing for previously seen files
+    cache_key = file_cache_key(file_bytes, max_pages, max_chars, extractor) if cache else None
+    raw_text = None
+    if cache:
+        with metrics.span("cache_lookup"):
+            raw_text = cache.get_text(cache_key)
+    
+    if raw_text is None:
+        if sandbox is not None:
+            raw_text, resume_skills = extract_text_and_skills_sandboxed(
+                file_bytes, skills_lexicon, sandbox, max_pages, max_chars, extractor
+            )
+        else:
+            raw_text, resume_skills = extract_text_and_skills(
+                file_bytes, skills_lexicon, max_pages, max_chars, extractor
+            )
+        if cache and raw_text:
+            cache.put_text(cache_key, raw_text)
+            cache.put_skills(cache_key, skills_lexicon.fingerprint, resume_skills)
+        return raw_text, resume_skills
+    
+    # Extract skills from cached text
+    resume_skills = cache.get_skills(cache_key, skills_lexicon.fingerprint)
+    if resume_skills is None:
+        with metrics.span("skills"):
+            resume_skills = extract_skills(raw_text, skills_lexicon)
+        cache.put_skills(cache_key, skills_lexicon.fingerprint, resume_skills)
+    return raw_text, resume_skills
+
+
+def extract_text_and_skills(
+    file_bytes: bytes,
+    skills_lexicon: CompiledLexicon,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Tuple[str, List[str]]:
+    """
+    Extract text and match skills page by page in a single pass.
+    
+    With metrics enabled, time spent matching is recorded as the "skills"
+    stage and the rest as "parse".
+    
+    Args:
+        file_bytes: Raw content of the uploaded file
+        skills_lexicon: Compiled lexicon to match against
+        max_pages: Maximum number of PDF pages to read (None for all)
+        max_chars: Maximum number of characters to extract (None for all)
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Returns:
+        Tuple of (extracted text, matched skills); text is empty on failure
+    """
+    matcher = skills_lexicon.stream()
+    chunks = []
+    timed = metrics.is_enabled()
+    start = time.perf_counter() if timed else 0.0
+    match_seconds = 0.0
+    
+    try:
+        for chunk in iter_text_from_file(file_bytes, max_pages, max_chars, extractor):
+            match_start = time.perf_counter() if timed else 0.0
+            if chunks:
+                matcher.feed("\n")
+            matcher.feed(chunk)
+            if timed:
+                match_seconds += time.perf_counter() - match_start
+            chunks.append(chunk)
+    except Exception as e:
+        print(f"Error extracting text: {e}")
+        metrics.count("errors", 1, metrics_file_type(file_bytes) if timed else "")
+        return "", []
+    
+    match_start = time.perf_counter() if timed else 0.0
+    resume_skills = matcher.finish()
+    if timed:
+        match_seconds += time.perf_counter() - match_start
+        file_type = metrics_file_type(file_bytes)
+        metrics.observe("parse", time.perf_counter() - start - match_seconds, file_type)
+        metrics.observe("skills", match_seconds, file_type)
+    return "\n".join(chunks).strip(), resume_skills
+
+
+def extract_text_and_skills_sandboxed(
+    file_bytes: bytes,
+    skills_lexicon: CompiledLexicon,
+    sandbox,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+    extractor: str = DEFAULT_EXTRACTOR
+) -> Tuple[str, List[str]]:
+    """
+    Extract text in a sandbox worker process, then match skills here.
+    
+    Gives the same result as extract_text_and_skills. Parser errors give empty
+    text as they do in-process; budget breaches are raised so the caller can
+    report the file as failed.
+    
+    Args:
+        file_bytes: Raw content of the uploaded file
+        skills_lexicon: Compiled lexicon to match against
+        sandbox: ExtractionSandbox running the parser
+        max_pages: Maximum number of PDF pages to read (None for all)
+        max_chars: Maximum number of characters to extract (None for all)
+        extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+        
+    Returns:
+        Tuple of (extracted text, matched skills); text is empty on parser errors
+        
+    Raises:
+        ExtractionError: If the worker timed out, ran out of memory or died
+    """
+    file_type = metrics_file_type(file_bytes) if metrics.is_enabled() else ""
+    try:
+        with metrics.span("parse", file_type):
+            raw_text = sandbox.extract_text(file_bytes, max_pages, max_chars, extractor)
+    except ValueError as e:
+        print(f"Error extracting text: {e}")
+        metrics.count("errors", 1, file_type)
+        return "", []
+    
+    with metrics.span("skills", file_type):
+        resume_skills = skills_lexicon.find(raw_text)
+    return raw_text, resume_skills
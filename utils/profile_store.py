@@ -0,0 +1,391 @@
+"""
+Candidate profile storage backends.
+"""
+import json
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+DEFAULT_BATCH_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    candidate_id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    recommendation TEXT,
+    confidence INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_candidate_id ON profiles (candidate_id);
+CREATE INDEX IF NOT EXISTS idx_profiles_filename ON profiles (filename);
+CREATE INDEX IF NOT EXISTS idx_profiles_timestamp ON profiles (timestamp);
+CREATE INDEX IF NOT EXISTS idx_profiles_recommendation ON profiles (recommendation, confidence);
+CREATE INDEX IF NOT EXISTS idx_profiles_confidence ON profiles (confidence);
+"""
+
+
+class ProfileStore(ABC):
+    """
+    Interface for candidate profile storage.
+    
+    Backends implement save and iter_profiles; queries default to scanning
+    iter_profiles and may be overridden with indexed versions. Backends may
+    buffer writes; call flush() at the end of a batch.
+    Subscribers are called with every profile as it is saved, which lets
+    derived indexes stay up to date.
+    """
+    
+    def __init__(self):
+        self._subscribers: List[Callable[[dict], None]] = []
+    
+    def subscribe(self, callback: Callable[[dict], None]):
+        """
+        Register a callback for newly saved profiles.
+        
+        Args:
+            callback: Called with each profile after save()
+        """
+        self._subscribers.append(callback)
+    
+    def _notify(self, profile: dict):
+        for callback in self._subscribers:
+            callback(profile)
+    
+    @abstractmethod
+    def save(self, profile: dict) -> str:
+        """
+        Save a candidate profile.
+        
+        Args:
+            profile: Candidate profile dictionary
+            
+        Returns:
+            Storage reference for the saved profile
+        """
+    
+    def save_many(self, profiles: List[dict]) -> List[str]:
+        """Save several candidate profiles."""
+        return [self.save(profile) for profile in profiles]
+    
+    def flush(self):
+        """Persist any buffered profiles."""
+    
+    def close(self):
+        """Flush and release resources."""
+        self.flush()
+    
+    @abstractmethod
+    def iter_profiles(self) -> Iterator[dict]:
+        """Iterate over every stored profile in insertion order."""
+    
+    def query(
+        self,
+        filename: Optional[str] = None,
+        recommendation: Optional[str] = None,
+        min_confidence: Optional[int] = None,
+        max_confidence: Optional[int] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = True
+    ) -> List[dict]:
+        """
+        Find stored profiles matching all given filters.
+        
+        Args:
+            filename: Exact original filename
+            recommendation: "Interview", "Maybe" or "Not now"
+            min_confidence: Minimum JD confidence (inclusive)
+            max_confidence: Maximum JD confidence (inclusive)
+            since: Earliest ISO timestamp (inclusive)
+            until: Latest ISO timestamp (exclusive)
+            limit: Maximum number of profiles to return
+            newest_first: Order by timestamp descending (default) or ascending
+            
+        Returns:
+            List of matching profile dictionaries
+        """
+        matches = [
+            profile for profile in self.iter_profiles()
+            if _matches(profile, filename, recommendation, min_confidence, max_confidence, since, until)
+        ]
+        matches.sort(key=lambda p: p.get("timestamp", ""), reverse=newest_first)
+        return matches[:limit] if limit is not None else matches
+    
+    def count(self) -> int:
+        """Number of stored profiles."""
+        return sum(1 for _ in self.iter_profiles())
+    
+    def iter_skills(self) -> Iterator[Tuple[str, str, List[str]]]:
+        """
+        Iterate over (candidate_id, filename, extracted_skills) of every profile.
+        
+        Yields:
+            One tuple per stored profile in insertion order
+        """
+        for profile in self.iter_profiles():
+            yield profile.get("candidate_id", ""), profile.get("filename", ""), profile.get("extracted_skills", [])
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _matches(profile, filename, recommendation, min_confidence, max_confidence, since, until) -> bool:
+    """Check a profile against query filters (used by scanning backends)."""
+    jd_match = profile.get("jd_match", {})
+    confidence = jd_match.get("confidence", 0)
+    timestamp = profile.get("timestamp", "")
+    return (
+        (filename is None or profile.get("filename") == filename)
+        and (recommendation is None or jd_match.get("recommendation") == recommendation)
+        and (min_confidence is None or confidence >= min_confidence)
+        and (max_confidence is None or confidence <= max_confidence)
+        and (since is None or timestamp >= since)
+        and (until is None or timestamp < until)
+    )
+
+
+class SQLiteProfileStore(ProfileStore):
+    """
+    Append-only SQLite profile store with batched commits.
+    
+    Profiles are buffered and written in one transaction every batch_size
+    saves (or on flush), and indexed by candidate ID, filename, timestamp,
+    recommendation and confidence.
+    """
+    
+    def __init__(self, db_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__()
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self._pending = []
+        self._lock = threading.Lock()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+    
+    def save(self, profile: dict) -> str:
+        jd_match = profile.get("jd_match", {})
+        row = (
+            profile.get("candidate_id", ""),
+            profile.get("filename", ""),
+            profile.get("timestamp") or datetime.now().isoformat(),
+            jd_match.get("recommendation"),
+            jd_match.get("confidence"),
+            json.dumps(profile)
+        )
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+        self._notify(profile)
+        return row[0]
+    
+    def _write_pending(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO profiles (candidate_id, filename, timestamp, recommendation, confidence, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending
+            )
+        self._pending = []
+    
+    def flush(self):
+        with self._lock:
+            self._write_pending()
+    
+    def close(self):
+        self.flush()
+        self._conn.close()
+    
+    def get(self, candidate_id: str) -> Optional[dict]:
+        """
+        Get the most recently saved profile with a candidate ID.
+        
+        Args:
+            candidate_id: Candidate ID from the profile
+            
+        Returns:
+            Profile dictionary or None if not found
+        """
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM profiles WHERE candidate_id = ? ORDER BY seq DESC LIMIT 1",
+                (candidate_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def iter_profiles(self, batch_rows: int = 1000) -> Iterator[dict]:
+        self.flush()
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, data FROM profiles WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last_seq, batch_rows)
+                ).fetchall()
+            if not rows:
+                return
+            for seq, data in rows:
+                yield json.loads(data)
+            last_seq = rows[-1][0]
+    
+    def iter_skills(self, batch_rows: int = 10000) -> Iterator[Tuple[str, str, List[str]]]:
+        # Pull only the skills column out of the JSON instead of whole profiles
+        self.flush()
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, candidate_id, filename, json_extract(data, '$.extracted_skills') "
+                    "FROM profiles WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last_seq, batch_rows)
+                ).fetchall()
+            if not rows:
+                return
+            for seq, candidate_id, filename, skills in rows:
+                yield candidate_id, filename, json.loads(skills) if skills else []
+            last_seq = rows[-1][0]
+    
+    def query(
+        self,
+        filename: Optional[str] = None,
+        recommendation: Optional[str] = None,
+        min_confidence: Optional[int] = None,
+        max_confidence: Optional[int] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = True
+    ) -> List[dict]:
+        clauses = []
+        params = []
+        for clause, value in [
+            ("filename = ?", filename),
+            ("recommendation = ?", recommendation),
+            ("confidence >= ?", min_confidence),
+            ("confidence <= ?", max_confidence),
+            ("timestamp >= ?", since),
+            ("timestamp < ?", until),
+        ]:
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        
+        sql = "SELECT data FROM profiles"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp " + ("DESC" if newest_first else "ASC")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def count(self) -> int:
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+
+class DirectoryProfileStore(ProfileStore):
+    """
+    One pretty-printed JSON file per profile in a directory.
+    
+    This is the original storage layout. Queries scan every file, so prefer
+    SQLiteProfileStore for large volumes.
+    """
+    
+    def __init__(self, output_dir: str):
+        super().__init__()
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def save(self, profile: dict) -> str:
+        # Create a safe filename
+        filename = profile.get("filename", "candidate")
+        safe_filename = filename.replace(" ", "_").replace("/", "_").replace(".pdf", "").replace(".docx", "")
+        # Microsecond timestamp so files in the same batch do not collide
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        output_file = self.output_dir / f"{safe_filename}_{timestamp}.json"
+        
+        with open(output_file, 'x') as f:
+            json.dump(profile, f, indent=2)
+        
+        self._notify(profile)
+        return str(output_file)
+    
+    def iter_profiles(self) -> Iterator[dict]:
+        for path in sorted(self.output_dir.glob("*.json"), key=_saved_order):
+            with open(path, 'r') as f:
+                yield json.load(f)
+
+
+# Save time at the end of a profile file name; older files have no microseconds
+_SAVED_AT = re.compile(r"_(\d{8})_(\d{6})(?:_(\d{6}))?$")
+
+
+def _saved_order(path: Path) -> Tuple[str, str]:
+    """Sort key putting profile files in the order they were saved."""
+    match = _SAVED_AT.search(path.stem)
+    if match is None:
+        return "", path.name
+    date, time_of_day, micros = match.groups()
+    return f"{date}{time_of_day}{micros or '000000'}", path.name
+
+
+def open_profile_store(backend: str, location: str) -> ProfileStore:
+    """
+    Open a profile store by backend name.
+    
+    Args:
+        backend: "sqlite" or "json"
+        location: Database file (sqlite) or directory (json)
+        
+    Returns:
+        ProfileStore instance
+    """
+    if backend == "sqlite":
+        return SQLiteProfileStore(location)
+    elif backend == "json":
+        return DirectoryProfileStore(location)
+    else:
+        raise ValueError(f"Unknown profile store backend: {backend}")
+
+
+def migrate_profiles(source: ProfileStore, target: ProfileStore) -> int:
+    """
+    Copy every profile from one store to another.
+    
+    Args:
+        source: Store to read from, e.g. a DirectoryProfileStore
+        target: Store to write to, e.g. a SQLiteProfileStore
+        
+    Returns:
+        Number of profiles copied
+    """
+    copied = 0
+    for profile in source.iter_profiles():
+        target.save(profile)
+        copied += 1
+    target.flush()
+    return copied
@@ -0,0 +1,114 @@
+"""
+Columnar screening results for the paginated results view.
+
+The table is one DataFrame built once per screening run, with a column per
+field and a row per candidate. Filtering, sorting and paging are vectorized
+operations on it, so each rerun of the page only renders the rows on screen,
+however many candidates were screened. Rows keep the candidate's position in
+the results list as their index, for looking up its details.
+"""
+import math
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from .candidate_profile import CandidateProfile
+
+RECOMMENDATIONS = ["Interview", "Maybe", "Not now"]
+DEFAULT_PAGE_SIZE = 50
+# Sortable columns of the results frame and their labels
+SORT_COLUMNS = {
+    "confidence": "Confidence",
+    "candidate": "Candidate",
+    "recommendation": "Recommendation",
+    "total_skills": "Total Skills",
+    "best_fit": "Best-Fit Role Score"
+}
+
+
+def _preview(skills: List[str], limit: int) -> str:
+    return ", ".join(skills[:limit]) + ("..." if len(skills) > limit else "")
+
+
+def build_results_frame(results: List[CandidateProfile], role_fits: List[List[dict]]) -> pd.DataFrame:
+    """
+    Build the results table for a screening run.
+    
+    Args:
+        results: Screened candidates
+        role_fits: Ranked role fits of each candidate (see RoleFitMatrix.role_fits)
+        
+    Returns:
+        DataFrame indexed by position in results with candidate, confidence,
+        recommendation (ordered categorical), matched_skills, missing_skills,
+        total_skills, best_fit_role and best_fit columns
+    """
+    columns = {
+        "candidate": [], "confidence": [], "recommendation": [], "matched_skills": [],
+        "missing_skills": [], "total_skills": [], "best_fit_role": [], "best_fit": []
+    }
+    for candidate, fits in zip(results, role_fits):
+        columns["candidate"].append(candidate.filename)
+        columns["confidence"].append(candidate.confidence)
+        columns["recommendation"].append(candidate.recommendation)
+        columns["matched_skills"].append(_preview(candidate.matched_skills(), 5))
+        columns["missing_skills"].append(_preview(candidate.missing_skills(), 3))
+        columns["total_skills"].append(candidate.total_skills)
+        columns["best_fit_role"].append(fits[0]["role_name"] if fits else "")
+        columns["best_fit"].append(fits[0]["fit_score"] if fits else 0)
+    
+    frame = pd.DataFrame(columns)
+    frame["recommendation"] = pd.Categorical(frame["recommendation"], categories=RECOMMENDATIONS, ordered=True)
+    return frame
+
+
+def filter_results(
+    frame: pd.DataFrame,
+    recommendations: Optional[Sequence[str]] = None,
+    min_confidence: int = 0,
+    max_confidence: int = 100,
+    sort_by: str = "confidence",
+    descending: bool = True
+) -> pd.DataFrame:
+    """
+    Filter and sort the results table.
+    
+    Args:
+        frame: Table from build_results_frame
+        recommendations: Recommendations to keep (default: all)
+        min_confidence: Lowest confidence kept (inclusive)
+        max_confidence: Highest confidence kept (inclusive)
+        sort_by: Column to sort on (a key of SORT_COLUMNS)
+        descending: Sort from highest to lowest
+        
+    Returns:
+        Matching rows in order; ties keep their screening order
+    """
+    if sort_by not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort column {sort_by!r}: expected one of {', '.join(SORT_COLUMNS)}")
+    
+    mask = frame["confidence"].between(min_confidence, max_confidence)
+    if recommendations is not None:
+        mask &= frame["recommendation"].isin(recommendations)
+    return frame[mask].sort_values(sort_by, ascending=not descending, kind="stable")
+
+
+def page_count(n_rows: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """Number of pages needed for n_rows, at least 1."""
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def results_page(frame: pd.DataFrame, page: int, page_size: int = DEFAULT_PAGE_SIZE) -> pd.DataFrame:
+    """
+    Rows of one page of a filtered table.
+    
+    Args:
+        frame: Table from filter_results
+        page: Page number, starting at 1; clamped to the pages available
+        page_size: Rows per page
+        
+    Returns:
+        At most page_size rows
+    """
+    page = min(max(1, page), page_count(len(frame), page_size))
+    return frame.iloc[(page - 1) * page_size:page * page_size]
@@ -0,0 +1,268 @@
+"""
+Weighted role fit of many candidates against the whole role library.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_REQUIRED_WEIGHT = 1.0
+DEFAULT_PREFERRED_WEIGHT = 0.5
+# Candidates scored per block; bounds the dense block of fits in memory
+DEFAULT_BLOCK_SIZE = 1024
+_FIT_RESOLUTION = 1_000_000_000
+
+
+class RoleFitMatrix:
+    """
+    Roles x skills weight matrix over a role library.
+    
+    A role's fit for a candidate is the weighted share of its skills the
+    candidate has: required skills count required_weight each and
+    preferred skills preferred_weight each (a skill listed as both counts
+    as required), divided by the role's total, so fits run from 0 to 1.
+    Weights are normalized per role when the matrix is built, so scoring is
+    a single sparse candidate x skill by skill x role product. The matrix
+    is stored by skill column: each skill lists the roles that use it and
+    their weights, and the work per candidate is proportional to the roles
+    sharing a skill with it, not to the size of the library.
+    """
+    
+    def __init__(
+        self,
+        roles_library: List[dict],
+        required_weight: float = DEFAULT_REQUIRED_WEIGHT,
+        preferred_weight: float = DEFAULT_PREFERRED_WEIGHT
+    ):
+        """
+        Args:
+            roles_library: Role definitions with required_skills and preferred_skills
+            required_weight: Weight of each required skill
+            preferred_weight: Weight of each preferred skill
+        """
+        if required_weight < 0 or preferred_weight < 0 or required_weight + preferred_weight <= 0:
+            raise ValueError("Role fit weights must be non-negative and not both zero")
+        self.required_weight = required_weight
+        self.preferred_weight = preferred_weight
+        self._index: Dict[str, int] = {}
+        self._required: List[List[int]] = []
+        self._preferred: List[List[int]] = []
+        self.roles = []
+        
+        entries = []
+        for role in roles_library:
+            required = list(dict.fromkeys(self._column(s) for s in role.get("required_skills", [])))
+            required_set = set(required)
+            preferred = list(dict.fromkeys(
+                col for col in (self._column(s) for s in role.get("preferred_skills", []))
+                if col not in required_set
+            ))
+            total = required_weight * len(required) + preferred_weight * len(preferred)
+            if total <= 0:
+                continue
+            position = len(self.roles)
+            self.roles.append(role)
+            self._required.append(required)
+            self._preferred.append(preferred)
+            entries.extend((col, position, required_weight / total) for col in required)
+            entries.extend((col, position, preferred_weight / total) for col in preferred)
+        
+        # Compressed skill columns: roles and weights of column c are at
+        # _col_start[c]:_col_start[c + 1]
+        entries.sort()
+        cols = np.array([col for col, _, _ in entries], dtype=np.int64)
+        self._col_roles = np.array([position for _, position, _ in entries], dtype=np.int64)
+        self._col_weights = np.array([weight for _, _, weight in entries], dtype=np.float64)
+        self._col_start = np.searchsorted(cols, np.arange(len(self._index) + 1))
+    
+    def __len__(self) -> int:
+        return len(self.roles)
+    
+    def _column(self, skill: str) -> int:
+        key = skill.lower()
+        col = self._index.get(key)
+        if col is None:
+            col = self._index[key] = len(self._index)
+        return col
+    
+    def _skill_pairs(self, skill_lists: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """(candidate row, skill column) of every distinct candidate skill some role uses."""
+        index = self._index
+        n_columns = max(1, len(index))
+        cols = np.array(
+            [index.get(skill.lower(), -1) for skills in skill_lists for skill in skills],
+            dtype=np.int64
+        )
+        rows = np.repeat(np.arange(len(skill_lists)), [len(skills) for skills in skill_lists])
+        known = cols >= 0
+        # Case variants of one skill count once
+        pairs = np.unique(rows[known] * n_columns + cols[known])
+        return pairs // n_columns, pairs % n_columns
+    
+    def _postings(self, cols: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """Indexes of the matrix entries of each column in turn, given each column's length."""
+        ends = np.cumsum(lengths)
+        return np.arange(ends[-1] if len(ends) else 0) + np.repeat(self._col_start[cols] - (ends - lengths), lengths)
+    
+    def fit_scores(self, skill_lists: List[List[str]]) -> np.ndarray:
+        """
+        Fit of every candidate for every role.
+        
+        Args:
+            skill_lists: Per-candidate lists of extracted skills
+            
+        Returns:
+            float64 array of shape (n_candidates, n_roles) with fits from 0 to 1
+        """
+        n_candidates, n_roles = len(skill_lists), len(self.roles)
+        rows, cols = self._skill_pairs(skill_lists)
+        lengths = self._col_start[cols + 1] - self._col_start[cols]
+        
+        if lengths.sum() > n_candidates * n_roles:
+            # Skills shared by many roles (a small lexicon): the expansion
+            # outgrows the dense result, so multiply candidate x skill by the
+            # dense skill x role weights of just the skills present instead
+            columns, column_of_pair = np.unique(cols, return_inverse=True)
+            column_lengths = self._col_start[columns + 1] - self._col_start[columns]
+            column_entries = self._postings(columns, column_lengths)
+            weights = np.zeros((len(columns), n_roles))
+            weights[np.repeat(np.arange(len(columns)), column_lengths), self._col_roles[column_entries]] = \
+                self._col_weights[column_entries]
+            has_skill = np.zeros((n_candidates, len(columns)))
+            has_skill[rows, column_of_pair] = 1.0
+            return has_skill @ weights
+        
+        # Expand each (candidate, skill) pair into the roles using that skill
+        entries = self._postings(cols, lengths)
+        fits = np.bincount(
+            np.repeat(rows, lengths) * n_roles + self._col_roles[entries],
+            weights=self._col_weights[entries],
+            minlength=n_candidates * n_roles
+        )
+        return fits.reshape(n_candidates, n_roles)
+    
+    def top_fits(
+        self,
+        skill_lists: List[List[str]],
+        top_n: int = 3,
+        min_fit: float = 0.0,
+        block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Best-fitting roles of every candidate.
+        
+        Candidates are scored in blocks, so memory is bounded by block_size
+        x n_roles however many candidates there are.
+        
+        Args:
+            skill_lists: Per-candidate lists of extracted skills
+            top_n: Roles kept per candidate
+            min_fit: Roles fitting less than this are left out
+            block_size: Candidates scored at once
+            
+        Returns:
+            (roles, fits): int64 role positions and float64 fits, both of
+            shape (n_candidates, top_n), best first with library order among
+            ties; slots without a qualifying role hold -1 and 0.0
+        """
+        n = len(skill_lists)
+        k = min(top_n, len(self.roles))
+        roles = np.full((n, top_n), -1, dtype=np.int64)
+        fits = np.zeros((n, top_n))
+        if not k:
+            return roles, fits
+        
+        n_roles = len(self.roles)
+        # Integer sort key: fit (to 1e-9, far finer than any two distinct
+        # fits differ) then earlier library position, so the order is exact
+        # and argpartition needs no tie handling
+        tie_break = np.arange(n_roles - 1, -1, -1, dtype=np.int64)
+        for start in range(0, n, block_size):
+            block = self.fit_scores(skill_lists[start:start + block_size])
+            keys = np.rint(block * _FIT_RESOLUTION).astype(np.int64) * n_roles + tie_break
+            if k < n_roles:
+                best = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+            else:
+                best = np.broadcast_to(np.arange(n_roles), keys.shape)
+            order = np.argsort(-np.take_along_axis(keys, best, axis=1), axis=1)
+            best = np.take_along_axis(best, order, axis=1)
+            best_fits = np.take_along_axis(block, best, axis=1)
+            keep = (best_fits >= min_fit) & (best_fits > 0)
+            end = start + len(block)
+            roles[start:end, :k] = np.where(keep, best, -1)
+            fits[start:end, :k] = np.where(keep, best_fits, 0.0)
+        return roles, fits
+    
+    def role_fits(
+        self,
+        skill_lists: List[List[str]],
+        top_n: int = 3,
+        min_fit: float = 0.0
+    ) -> List[List[dict]]:
+        """
+        Ranked role fits with matched skills for every candidate.
+        
+        Args:
+            skill_lists: Per-candidate lists of extracted skills
+            top_n: Roles kept per candidate
+            min_fit: Roles fitting less than this are left out
+            
+        Returns:
+            Per candidate, a list of dicts with role_id, role_name, fit_score
+            (0-100), required_matched, preferred_matched (in the
+            candidate's spelling), required_coverage and preferred_coverage
+        """
+        roles, fits = self.top_fits(skill_lists, top_n, min_fit)
+        names = {col: key for key, col in self._index.items()}
+        results = []
+        for resume_skills, row_roles, row_fits in zip(skill_lists, roles.tolist(), fits.tolist()):
+            # Last spelling wins, as in get_matched_skills
+            spelling = {s.lower(): s for s in resume_skills}
+            candidate_fits = []
+            for position, fit in zip(row_roles, row_fits):
+                if position < 0:
+                    break
+                required = [spelling[names[col]] for col in self._required[position] if names[col] in spelling]
+                preferred = [spelling[names[col]] for col in self._preferred[position] if names[col] in spelling]
+                role = self.roles[position]
+                candidate_fits.append({
+                    "role_id": role.get("role_id", ""),
+                    "role_name": role.get("role_name", ""),
+                    "fit_score": round(fit * 100),
+                    "required_matched": sorted(required),
+                    "preferred_matched": sorted(preferred),
+                    "required_coverage": round(len(required) / len(self._required[position]), 2)
+                    if self._required[position] else 0.0,
+                    "preferred_coverage": round(len(preferred) / len(self._preferred[position]), 2)
+                    if self._preferred[position] else 0.0
+                })
+            results.append(candidate_fits)
+        return results
+
+
+def rank_role_fits(
+    skill_lists: List[List[str]],
+    roles_library: List[dict],
+    top_n: int = 3,
+    required_weight: float = DEFAULT_REQUIRED_WEIGHT,
+    preferred_weight: float = DEFAULT_PREFERRED_WEIGHT,
+    min_fit: float = 0.0,
+    matrix: Optional[RoleFitMatrix] = None
+) -> List[List[dict]]:
+    """
+    Rank every role for every candidate by weighted required/preferred fit.
+    
+    Args:
+        skill_lists: Per-candidate lists of extracted skills
+        roles_library: Role definitions from role_library.json
+        top_n: Roles kept per candidate
+        required_weight: Weight of each required skill
+        preferred_weight: Weight of each preferred skill
+        min_fit: Roles fitting less than this (0-1) are left out
+        matrix: Prebuilt RoleFitMatrix to reuse (weights are then ignored)
+        
+    Returns:
+        Per candidate, ranked role fit dictionaries (see RoleFitMatrix.role_fits)
+    """
+    if matrix is None:
+        matrix = RoleFitMatrix(roles_library, required_weight, preferred_weight)
+    return matrix.role_fits(skill_lists, top_n, min_fit)
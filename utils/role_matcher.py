@@ -1,13 +1,127 @@
 """
 Alternate role matcher utility.
 """
-from typing import List, Dict
+import heapq
+from bisect import bisect_right
+from collections import defaultdict
+from typing import List, Dict, Union
+from .scoring import MAYBE_THRESHOLD
 from .skill_extractor import get_matched_skills
 
 
+class RoleIndex:
+    """
+    Inverted skill -> role index over a role library.
+    
+    Build once per role library load and reuse across candidates. Only
+    roles sharing at least one required skill with the candidate are
+    counted. Posting lists are ordered by role size, so roles too large to
+    reach min_score with the candidate's skill count are cut off with a
+    binary search, and the top roles are kept in a bounded heap.
+    """
+    
+    def __init__(self, roles_library: List[dict]):
+        self.roles = [role for role in roles_library if role.get("required_skills")]
+        self._required_count = [len(role["required_skills"]) for role in self.roles]
+        self._required_lower = [
+            list(dict.fromkeys(s.lower() for s in role["required_skills"]))
+            for role in self.roles
+        ]
+        
+        postings = defaultdict(list)
+        for position, skills in enumerate(self._required_lower):
+            for skill in skills:
+                postings[skill].append(position)
+        
+        # Sort each posting list by required skill count for bound pruning
+        self._postings = {}
+        self._posting_sizes = {}
+        for skill, positions in postings.items():
+            positions.sort(key=lambda p: self._required_count[p])
+            self._postings[skill] = positions
+            self._posting_sizes[skill] = [self._required_count[p] for p in positions]
+    
+    def __len__(self) -> int:
+        return len(self.roles)
+    
+    def find_alternate_roles(
+        self,
+        resume_skills: List[str],
+        min_score: float = 0.5,
+        top_n: int = 3
+    ) -> List[dict]:
+        """
+        Find alternate role suggestions based on resume skills.
+        
+        Args:
+            resume_skills: List of skills extracted from resume
+            min_score: Minimum score threshold (default: 0.5)
+            top_n: Number of top roles to return (default: 3)
+            
+        Returns:
+            List of suggested roles with scores and matched skills, identical
+            to scanning the whole library
+        """
+        if not resume_skills or not self.roles:
+            return []
+        
+        # Last spelling wins, as in get_matched_skills
+        resume_lower = {s.lower(): s for s in resume_skills}
+        
+        if min_score > 0:
+            # A role cannot reach min_score if even matching every candidate
+            # skill falls short. The float bound only seeds the cut, which is
+            # then widened with the same division as the final score test, so
+            # rounding never prunes a role that would pass it
+            n = len(resume_lower)
+            max_required = n / min_score
+            overlap = defaultdict(int)
+            for skill in resume_lower:
+                positions = self._postings.get(skill)
+                if positions:
+                    sizes = self._posting_sizes[skill]
+                    cut = bisect_right(sizes, max_required)
+                    while cut < len(sizes) and n / sizes[cut] >= min_score:
+                        cut += 1
+                    for position in positions[:cut]:
+                        overlap[position] += 1
+        else:
+            # Every role qualifies, including ones with no overlap
+            overlap = dict.fromkeys(range(len(self.roles)), 0)
+            for skill in resume_lower:
+                for position in self._postings.get(skill, ()):
+                    overlap[position] += 1
+        
+        scored = []
+        for position, count in overlap.items():
+            role_score = count / self._required_count[position]
+            if role_score >= min_score:
+                scored.append((-round(role_score * 100), position, role_score))
+        
+        # Highest rounded score first, library order among ties
+        matches = []
+        for _, position, role_score in heapq.nsmallest(top_n, scored):
+            role = self.roles[position]
+            matched_req = sorted(
+                resume_lower[skill] for skill in self._required_lower[position]
+                if skill in resume_lower
+            )
+            matches.append({
+                "role_id": role.get("role_id", ""),
+                "role_name": role.get("role_name", ""),
+                "role_score": round(role_score * 100),
+                "matched_skills": matched_req,
+                "matched_count": len(matched_req),
+                "total_required": self._required_count[position],
+                "coverage": round(role_score, 2)
+            })
+        
+        return matches
+
+
 def find_alternate_roles(
     resume_skills: List[str],
-    roles_library: List[dict],
+    roles_library: Union[List[dict], RoleIndex],
     min_score: float = 0.5,
     top_n: int = 3
 ) -> List[dict]:
@@ -16,13 +130,17 @@ def find_alternate_roles(
     
     Args:
         resume_skills: List of skills extracted from resume
-        roles_library: List of role definitions from role_library.json
+        roles_library: List of role definitions from role_library.json, or a
+            prebuilt RoleIndex (preferred when scoring many candidates)
         min_score: Minimum score threshold (default: 0.5)
         top_n: Number of top roles to return (default: 3)
         
     Returns:
         List of suggested roles with scores and matched skills
     """
+    if isinstance(roles_library, RoleIndex):
+        return roles_library.find_alternate_roles(resume_skills, min_score, top_n)
+    
     if not resume_skills or not roles_library:
         return []
     
@@ -60,7 +178,7 @@ def find_alternate_roles(
 def get_role_suggestions_for_candidate(
     confidence: int,
     resume_skills: List[str],
-    roles_library: List[dict]
+    roles_library: Union[List[dict], RoleIndex]
 ) -> List[dict]:
     """
     Get role suggestions if confidence is below threshold.
@@ -68,12 +186,12 @@ def get_role_suggestions_for_candidate(
     Args:
         confidence: Interview confidence score
         resume_skills: List of skills extracted from resume
-        roles_library: List of role definitions
+        roles_library: List of role definitions or a prebuilt RoleIndex
         
     Returns:
-        List of suggested roles (empty if confidence >= 55)
+        List of suggested roles (empty if confidence >= MAYBE_THRESHOLD)
     """
-    if confidence >= 55:
+    if confidence >= MAYBE_THRESHOLD:
         return []
     
     return find_alternate_roles(resume_skills, roles_library)
@@ -4,6 +4,10 @@ Scoring utility for interview confidence calculation.
 from typing import List, Tuple
 from .skill_extractor import get_matched_skills, get_missing_skills
 
+# Confidence thresholds for recommendations
+INTERVIEW_THRESHOLD = 75
+MAYBE_THRESHOLD = 55
+
 
 def calculate_confidence_score(resume_skills: List[str], jd_skills: List[str]) -> dict:
     """
@@ -33,9 +37,9 @@ def calculate_confidence_score(resume_skills: List[str], jd_skills: List[str]) -
     confidence = round(coverage * 100)
     
     # Determine recommendation
-    if confidence >= 75:
+    if confidence >= INTERVIEW_THRESHOLD:
         recommendation = "Interview"
-    elif confidence >= 55:
+    elif confidence >= MAYBE_THRESHOLD:
         recommendation = "Maybe"
     else:
         recommendation = "Not now"
@@ -0,0 +1,571 @@
+"""
+Local HTTP screening service with a bounded work queue.
+
+The Streamlit app screens inside one session's rerun, so recruiters
+uploading large batches at the same time simply contend for the same
+process. The service instead accepts batches over HTTP, queues their files
+and screens them on a process pool:
+
+    POST /batches                  submit a batch (202, or 429 when full)
+    GET  /batches/<id>             batch status and counts
+    GET  /batches/<id>/results     stream results as JSON lines as files finish
+    GET  /health                   queue and worker occupancy
+    GET  /metrics                  Prometheus text metrics
+
+A batch is a JSON object {"jd_text": ..., "files": [{"filename": ...,
+"content": <base64>}, ...], "extractor": optional}. Requests carry their
+tenant in the X-Tenant header. Each tenant only sees its own batches, may
+have at most tenant_concurrency files screening at once and at most
+tenant_queue_size files waiting; queued files are dispatched round-robin
+across tenants so one large batch cannot starve everyone else. A batch that
+does not fit in the queue is rejected whole with 429 and a Retry-After
+estimate rather than accepted and left to pile up. With a profile store,
+screened candidates are saved to it as they finish, as by the screen command.
+
+Everything runs on the standard library; start it with
+python -m utils.cli serve.
+"""
+import asyncio
+import base64
+import binascii
+import json
+import math
+import multiprocessing
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from . import metrics
+from .data_artifact import load_screening_data
+from .file_loader import EXTRACTOR_CHOICES, DEFAULT_EXTRACTOR
+from .jd_cache import get_jd_cache, parse_job_description_cached
+from .parallel import init_worker, screen_chunk
+from .pipeline import DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+from .profile_store import SQLiteProfileStore
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 256
+DEFAULT_TENANT_CONCURRENCY = 2
+DEFAULT_MAX_REQUEST_MB = 64
+# Finished batches are kept this long for status and result reads
+DEFAULT_RESULT_TTL = 3600.0
+
+DEFAULT_TENANT = "default"
+_MAX_HEADER_BYTES = 64 * 1024
+_STATUS_TEXT = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 429: "Too Many Requests", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error"
+}
+
+
+class QueueFull(Exception):
+    """A batch was rejected because the queue cannot take all of its files."""
+    
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class HTTPError(Exception):
+    """A request the service answers with an error status."""
+    
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class Batch:
+    """One submitted batch: its files' results in completion order and counts."""
+    
+    def __init__(self, tenant: str, filenames: List[str], task_args: tuple):
+        self.batch_id = uuid.uuid4().hex
+        self.tenant = tenant
+        self.filenames = filenames
+        # Arguments after the chunk for parallel.screen_chunk
+        self.task_args = task_args
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.started = 0
+        self.results: List[dict] = []
+        self.counts = {"screened": 0, "duplicates": 0, "empty": 0, "failed": 0}
+        self.changed = asyncio.Condition()
+    
+    @property
+    def done(self) -> bool:
+        return len(self.results) == len(self.filenames)
+    
+    def status(self) -> dict:
+        if self.done:
+            state = "done"
+        elif self.started:
+            state = "running"
+        else:
+            state = "queued"
+        return {
+            "batch_id": self.batch_id,
+            "state": state,
+            "files": len(self.filenames),
+            "completed": len(self.results),
+            **self.counts
+        }
+
+
+# A queued file: (batch, index in the batch, file bytes)
+_Job = Tuple[Batch, int, bytes]
+
+
+class ScreeningService:
+    """
+    Bounded, tenant-aware screening queue in front of a process pool.
+    
+    All state is owned by the event loop thread; the screening runs in the
+    pool, through the same worker initializer and chunk function as
+    screen_resumes_parallel, and JD parsing and profile saves run in the
+    loop's default thread pool so they never block other requests.
+    """
+    
+    def __init__(
+        self,
+        lexicon_path: str,
+        roles_path: str,
+        workers: int = 1,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        tenant_concurrency: int = DEFAULT_TENANT_CONCURRENCY,
+        tenant_queue_size: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        artifact_path: Optional[str] = None,
+        max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+        max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+        sandbox_limits: Optional[Tuple[Optional[float], Optional[int]]] = None,
+        result_ttl: float = DEFAULT_RESULT_TTL,
+        store_path: Optional[str] = None
+    ):
+        """
+        Args:
+            lexicon_path: Path to skills_lexicon.json
+            roles_path: Path to role_library.json
+            workers: Worker processes, i.e. files screened at once
+            queue_size: Files that may wait across all tenants
+            tenant_concurrency: Files one tenant may have screening at once
+            tenant_queue_size: Files one tenant may have waiting (default:
+                half the queue, so one tenant cannot fill it)
+            cache_path: Optional ExtractionCache database shared by the workers
+            artifact_path: Optional precompiled data artifact
+            max_pages: Maximum number of PDF pages to read per file
+            max_chars: Maximum number of characters to extract per file
+            sandbox_limits: Optional (timeout seconds, memory MB) per file
+            result_ttl: Seconds a finished batch stays readable
+            store_path: Optional SQLite profile store screened candidates are saved to
+        """
+        self.lexicon_path = str(lexicon_path)
+        self.roles_path = str(roles_path)
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.tenant_concurrency = max(1, tenant_concurrency)
+        self.tenant_queue_size = tenant_queue_size or max(1, self.queue_size // 2)
+        self.cache_path = str(cache_path) if cache_path else None
+        self.artifact_path = str(artifact_path) if artifact_path else None
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.sandbox_limits = sandbox_limits
+        self.result_ttl = result_ttl
+        self.store_path = str(store_path) if store_path else None
+        
+        self._store = SQLiteProfileStore(self.store_path) if self.store_path else None
+        self._lexicon = load_screening_data(self.lexicon_path, self.roles_path, self.artifact_path).lexicon
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._batches: Dict[str, Batch] = {}
+        # Tenants with queued files, in round-robin order
+        self._queues: "OrderedDict[str, Deque[_Job]]" = OrderedDict()
+        self._queued = 0
+        self._running: Dict[str, int] = {}
+        self._tasks = set()
+        # Moving average of seconds per file, for Retry-After estimates
+        self._file_seconds = 1.0
+    
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(
+                self.lexicon_path,
+                self.roles_path,
+                self.cache_path,
+                metrics.is_enabled(),
+                self.artifact_path,
+                None,
+                None,
+                self.sandbox_limits
+            )
+        )
+    
+    def start(self):
+        """Start the worker pool."""
+        if self._executor is None:
+            self._executor = self._new_executor()
+    
+    async def close(self):
+        """Wait for files already screening, then stop the pool; queued files are dropped."""
+        self._queues.clear()
+        self._queued = 0
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+    
+    async def submit(
+        self,
+        tenant: str,
+        jd_text: str,
+        files: List[Tuple[str, bytes]],
+        extractor: str = DEFAULT_EXTRACTOR
+    ) -> Batch:
+        """
+        Queue a batch of files for screening against a job description.
+        
+        Args:
+            tenant: Tenant submitting the batch
+            jd_text: Job description text
+            files: (filename, file bytes) pairs
+            extractor: Text extractor name (see file_loader.EXTRACTOR_CHOICES)
+            
+        Returns:
+            The queued Batch
+            
+        Raises:
+            QueueFull: If the queue or the tenant's share of it cannot take
+                every file; nothing is queued
+            ValueError: If the batch is empty or the extractor is unknown
+        """
+        if not files:
+            raise ValueError("batch has no files")
+        if extractor not in EXTRACTOR_CHOICES:
+            raise ValueError(f"Unknown extractor {extractor!r}: expected one of {', '.join(EXTRACTOR_CHOICES)}")
+        self._expire()
+        self._check_room(tenant, len(files))
+        
+        jd = await asyncio.get_running_loop().run_in_executor(
+            None, parse_job_description_cached, jd_text, self._lexicon
+        )
+        # Other batches may have been queued while the JD was parsed
+        self._check_room(tenant, len(files))
+        batch = Batch(
+            tenant,
+            [filename for filename, _ in files],
+            (jd["jd_required_skills"], self.max_pages, self.max_chars, False, extractor)
+        )
+        self._batches[batch.batch_id] = batch
+        queue = self._queues.setdefault(tenant, deque())
+        for index, (_, file_bytes) in enumerate(files):
+            queue.append((batch, index, file_bytes))
+        self._queued += len(files)
+        metrics.count("batches_accepted")
+        self._dispatch()
+        return batch
+    
+    def get_batch(self, tenant: str, batch_id: str) -> Optional[Batch]:
+        """A tenant's batch by ID, or None (batches of other tenants are not visible)."""
+        self._expire()
+        batch = self._batches.get(batch_id)
+        return batch if batch is not None and batch.tenant == tenant else None
+    
+    async def iter_results(self, batch: Batch) -> AsyncIterator[dict]:
+        """Yield a batch's results as they arrive, ending when every file is done."""
+        position = 0
+        while True:
+            async with batch.changed:
+                await batch.changed.wait_for(lambda: len(batch.results) > position or batch.done)
+                new = batch.results[position:]
+            for result in new:
+                yield result
+            position += len(new)
+            if batch.done and position == len(batch.results):
+                return
+    
+    def health(self) -> dict:
+        """Queue and worker occupancy, and JD cache counters."""
+        return {
+            "workers": self.workers,
+            "running": sum(self._running.values()),
+            "queued": self._queued,
+            "queue_size": self.queue_size,
+            "tenants": {
+                tenant: {"running": self._running.get(tenant, 0), "queued": len(self._queues.get(tenant, ()))}
+                for tenant in sorted(set(self._running) | set(self._queues))
+            },
+            "batches": len(self._batches),
+            "jd_cache": get_jd_cache().stats()
+        }
+    
+    def _check_room(self, tenant: str, count: int):
+        """Raise QueueFull unless the queue and the tenant's share of it can take count more files."""
+        tenant_queued = len(self._queues.get(tenant, ()))
+        if self._queued + count > self.queue_size:
+            metrics.count("batches_rejected")
+            raise QueueFull(f"queue full ({self._queued}/{self.queue_size} files waiting)", self._retry_after(self._queued))
+        if tenant_queued + count > self.tenant_queue_size:
+            metrics.count("batches_rejected")
+            raise QueueFull(
+                f"tenant queue full ({tenant_queued}/{self.tenant_queue_size} files waiting)",
+                self._retry_after(tenant_queued)
+            )
+    
+    def _retry_after(self, waiting: int) -> int:
+        """Seconds until roughly `waiting` queued files have been screened."""
+        return max(1, math.ceil(waiting * self._file_seconds / self.workers))
+    
+    def _expire(self):
+        """Forget finished batches older than the result TTL."""
+        cutoff = time.time() - self.result_ttl
+        for batch_id in [
+            batch_id for batch_id, batch in self._batches.items()
+            if batch.finished is not None and batch.finished < cutoff
+        ]:
+            del self._batches[batch_id]
+    
+    def _next_job(self) -> Optional[_Job]:
+        """Take the next file from the first tenant in turn that is under its concurrency limit."""
+        for tenant in list(self._queues):
+            if self._running.get(tenant, 0) >= self.tenant_concurrency:
+                continue
+            queue = self._queues.pop(tenant)
+            job = queue.popleft()
+            if queue:
+                # Back of the line, so tenants take turns
+                self._queues[tenant] = queue
+            return job
+        return None
+    
+    def _dispatch(self):
+        """Start queued files while workers are free."""
+        self.start()
+        while sum(self._running.values()) < self.workers:
+            job = self._next_job()
+            if job is None:
+                return
+            batch = job[0]
+            self._queued -= 1
+            self._running[batch.tenant] = self._running.get(batch.tenant, 0) + 1
+            batch.started += 1
+            task = asyncio.get_running_loop().create_task(self._screen(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _screen(self, job: _Job):
+        """Screen one file on the pool and record its result."""
+        batch, index, file_bytes = job
+        filename = batch.filenames[index]
+        executor = self._executor
+        start = time.perf_counter()
+        try:
+            results, worker_metrics = await asyncio.get_running_loop().run_in_executor(
+                executor, screen_chunk, [(index, filename, file_bytes)], *batch.task_args
+            )
+            if worker_metrics:
+                metrics.REGISTRY.merge(worker_metrics)
+            _, profile, error = results[0]
+        except BrokenProcessPool:
+            # A worker died outright; replace the pool (once) so later files still run
+            if self._executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+            profile, error = None, "screening worker died"
+        except Exception as e:
+            profile, error = None, str(e)
+        self._file_seconds = 0.8 * self._file_seconds + 0.2 * (time.perf_counter() - start)
+        
+        result = {"index": index, "filename": filename}
+        if error:
+            batch.counts["failed"] += 1
+            result["error"] = error
+        elif profile is None:
+            batch.counts["empty"] += 1
+            result["profile"] = None
+        elif "duplicate_of" in profile:
+            # Linked to the profile already stored; nothing new to save
+            batch.counts["duplicates"] += 1
+            result["profile"] = profile
+        else:
+            batch.counts["screened"] += 1
+            result["profile"] = profile
+            if self._store is not None:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self._store.save, profile)
+                except Exception as e:
+                    # The result is still returned; only the copy in the store is missing
+                    print(f"Error saving {filename} to the profile store: {e}")
+        
+        async with batch.changed:
+            batch.results.append(result)
+            if batch.done:
+                batch.finished = time.time()
+            batch.changed.notify_all()
+        
+        if batch.done and self._store is not None:
+            # Make the whole batch visible to readers of the store
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._store.flush)
+            except Exception as e:
+                print(f"Error writing batch {batch.batch_id} to the profile store: {e}")
+        
+        self._running[batch.tenant] -= 1
+        if not self._running[batch.tenant]:
+            del self._running[batch.tenant]
+        self._dispatch()
+
+
+async def _read_request(reader: asyncio.StreamReader, max_body: int) -> Tuple[str, str, Dict[str, str], bytes]:
+    """Read one HTTP/1.1 request: (method, target, lower-cased headers, body)."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431, "request headers too large")
+    
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > max_body:
+        raise HTTPError(413, f"request body over {max_body // (1024 * 1024)} MB")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return method.upper(), target, headers, body
+
+
+def _write_head(writer: asyncio.StreamWriter, status: int, headers: Dict[str, str]):
+    lines = [f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}"]
+    lines += [f"{name}: {value}" for name, value in {**headers, "Connection": "close"}.items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+
+def _write_json(writer: asyncio.StreamWriter, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+    body = json.dumps(payload).encode()
+    _write_head(writer, status, {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        **(headers or {})
+    })
+    writer.write(body)
+
+
+def _parse_batch(body: bytes) -> Tuple[str, List[Tuple[str, bytes]], str]:
+    """Validate a submitted batch: (JD text, (filename, bytes) pairs, extractor)."""
+    try:
+        request = json.loads(body)
+        jd_text = request["jd_text"]
+        files = [
+            (str(item["filename"]), base64.b64decode(item["content"], validate=True))
+            for item in request["files"]
+        ]
+        extractor = request.get("extractor", DEFAULT_EXTRACTOR)
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise HTTPError(400, f"invalid batch: {e}")
+    if not isinstance(jd_text, str):
+        raise HTTPError(400, "invalid batch: jd_text must be a string")
+    return jd_text, files, extractor
+
+
+async def _handle(service: ScreeningService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_body: int):
+    """Serve one request on a connection."""
+    method, target, headers, body = await _read_request(reader, max_body)
+    path = urlsplit(target).path.rstrip("/") or "/"
+    tenant = headers.get("x-tenant") or DEFAULT_TENANT
+    parts = path.strip("/").split("/")
+    
+    if path == "/health" and method == "GET":
+        _write_json(writer, 200, service.health())
+    elif path == "/metrics" and method == "GET":
+        text = metrics.REGISTRY.to_prometheus().encode()
+        _write_head(writer, 200, {"Content-Type": "text/plain; version=0.0.4", "Content-Length": str(len(text))})
+        writer.write(text)
+    elif path == "/batches":
+        if method != "POST":
+            raise HTTPError(405, "use POST to submit a batch", {"Allow": "POST"})
+        jd_text, files, extractor = _parse_batch(body)
+        try:
+            batch = await service.submit(tenant, jd_text, files, extractor)
+        except QueueFull as e:
+            raise HTTPError(429, str(e), {"Retry-After": str(e.retry_after)})
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        _write_json(writer, 202, batch.status(), {"Location": f"/batches/{batch.batch_id}"})
+    elif parts[0] == "batches" and len(parts) in (2, 3):
+        if method != "GET":
+            raise HTTPError(405, "use GET to read a batch", {"Allow": "GET"})
+        batch = service.get_batch(tenant, parts[1])
+        if batch is None or (len(parts) == 3 and parts[2] != "results"):
+            raise HTTPError(404, "no such batch")
+        if len(parts) == 2:
+            _write_json(writer, 200, batch.status())
+            return
+        # One JSON line per file as it finishes, so clients see progress
+        _write_head(writer, 200, {"Content-Type": "application/x-ndjson", "Transfer-Encoding": "chunked"})
+        async for result in service.iter_results(batch):
+            line = (json.dumps(result) + "\n").encode()
+            writer.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+    else:
+        raise HTTPError(404, "not found")
+
+
+async def serve(service: ScreeningService, host: str = "127.0.0.1", port: int = DEFAULT_PORT, max_request_mb: int = DEFAULT_MAX_REQUEST_MB, ready=None):
+    """
+    Run the HTTP service until cancelled.
+    
+    Args:
+        service: ScreeningService handling the batches
+        host: Interface to listen on
+        port: TCP port (0 picks a free one)
+        max_request_mb: Largest accepted request body
+        ready: Optional callable given the bound (host, port) once listening
+    """
+    max_body = max_request_mb * 1024 * 1024
+    
+    async def on_connection(reader, writer):
+        try:
+            await _handle(service, reader, writer, max_body)
+        except HTTPError as e:
+            _write_json(writer, e.status, {"error": str(e)}, e.headers)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            print(f"Error handling request: {e}")
+            _write_json(writer, 500, {"error": "internal error"})
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+    
+    service.start()
+    server = await asyncio.start_server(on_connection, host, port, limit=_MAX_HEADER_BYTES)
+    try:
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[:2])
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
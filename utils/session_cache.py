@@ -0,0 +1,124 @@
+"""
+Per-session memo of screening stages for incremental re-runs.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from .extraction_cache import file_cache_key
+from .file_loader import DEFAULT_EXTRACTOR
+from .jd_cache import parse_job_description_cached
+from .skill_extractor import CompiledLexicon
+
+
+class ScreeningSession:
+    """
+    Remembers extraction results and the parsed JD between screening runs.
+    
+    Extractions are keyed by upload content hash, extraction budgets and
+    extractor, and lexicon fingerprint, so editing the JD only re-runs scoring, a new
+    lexicon re-extracts skills and only added or changed files are parsed.
+    """
+    
+    def __init__(self):
+        self._extractions: Dict[Tuple[str, str], dict] = {}
+        self._jd_key: Optional[Tuple[str, str]] = None
+        self._jd_data: Optional[dict] = None
+        self.last_run: Optional[dict] = None
+    
+    @staticmethod
+    def file_key(
+        file_bytes: bytes,
+        lexicon: CompiledLexicon,
+        max_pages: Optional[int],
+        max_chars: Optional[int],
+        extractor: str = DEFAULT_EXTRACTOR
+    ) -> Tuple[str, str]:
+        """
+        Key of an uploaded file's extraction result.
+        
+        Args:
+            file_bytes: Raw content of the uploaded file
+            lexicon: Compiled lexicon used for skill matching
+            max_pages: Maximum number of PDF pages read
+            max_chars: Maximum number of characters extracted
+            extractor: Text extractor used
+            
+        Returns:
+            Hashable key for get_extraction / put_extraction
+        """
+        return file_cache_key(file_bytes, max_pages, max_chars, extractor), lexicon.fingerprint
+    
+    def get_extraction(self, key: Tuple[str, str]) -> Optional[dict]:
+        """Extraction summary for a file key, or None if not extracted yet."""
+        return self._extractions.get(key)
+    
+    def put_extraction(self, key: Tuple[str, str], extraction: dict):
+        """Remember the extraction summary of a file key."""
+        self._extractions[key] = extraction
+    
+    def parse_jd(self, jd_text: str, lexicon: CompiledLexicon) -> Tuple[dict, bool]:
+        """
+        Parse a job description, reusing the previous parse if unchanged.
+        
+        A JD new to this session still goes through the process-wide JD
+        cache, so a template parsed in another session is not parsed again.
+        
+        Args:
+            jd_text: Job description text
+            lexicon: Compiled lexicon to match against
+            
+        Returns:
+            Tuple of (parsed JD, whether the previous parse was reused)
+        """
+        key = (jd_text, lexicon.fingerprint)
+        if key == self._jd_key:
+            return self._jd_data, True
+        
+        self._jd_data = parse_job_description_cached(jd_text, lexicon)
+        self._jd_key = key
+        return self._jd_data, False
+    
+    def changes(self, jd_text: str, lexicon: CompiledLexicon, file_keys: List[Tuple[str, str]]) -> dict:
+        """
+        Compare a run's inputs with the previous run.
+        
+        Args:
+            jd_text: Job description text
+            lexicon: Compiled lexicon
+            file_keys: Keys of the uploaded files
+            
+        Returns:
+            Dictionary with first_run, jd_changed, lexicon_changed,
+            files_added and files_removed
+        """
+        if self.last_run is None:
+            return {
+                "first_run": True,
+                "jd_changed": True,
+                "lexicon_changed": True,
+                "files_added": len(set(file_keys)),
+                "files_removed": 0
+            }
+        
+        # Compare content keys only; a lexicon change is reported separately
+        previous = {content_key for content_key, _ in self.last_run["files"]}
+        current = {content_key for content_key, _ in file_keys}
+        return {
+            "first_run": False,
+            "jd_changed": jd_text != self.last_run["jd_text"],
+            "lexicon_changed": lexicon.fingerprint != self.last_run["lexicon"],
+            "files_added": len(current - previous),
+            "files_removed": len(previous - current)
+        }
+    
+    def finish_run(self, jd_text: str, lexicon: CompiledLexicon, file_keys: List[Tuple[str, str]]):
+        """
+        Record a completed run and forget extractions of files no longer uploaded.
+        
+        Args:
+            jd_text: Job description text
+            lexicon: Compiled lexicon
+            file_keys: Keys of the uploaded files
+        """
+        current = set(file_keys)
+        self._extractions = {key: value for key, value in self._extractions.items() if key in current}
+        self.last_run = {"jd_text": jd_text, "lexicon": lexicon.fingerprint, "files": list(file_keys)}
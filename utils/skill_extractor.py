@@ -1,17 +1,228 @@
 """
 Skill extractor utility using dictionary matching.
 """
-from typing import List, Set
+from functools import lru_cache
+from typing import Iterable, List, Set, Union
+import hashlib
+import json
 import re
 
 
-def extract_skills(text: str, skills_lexicon: List[str]) -> List[str]:
+# Splits text into word runs, whitespace runs and single symbol characters.
+# Concatenating the tokens gives back the original text exactly.
+_TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+_WORD_PATTERN = re.compile(r"\w")
+
+# Trie key marking the end of a skill; never produced by the tokenizer
+_TERMINAL = ""
+
+
+def _is_word_token(token: str) -> bool:
+    return _WORD_PATTERN.match(token) is not None
+
+
+class CompiledLexicon:
+    """
+    Skills lexicon compiled into a token trie for single-pass matching.
+    
+    Text is tokenized once and the trie is walked from each token, so the
+    cost grows with the length of the text rather than the lexicon size.
+    A skill matches when it is not directly preceded or followed by a word
+    character, which keeps whole-word semantics for plain skills and also
+    handles symbol-edged skills such as "C++" and "C#".
+    """
+    
+    def __init__(self, skills_lexicon: List[str]):
+        self.skills = list(skills_lexicon)
+        self.max_tokens = 0
+        self._trie = {}
+        self._fingerprint = None
+        
+        for skill in self.skills:
+            tokens = _TOKEN_PATTERN.findall(skill.lower())
+            if not tokens:
+                continue
+            
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node.setdefault(_TERMINAL, []).append(skill)
+            self.max_tokens = max(self.max_tokens, len(tokens))
+    
+    @classmethod
+    def from_file(cls, lexicon_path: str) -> "CompiledLexicon":
+        """
+        Build a compiled lexicon from a skills_lexicon.json file.
+        
+        Args:
+            lexicon_path: Path to the lexicon JSON file
+            
+        Returns:
+            CompiledLexicon instance
+        """
+        with open(lexicon_path, 'r') as f:
+            data = json.load(f)
+        return cls(data.get("skills", []))
+    
+    def __len__(self) -> int:
+        return len(self.skills)
+    
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the lexicon contents, used to key cached skill lists."""
+        if self._fingerprint is None:
+            payload = json.dumps(self.skills, ensure_ascii=False).encode("utf-8")
+            self._fingerprint = hashlib.sha256(payload).hexdigest()[:16]
+        return self._fingerprint
+    
+    def find(self, text: str) -> List[str]:
+        """
+        Find all lexicon skills present in text.
+        
+        Args:
+            text: Input text (resume or job description)
+            
+        Returns:
+            Sorted list of unique matched skills (original case from lexicon)
+        """
+        if not text:
+            return []
+        
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        matched_skills = set()
+        self._match_tokens(tokens, 0, len(tokens), matched_skills)
+        return sorted(matched_skills)
+    
+    def find_stream(self, chunks: Iterable[str]) -> List[str]:
+        """
+        Find all lexicon skills in text delivered as a sequence of chunks.
+        
+        Gives the same result as find("".join(chunks)) without holding the
+        whole text in memory.
+        
+        Args:
+            chunks: Iterable of text pieces, e.g. pages of a document
+            
+        Returns:
+            Sorted list of unique matched skills (original case from lexicon)
+        """
+        matcher = self.stream()
+        for chunk in chunks:
+            matcher.feed(chunk)
+        return matcher.finish()
+    
+    def stream(self) -> "SkillStream":
+        """Create an incremental matcher over this lexicon."""
+        return SkillStream(self)
+    
+    def _match_tokens(self, tokens: List[str], start: int, stop: int, matched_skills: Set[str]):
+        """Add skills whose match begins at a token index in [start, stop)."""
+        trie = self._trie
+        n = len(tokens)
+        
+        for i in range(start, stop):
+            node = trie.get(tokens[i])
+            if node is None:
+                continue
+            
+            # A skill starting with a symbol must not follow a word
+            if i > 0 and not _is_word_token(tokens[i]) and _is_word_token(tokens[i - 1]):
+                continue
+            
+            j = i
+            while True:
+                terminal = node.get(_TERMINAL)
+                # A skill ending with a symbol must not be followed by a word
+                if terminal and (j + 1 == n or not _is_word_token(tokens[j + 1])):
+                    matched_skills.update(terminal)
+                
+                j += 1
+                if j == n:
+                    break
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+
+
+class SkillStream:
+    """
+    Incremental skill matcher that carries match state across chunks.
+    
+    Only the tokens that could still belong to an undecided match are kept
+    between feed() calls: at most the lexicon's longest skill plus one
+    token of context on each side.
+    """
+    
+    def __init__(self, lexicon: CompiledLexicon):
+        self._lexicon = lexicon
+        self._pending = ""
+        # Tokens at the start of _pending kept only as left context
+        self._context_tokens = 0
+        self._matched_skills = set()
+    
+    def feed(self, chunk: str):
+        """
+        Add the next piece of text.
+        
+        Args:
+            chunk: Text continuing directly after the previous chunk
+        """
+        if not chunk:
+            return
+        
+        tokens = _TOKEN_PATTERN.findall(self._pending + chunk.lower())
+        # The last token may continue in the next chunk, and a match starting
+        # at i needs tokens up to i + max_tokens to be final
+        stop = len(tokens) - 1 - self._lexicon.max_tokens
+        if stop <= self._context_tokens:
+            self._pending += chunk.lower()
+            return
+        
+        self._lexicon._match_tokens(tokens, self._context_tokens, stop, self._matched_skills)
+        self._pending = "".join(tokens[stop - 1:])
+        self._context_tokens = 1
+    
+    def finish(self) -> List[str]:
+        """
+        Match the remaining text at end of input.
+        
+        Returns:
+            Sorted list of unique matched skills (original case from lexicon)
+        """
+        tokens = _TOKEN_PATTERN.findall(self._pending)
+        self._lexicon._match_tokens(tokens, self._context_tokens, len(tokens), self._matched_skills)
+        self._pending = ""
+        self._context_tokens = 0
+        return sorted(self._matched_skills)
+
+
+@lru_cache(maxsize=8)
+def _compile_lexicon(skills: tuple) -> CompiledLexicon:
+    return CompiledLexicon(list(skills))
+
+
+def compile_lexicon(skills_lexicon: Union[List[str], CompiledLexicon]) -> CompiledLexicon:
+    """
+    Get a CompiledLexicon for a skills list, reusing recent compilations.
+    
+    Args:
+        skills_lexicon: List of skills or an already compiled lexicon
+        
+    Returns:
+        CompiledLexicon instance
+    """
+    if isinstance(skills_lexicon, CompiledLexicon):
+        return skills_lexicon
+    return _compile_lexicon(tuple(skills_lexicon))
+
+
+def extract_skills(text: str, skills_lexicon: Union[List[str], CompiledLexicon]) -> List[str]:
     """
     Extract skills from text using case-insensitive dictionary matching.
     
     Args:
         text: Input text (resume or job description)
-        skills_lexicon: List of skills to match against
+        skills_lexicon: List of skills or a CompiledLexicon to match against
         
     Returns:
         List of unique matched skills
@@ -19,24 +230,7 @@ def extract_skills(text: str, skills_lexicon: List[str]) -> List[str]:
     if not text or not skills_lexicon:
         return []
     
-    # Convert text to lowercase for case-insensitive matching
-    text_lower = text.lower()
-    
-    # Set to store unique matched skills
-    matched_skills = set()
-    
-    for skill in skills_lexicon:
-        skill_lower = skill.lower()
-        
-        # Create a regex pattern for word boundary matching
-        # This ensures we match whole words/phrases, not substrings
-        pattern = r'\b' + re.escape(skill_lower) + r'\b'
-        
-        if re.search(pattern, text_lower):
-            matched_skills.add(skill)  # Add original case from lexicon
-    
-    # Return sorted list for consistency
-    return sorted(list(matched_skills))
+    return compile_lexicon(skills_lexicon).find(text)
 
 
 def get_skill_match_count(resume_skills: List[str], target_skills: List[str]) -> int: